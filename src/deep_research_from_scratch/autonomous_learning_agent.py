@@ -20,6 +20,7 @@ from deep_research_from_scratch.prompts import final_report_generation_prompt
 from deep_research_from_scratch.state_scope import AgentState, AgentInputState
 from deep_research_from_scratch.research_agent_scope import clarify_with_user, write_research_brief
 from deep_research_from_scratch.multi_agent_supervisor import supervisor_agent
+from deep_research_from_scratch.report_store import get_report_store
 
 # ===== Config =====
 
@@ -48,6 +49,7 @@ async def final_report_generation(state: AgentState):
     )
 
     final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+    await get_report_store().asave(final_report.content, brief=state.get("research_brief") or "")
 
     return {
         "final_report": final_report.content, 
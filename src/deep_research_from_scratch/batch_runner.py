@@ -0,0 +1,233 @@
+"""Batch Research Job Runner.
+
+This module runs many research briefs through the full deep research workflow
+concurrently. Briefs are read from a JSONL file, executed under a global
+concurrency cap, and each finished job is appended to a JSONL results file
+together with per-job metrics.
+
+Key features:
+- Global concurrency cap across all jobs in the batch
+- Shared LLM response cache (SQLite-backed) so jobs reuse each other's
+  search summaries and model calls, including across a resumed batch
+- Optional shared rate limiter attached to every model in the workflow
+- Resumable: jobs already recorded in the results file are skipped, failed
+  jobs are retried
+
+Usage:
+    python -m deep_research_from_scratch.batch_runner briefs.jsonl results.jsonl --max-concurrency 4
+
+Each input line is a JSON object with a "brief" field and an optional "id".
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from langchain_community.cache import SQLiteCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.messages import HumanMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from typing_extensions import List, Set
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+
+# Default number of research jobs that run at the same time
+default_max_concurrency = 4
+
+# Default location of the shared LLM response cache
+default_cache_path = ".batch_llm_cache.sqlite"
+
+# ===== JOB I/O =====
+
+def get_job_id(job: dict) -> str:
+    """Return the job id, deriving a stable one from the brief if none is given."""
+    if job.get("id"):
+        return str(job["id"])
+    return hashlib.sha1(job["brief"].strip().encode("utf-8")).hexdigest()[:12]
+
+def load_jobs(input_path: Path) -> List[dict]:
+    """Load research jobs from a JSONL file.
+
+    Args:
+        input_path: Path to a JSONL file with one {"id", "brief"} object per line
+
+    Returns:
+        List of job dictionaries, each with an "id" and a "brief"
+    """
+    jobs = []
+    with open(input_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            if not job.get("brief"):
+                raise ValueError(f"Line {line_number} of {input_path} has no 'brief'")
+            jobs.append({"id": get_job_id(job), "brief": job["brief"]})
+    return jobs
+
+def load_finished_job_ids(output_path: Path) -> Set[str]:
+    """Read the ids of jobs that finished in a previous run of the batch.
+
+    Failed jobs are not considered finished, so they are retried on resume.
+    """
+    finished = set()
+    if not output_path.exists():
+        return finished
+
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partially written line from a crashed run
+            if record.get("status") in ("completed", "needs_clarification"):
+                finished.add(record["id"])
+    return finished
+
+# ===== SHARED RESOURCES =====
+
+def configure_shared_resources(cache_path: str | None, requests_per_second: float | None) -> None:
+    """Set up the LLM cache and rate limiter shared by every job in the batch.
+
+    The LLM cache is process-wide, so all jobs (and all researchers within a
+    job) hit the same cache. The rate limiter is attached to the module-level
+    models used by the workflow, which every job shares.
+
+    Args:
+        cache_path: SQLite file for the LLM cache, or None to disable caching
+        requests_per_second: Model request rate across the batch, or None for no limit
+    """
+    if cache_path:
+        set_llm_cache(SQLiteCache(database_path=cache_path))
+
+    if requests_per_second:
+        from deep_research_from_scratch import (
+            deep_research_agent,
+            multi_agent_supervisor,
+            research_agent,
+            research_agent_scope,
+            utils,
+        )
+
+        rate_limiter = InMemoryRateLimiter(requests_per_second=requests_per_second)
+        for model in (
+            research_agent_scope.model,
+            multi_agent_supervisor.supervisor_model,
+            research_agent.model,
+            research_agent.compress_model,
+            utils.summarization_model,
+            deep_research_agent.writer_model,
+        ):
+            model.rate_limiter = rate_limiter
+
+# ===== BATCH EXECUTION =====
+
+async def run_job(job: dict) -> dict:
+    """Run a single research brief through the full workflow.
+
+    Args:
+        job: Job dictionary with "id" and "brief"
+
+    Returns:
+        Result record with the final report and per-job metrics
+    """
+    from deep_research_from_scratch.deep_research_agent import deep_researcher
+
+    start = time.monotonic()
+    try:
+        result = await deep_researcher.ainvoke({"messages": [HumanMessage(content=job["brief"])]})
+    except Exception as e:
+        return {
+            "id": job["id"],
+            "status": "failed",
+            "error": f"{type(e).__name__}: {e}",
+            "metrics": {"duration_seconds": round(time.monotonic() - start, 2)},
+        }
+
+    final_report = result.get("final_report", "")
+    novelty_metrics = result.get("novelty_metrics", [])
+
+    return {
+        "id": job["id"],
+        # Without a report the scoping step stopped to ask a clarifying question
+        "status": "completed" if final_report else "needs_clarification",
+        "research_brief": result.get("research_brief"),
+        "final_report": final_report,
+        "clarification": "" if final_report else str(result["messages"][-1].content),
+        "metrics": {
+            "duration_seconds": round(time.monotonic() - start, 2),
+            "report_chars": len(final_report),
+            "notes": len(result.get("notes", [])),
+            "raw_notes": len(result.get("raw_notes", [])),
+            "novelty_stops": sum(1 for metric in novelty_metrics if metric["stop"]),
+        },
+    }
+
+async def run_batch(
+    input_path: Path,
+    output_path: Path,
+    max_concurrency: int = default_max_concurrency,
+) -> List[dict]:
+    """Run all pending jobs from a JSONL file and append results as they finish.
+
+    Args:
+        input_path: JSONL file of research briefs
+        output_path: JSONL file that receives one result record per job
+        max_concurrency: Maximum number of jobs running at the same time
+
+    Returns:
+        Result records for the jobs executed in this run
+    """
+    jobs = load_jobs(input_path)
+    finished = load_finished_job_ids(output_path)
+    pending = [job for job in jobs if job["id"] not in finished]
+    logger.info("Batch: %d jobs, %d already finished, %d to run", len(jobs), len(finished), len(pending))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    write_lock = asyncio.Lock()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def run_and_record(job: dict) -> dict:
+        async with semaphore:
+            record = await run_job(job)
+
+        # Append and fsync each record so a crash never loses finished jobs
+        async with write_lock:
+            with open(output_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        logger.info("Job %s: %s (%ss)", record["id"], record["status"], record["metrics"]["duration_seconds"])
+        return record
+
+    return await asyncio.gather(*(run_and_record(job) for job in pending))
+
+# ===== ENTRY POINT =====
+
+def main(argv: List[str] | None = None) -> None:
+    """Command-line entry point for batch research runs."""
+    parser = argparse.ArgumentParser(description="Run a batch of research briefs concurrently.")
+    parser.add_argument("input", type=Path, help="JSONL file with one {\"id\", \"brief\"} object per line")
+    parser.add_argument("output", type=Path, help="JSONL file to append results and metrics to")
+    parser.add_argument("--max-concurrency", type=int, default=default_max_concurrency,
+                        help="Maximum number of jobs running at the same time")
+    parser.add_argument("--cache-path", default=default_cache_path,
+                        help="SQLite file for the shared LLM cache (use '' to disable)")
+    parser.add_argument("--requests-per-second", type=float, default=None,
+                        help="Shared model request rate limit across all jobs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    configure_shared_resources(args.cache_path or None, args.requests_per_second)
+    asyncio.run(run_batch(args.input, args.output, args.max_concurrency))
+
+if __name__ == "__main__":
+    main()
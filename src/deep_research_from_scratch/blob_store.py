@@ -0,0 +1,251 @@
+"""Content-Addressed Blob Store for Large State Payloads.
+
+This module keeps large string payloads (such as raw research notes) out of the
+graph state. Payloads are written once to local disk under their SHA-256 digest,
+optionally zlib-compressed, and the state only carries a short reference string.
+
+Because blobs are content-addressed, identical payloads are stored once and
+every write is idempotent, which keeps checkpoint writes small regardless of
+how much research a run performs.
+
+The shared store lives in the local data directory (see data_dir.py) and is
+garbage-collected: blobs that were not written or read for a while, and the
+least recently used blobs beyond a size limit, are deleted periodically.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+from typing_extensions import List
+
+from deep_research_from_scratch.data_dir import get_data_dir
+
+# ===== CONFIGURATION =====
+
+# Prefix that marks a state value as a reference into the blob store
+BLOB_REF_PREFIX = "blob:sha256:"
+
+# Payloads shorter than this (in characters) are kept inline in the state
+min_blob_size = 2048
+
+# Compress blobs on disk with zlib (level 6 is a good speed/size trade-off)
+compress_blobs = True
+compression_level = 6
+
+# Garbage collection of the shared store (None disables a limit): blobs unused
+# for longer than the age limit are deleted, then the least recently used ones
+# while the store is over the size limit. Collection runs on the first write
+# and then once every gc_interval_puts writes.
+max_blob_age_days: float | None = 7
+max_blob_store_bytes: int | None = 1024 ** 3
+gc_interval_puts = 200
+
+# ===== BLOB STORE =====
+
+class BlobStore:
+    """Content-addressed store that persists string payloads on local disk.
+
+    Blobs are sharded into sub-directories by the first two hex characters of
+    their digest, and written atomically via a temporary file and rename so a
+    crashed run never leaves a partially written blob behind. A blob's
+    modification time records its last use (every put and get refreshes it),
+    which is what garbage collection goes by.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        compress: bool = True,
+        level: int = 6,
+        max_age_days: float | None = None,
+        max_total_bytes: int | None = None,
+    ):
+        """Open a store rooted at a directory (created on first write).
+
+        Args:
+            root: Directory holding the blobs
+            compress: Whether to zlib-compress new blobs
+            level: zlib compression level
+            max_age_days: Collect blobs unused for longer than this (None keeps them)
+            max_total_bytes: Collect least recently used blobs beyond this size (None keeps them)
+        """
+        self.root = Path(root)
+        self.compress = compress
+        self.level = level
+        self.max_age_days = max_age_days
+        self.max_total_bytes = max_total_bytes
+        self._puts_until_gc = 0
+
+    def _path_for(self, digest: str) -> Path:
+        """Return the on-disk path for a digest."""
+        return self.root / digest[:2] / digest
+
+    def put(self, content: str) -> str:
+        """Store a payload and return its blob reference.
+
+        Args:
+            content: Text payload to store
+
+        Returns:
+            Reference string of the form ``blob:sha256:<digest>``
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path_for(digest)
+
+        # Content addressing makes writes idempotent - skip existing blobs
+        if path.exists():
+            self._touch(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = zlib.compress(data, self.level) if self.compress else data
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        if self.max_age_days is not None or self.max_total_bytes is not None:
+            self._puts_until_gc -= 1
+            if self._puts_until_gc < 0:
+                self._puts_until_gc = gc_interval_puts - 1
+                self.collect_garbage()
+
+        return BLOB_REF_PREFIX + digest
+
+    def get(self, ref: str) -> str:
+        """Load the payload behind a blob reference.
+
+        Args:
+            ref: Reference returned by ``put``
+
+        Returns:
+            The original text payload
+
+        Raises:
+            KeyError: If the blob does not exist in this store
+        """
+        digest = ref[len(BLOB_REF_PREFIX):] if is_blob_ref(ref) else ref
+        path = self._path_for(digest)
+        if not path.exists():
+            raise KeyError(f"Blob not found: {ref}")
+
+        payload = path.read_bytes()
+        self._touch(path)
+        # Blobs may have been written with compression toggled either way
+        try:
+            data = zlib.decompress(payload)
+        except zlib.error:
+            data = payload
+        return data.decode("utf-8")
+
+    def delete(self, ref: str) -> None:
+        """Remove a blob from the store if it exists."""
+        digest = ref[len(BLOB_REF_PREFIX):] if is_blob_ref(ref) else ref
+        path = self._path_for(digest)
+        if path.exists():
+            path.unlink()
+
+    def collect_garbage(self) -> int:
+        """Delete blobs beyond the store's age and size limits.
+
+        Blobs are visited from least to most recently used. A blob used again
+        after the scan started is kept.
+
+        Returns:
+            Number of deleted blobs
+        """
+        scan_started = time.time()
+        blobs = []
+        for path in self.root.glob("??/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        blobs.sort()
+
+        cutoff = scan_started - self.max_age_days * 86400 if self.max_age_days is not None else None
+        total = sum(size for _, size, _ in blobs)
+        deleted = 0
+        for mtime, size, path in blobs:
+            expired = cutoff is not None and mtime < cutoff
+            oversized = self.max_total_bytes is not None and total > self.max_total_bytes
+            if not (expired or oversized):
+                break
+            try:
+                if path.stat().st_mtime > mtime:
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            deleted += 1
+        return deleted
+
+    def _touch(self, path: Path) -> None:
+        """Mark a blob as just used, so garbage collection keeps it."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+# ===== MODULE-LEVEL HELPERS =====
+
+_store: BlobStore | None = None
+
+def get_blob_store() -> BlobStore:
+    """Get or initialize the shared blob store lazily.
+
+    The storage directory defaults to ``blobs`` in the data directory and can be
+    overridden with the ``DEEP_RESEARCH_BLOB_DIR`` environment variable. The
+    shared store is garbage-collected with the configured limits.
+    """
+    global _store
+    if _store is None:
+        root = os.environ.get("DEEP_RESEARCH_BLOB_DIR") or str(get_data_dir() / "blobs")
+        _store = BlobStore(
+            Path(root),
+            compress=compress_blobs,
+            level=compression_level,
+            max_age_days=max_blob_age_days,
+            max_total_bytes=max_blob_store_bytes,
+        )
+    return _store
+
+def is_blob_ref(value: str) -> bool:
+    """Check whether a state value is a blob reference."""
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+def offload_text(content: str) -> str:
+    """Move a large payload into the blob store, keeping small ones inline.
+
+    Args:
+        content: Text payload destined for the graph state
+
+    Returns:
+        A blob reference for large payloads, or the payload itself
+    """
+    if len(content) < min_blob_size:
+        return content
+    return get_blob_store().put(content)
+
+def load_text(value: str) -> str:
+    """Resolve a state value that may be a blob reference back to its text."""
+    if is_blob_ref(value):
+        return get_blob_store().get(value)
+    return value
+
+def load_texts(values: List[str]) -> List[str]:
+    """Resolve a list of state values (e.g. ``raw_notes``) back to their text."""
+    return [load_text(value) for value in values]
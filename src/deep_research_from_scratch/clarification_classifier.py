@@ -0,0 +1,334 @@
+"""Local Pre-Classifier for the Clarification Decision.
+
+This module decides, without a model call, whether a scoping conversation is
+clearly specified well enough to start research. It sits in front of
+clarify_with_user: when it is confident that no clarification is needed, the
+clarification call is skipped; otherwise the model decides as before.
+
+The classifier is a logistic regression over a hashed bag of words (unigrams
+and bigrams of the latest user message) plus a handful of heuristic features,
+such as whether the user is answering a clarifying question, the request
+length, and unexplained acronyms. The heuristic features come with prior
+weights, so the classifier is useful before it has seen any data; every model
+decision is logged, and the weights can be retrained from that log:
+
+    python -m deep_research_from_scratch.clarification_classifier train
+
+Weights are stored as JSON; the classifier is pure Python. The weights and
+the decision log live in a data directory outside the package (by default
+``~/.deep_research``, overridable with ``DEEP_RESEARCH_DATA_DIR``).
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from typing_extensions import Dict, List, Sequence
+
+from deep_research_from_scratch.data_dir import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+
+# Number of hashed feature buckets for the bag of words
+feature_buckets = 2 ** 18
+
+# Skip the model call only when the probability that clarification is needed is below this
+max_skip_probability = 0.1
+
+# Weights and decision log file names inside the data directory (see data_dir.py)
+weights_file_name = "clarification_classifier.json"
+log_file_name = "clarification_decisions.jsonl"
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9']+")
+ACRONYM_PATTERN = re.compile(r"\b[A-Z][A-Z0-9]{1,5}s?\b")
+
+# Marker set on the clarifying question a scoping node ends on, so the
+# classifier can tell an answer to it from a new request in the same thread
+CLARIFYING_QUESTION_KEY = "clarifying_question"
+
+# Acronyms common enough not to need explaining
+KNOWN_ACRONYMS = frozenset("""
+AI API CEO CPU EU GDP GPU HTML HTTP IT LLM ML NASA NYC PC PDF SF SQL UK UN US USA USD UI UX
+""".split())
+
+# Prior weights of the heuristic features, used until weights are trained.
+# Positive weights push towards asking a clarifying question.
+PRIOR_WEIGHTS: Dict[str, float] = {
+    "__bias__": 0.5,
+    "__answers_question__": -4.0,
+    "__words_lt_8__": 1.5,
+    "__words_8_25__": 0.0,
+    "__words_25_60__": -1.5,
+    "__words_ge_60__": -3.0,
+    "__unknown_acronym__": 2.0,
+    "__has_constraints__": -1.0,
+}
+
+# Words that signal the user already stated scope or constraints
+CONSTRAINT_WORDS = frozenset("""
+compare comparison between versus vs budget price cost within under over since before after
+focus focusing including include exclude only must should format table list report
+""".split())
+
+# ===== FEATURES =====
+
+def latest_user_text(messages: Sequence[BaseMessage]) -> str:
+    """Return the content of the latest user message."""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return str(message.content)
+    return ""
+
+def clarifying_question_message(question: str) -> AIMessage:
+    """Build the message a scoping node ends on when it asks a clarifying question."""
+    return AIMessage(content=question, additional_kwargs={CLARIFYING_QUESTION_KEY: True})
+
+def answers_clarifying_question(messages: Sequence[BaseMessage]) -> bool:
+    """Check whether the latest user message replies to a clarifying question.
+
+    Only the message directly before the reply counts, and only if it is a
+    marked clarifying question: after a finished run the nearest AI message is
+    the verification or the report, which may contain a "?" of its own.
+    """
+    if len(messages) < 2:
+        return False
+    previous = messages[-2]
+    return isinstance(previous, AIMessage) and bool(previous.additional_kwargs.get(CLARIFYING_QUESTION_KEY))
+
+def extract_features(messages: Sequence[BaseMessage]) -> List[str]:
+    """Turn a scoping conversation into named features.
+
+    Args:
+        messages: Conversation so far, ending with the user's latest message
+
+    Returns:
+        List of feature names (heuristic features and word/bigram features)
+    """
+    text = latest_user_text(messages)
+    tokens = [token.lower() for token in TOKEN_PATTERN.findall(text)]
+    word_count = len(tokens)
+
+    features = ["__bias__"]
+    if messages and isinstance(messages[-1], HumanMessage) and answers_clarifying_question(messages):
+        features.append("__answers_question__")
+
+    if word_count < 8:
+        features.append("__words_lt_8__")
+    elif word_count < 25:
+        features.append("__words_8_25__")
+    elif word_count < 60:
+        features.append("__words_25_60__")
+    else:
+        features.append("__words_ge_60__")
+
+    acronyms = {match.rstrip("s") for match in ACRONYM_PATTERN.findall(text)}
+    if acronyms - KNOWN_ACRONYMS:
+        features.append("__unknown_acronym__")
+    if CONSTRAINT_WORDS & set(tokens):
+        features.append("__has_constraints__")
+
+    features.extend(f"w:{token}" for token in tokens)
+    features.extend(f"b:{first}_{second}" for first, second in zip(tokens, tokens[1:]))
+    return features
+
+def hash_feature(feature: str) -> int:
+    """Map a feature name to its bucket."""
+    digest = hashlib.md5(feature.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little") % feature_buckets
+
+def vectorize(features: List[str]) -> Dict[int, float]:
+    """Turn feature names into a sparse, length-normalized hashed vector.
+
+    Heuristic features keep weight 1; word and bigram features are scaled so
+    long messages do not dominate the score.
+    """
+    lexical = [feature for feature in features if not feature.startswith("__")]
+    scale = 1.0 / math.sqrt(len(lexical)) if lexical else 0.0
+
+    vector: Dict[int, float] = {}
+    for feature in features:
+        value = 1.0 if feature.startswith("__") else scale
+        bucket = hash_feature(feature)
+        vector[bucket] = vector.get(bucket, 0.0) + value
+    return vector
+
+def sigmoid(value: float) -> float:
+    """Numerically stable logistic function."""
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp_value = math.exp(value)
+    return exp_value / (1.0 + exp_value)
+
+# ===== CLASSIFIER =====
+
+class ClarificationClassifier:
+    """Logistic regression over hashed lexical and heuristic features."""
+
+    def __init__(self, weights: Dict[int, float] | None = None):
+        """Create a classifier from hashed-bucket weights, or from the prior weights."""
+        if weights is None:
+            weights = {hash_feature(name): weight for name, weight in PRIOR_WEIGHTS.items()}
+        self.weights = weights
+
+    def predict(self, messages: Sequence[BaseMessage]) -> float:
+        """Return the probability that the conversation needs a clarifying question."""
+        return self.predict_features(extract_features(messages))
+
+    def predict_features(self, features: List[str]) -> float:
+        """Return the probability that clarification is needed for extracted features."""
+        vector = vectorize(features)
+        return sigmoid(sum(self.weights.get(bucket, 0.0) * value for bucket, value in vector.items()))
+
+    def confident_no_clarification(self, messages: Sequence[BaseMessage]) -> bool:
+        """Check whether the model call can be skipped because research can start."""
+        return self.predict(messages) < max_skip_probability
+
+    def train(self, examples: List[tuple], epochs: int = 10, learning_rate: float = 0.5, l2: float = 1e-4) -> None:
+        """Fit the weights with stochastic gradient descent, starting from the current weights.
+
+        Args:
+            examples: List of (feature names, need_clarification) pairs
+            epochs: Number of passes over the examples
+            learning_rate: SGD step size
+            l2: L2 regularization strength
+        """
+        vectors = [(vectorize(features), 1.0 if label else 0.0) for features, label in examples]
+        rng = random.Random(0)
+        for _ in range(epochs):
+            rng.shuffle(vectors)
+            for vector, label in vectors:
+                prediction = sigmoid(sum(self.weights.get(bucket, 0.0) * value for bucket, value in vector.items()))
+                gradient = prediction - label
+                for bucket, value in vector.items():
+                    weight = self.weights.get(bucket, 0.0)
+                    self.weights[bucket] = weight - learning_rate * (gradient * value + l2 * weight)
+
+    def save(self, path: Path) -> None:
+        """Write the weights to a JSON file (atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        weights = {str(bucket): round(weight, 6) for bucket, weight in self.weights.items() if abs(weight) > 1e-6}
+        tmp_path.write_text(json.dumps({"feature_buckets": feature_buckets, "weights": weights}), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ClarificationClassifier":
+        """Load weights from a JSON file, falling back to the prior weights if it is missing."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("feature_buckets") != feature_buckets:
+            logger.warning("Ignoring clarification weights with a different feature size: %s", path)
+            return cls()
+        return cls({int(bucket): weight for bucket, weight in data["weights"].items()})
+
+# ===== DECISION LOG =====
+
+_log_lock = threading.Lock()
+
+def get_weights_path() -> Path:
+    """Location of the classifier weights."""
+    return Path(os.environ.get("DEEP_RESEARCH_CLARIFICATION_WEIGHTS") or get_data_dir() / weights_file_name)
+
+def get_log_path() -> Path:
+    """Location of the clarification decision log."""
+    return Path(os.environ.get("DEEP_RESEARCH_CLARIFICATION_LOG") or get_data_dir() / log_file_name)
+
+def log_decision(messages: Sequence[BaseMessage], need_clarification: bool, source: str = "model") -> None:
+    """Append a clarification decision to the log, for later training.
+
+    Only model decisions should be used as labels; decisions made by the
+    classifier itself are logged with their source so training can skip them.
+    """
+    record = {
+        "time": time.time(),
+        "source": source,
+        "need_clarification": bool(need_clarification),
+        "features": extract_features(messages),
+    }
+    log_path = get_log_path()
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with _log_lock, open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning("Failed to log clarification decision: %s", e)
+
+def load_examples(log_path: Path) -> List[tuple]:
+    """Read model-labelled training examples from the decision log."""
+    examples = []
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("source") == "model":
+                examples.append((record["features"], record["need_clarification"]))
+    return examples
+
+# ===== SHARED INSTANCE =====
+
+_classifier: ClarificationClassifier | None = None
+
+def get_clarification_classifier() -> ClarificationClassifier:
+    """Get or load the shared classifier lazily."""
+    global _classifier
+    if _classifier is None:
+        _classifier = ClarificationClassifier.load(get_weights_path())
+    return _classifier
+
+def build_verification_message(messages: Sequence[BaseMessage]) -> str:
+    """Acknowledge the request when the clarification call was skipped."""
+    request = " ".join(latest_user_text(messages).split())
+    if len(request) > 300:
+        request = request[:300].rsplit(" ", 1)[0] + "..."
+    return (
+        "Thank you, I have enough information to proceed. "
+        f"I will now start researching your request: {request}"
+    )
+
+# ===== ENTRY POINT =====
+
+def main(argv: List[str] | None = None) -> None:
+    """Command-line entry point for training the classifier from the decision log."""
+    parser = argparse.ArgumentParser(description="Train the clarification pre-classifier from logged decisions.")
+    parser.add_argument("command", choices=["train"])
+    parser.add_argument("--log", type=Path, default=None, help="Decision log (JSONL)")
+    parser.add_argument("--weights", type=Path, default=None, help="Output weights file (JSON)")
+    parser.add_argument("--epochs", type=int, default=10)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    log_path = args.log or get_log_path()
+    weights_path = args.weights or get_weights_path()
+
+    examples = load_examples(log_path) if log_path.exists() else []
+    if not examples:
+        logger.info("No model decisions found in %s", log_path)
+        return
+
+    classifier = ClarificationClassifier()
+    classifier.train(examples, epochs=args.epochs)
+    classifier.save(weights_path)
+
+    skipped = [label for features, label in examples if classifier.predict_features(features) < max_skip_probability]
+    wrong = sum(1 for label in skipped if label)
+    logger.info("Trained on %d decisions: would skip %d, of which %d needed clarification", len(examples), len(skipped), wrong)
+    logger.info("Weights written to %s", weights_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Local Data Directory.
+
+Data that outlives a single run - the blob store, the report store, and the
+clarification classifier's weights and decision log - is kept in one
+directory outside the package, so an installed package or a container's source
+tree is never written to. It defaults to ``~/.deep_research`` and can be moved
+with the ``DEEP_RESEARCH_DATA_DIR`` environment variable.
+"""
+
+import os
+from pathlib import Path
+
+# ===== CONFIGURATION =====
+
+default_data_dir = Path.home() / ".deep_research"
+
+# ===== DATA DIRECTORY =====
+
+def get_data_dir() -> Path:
+    """Directory holding the agent's local data."""
+    return Path(os.environ.get("DEEP_RESEARCH_DATA_DIR") or default_data_dir)
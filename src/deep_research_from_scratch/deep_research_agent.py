@@ -12,8 +12,6 @@ The system orchestrates the complete research workflow from initial user
 input through final report delivery.
 """
 
-import os
-import uuid
 from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, START, END
 
@@ -21,13 +19,18 @@ from deep_research_from_scratch.utils import get_today_str
 from deep_research_from_scratch.prompts import final_report_generation_prompt
 from deep_research_from_scratch.state_scope import AgentState, AgentInputState
 from deep_research_from_scratch.research_agent_scope import clarify_with_user, write_research_brief
-from deep_research_from_scratch.multi_agent_supervisor import supervisor_agent
+from deep_research_from_scratch.multi_agent_supervisor import coalesced_supervisor
+from deep_research_from_scratch.single_flight import SingleFlight, brief_key
+from deep_research_from_scratch.report_store import get_report_store
 
 # ===== Config =====
 
 from langchain.chat_models import init_chat_model
 writer_model = init_chat_model("google_genai:models/gemini-flash-latest") # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
 
+# Concurrent report generations with identical prompts share one model call
+report_flights = SingleFlight()
+
 # ===== FINAL REPORT GENERATION =====
 
 from deep_research_from_scratch.state_scope import AgentState
@@ -49,7 +52,11 @@ async def final_report_generation(state: AgentState):
         date=get_today_str()
     )
 
-    final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+    # Runs that shared a supervisor execution have identical prompts, so they share one report too
+    async def write_report():
+        return await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+
+    final_report, _ = await report_flights.do(brief_key(final_report_prompt), write_report)
 
     return {
         "final_report": final_report.content, 
@@ -60,30 +67,21 @@ async def final_report_generation(state: AgentState):
 
 async def save_report_to_file(state: AgentState):
     """
-    Save the final report to a file in the 'files' directory.
+    Save the final report to the report store.
     
-    Uses UUID to generate a unique filename for each report.
+    The body is stored compressed and indexed with its research brief, so it can
+    later be looked up by id, by brief, or as the latest report. Every run gets
+    its own index row, including runs that shared a coalesced report; their rows
+    point at one stored body. The write runs in a worker thread to keep the
+    event loop free.
     """
     final_report = state.get("final_report", "")
     
-    # Get the directory where this module is located
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    files_dir = os.path.join(module_dir, "files")
-    
-    # Create the files directory if it doesn't exist
-    os.makedirs(files_dir, exist_ok=True)
-    
-    # Generate a unique filename using UUID
-    report_id = str(uuid.uuid4())
-    filename = f"report_{report_id}.md"
-    filepath = os.path.join(files_dir, filename)
-    
-    # Save the report
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(final_report)
+    report_store = get_report_store()
+    report_id = await report_store.asave(final_report, brief=state.get("research_brief") or "")
     
     return {
-        "messages": [f"Report saved to: {filepath}"],
+        "messages": [f"Report saved to: {report_store.root} (id: {report_id})"],
     }
 
 # ===== GRAPH CONSTRUCTION =====
@@ -93,7 +91,7 @@ deep_researcher_builder = StateGraph(AgentState, input_schema=AgentInputState)
 # Add workflow nodes
 deep_researcher_builder.add_node("clarify_with_user", clarify_with_user)
 deep_researcher_builder.add_node("write_research_brief", write_research_brief)
-deep_researcher_builder.add_node("supervisor_subgraph", supervisor_agent)
+deep_researcher_builder.add_node("supervisor_subgraph", coalesced_supervisor)
 deep_researcher_builder.add_node("final_report_generation", final_report_generation)
 deep_researcher_builder.add_node("save_report_to_file", save_report_to_file)
 
@@ -0,0 +1,258 @@
+"""Incremental Full-Text Index over the Research Files.
+
+This module maintains a BM25 inverted index over the local research files, so
+the research agent can find relevant passages without reading files one by one
+into its context. Files are split into line-based chunks; every chunk keeps its
+file and line range, so search hits point straight at the text to read.
+
+The index is updated incrementally: on each search, only files whose
+modification time or size changed since the last refresh are re-indexed, and
+deleted files are dropped.
+"""
+
+import asyncio
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+from langchain_core.tools import StructuredTool
+from typing_extensions import Dict, List, Set, Tuple, TypedDict
+
+from deep_research_from_scratch.text_utils import STOPWORDS
+
+# ===== CONFIGURATION =====
+
+# Directory that is indexed (the research files next to this module)
+index_root = Path(__file__).resolve().parent / "files"
+
+# Only files with these suffixes are indexed
+indexed_suffixes = {".md", ".txt", ".rst", ".csv", ".json", ".html"}
+
+# Number of lines per chunk, and how many lines consecutive chunks share
+chunk_lines = 30
+chunk_overlap_lines = 5
+
+# BM25 parameters
+bm25_k1 = 1.5
+bm25_b = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# ===== SCHEMAS =====
+
+class SearchHit(TypedDict):
+    """A ranked passage returned by the document index."""
+    path: str
+    start_line: int
+    end_line: int
+    score: float
+    text: str
+
+# ===== TOKENIZATION AND CHUNKING =====
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase a text and split it into content tokens."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+def chunk_text(text: str) -> List[Tuple[int, int, str]]:
+    """Split a text into overlapping line-based chunks.
+
+    Returns:
+        List of (start_line, end_line, text) tuples with 1-based, inclusive line numbers
+    """
+    lines = text.splitlines()
+    step = max(1, chunk_lines - chunk_overlap_lines)
+    chunks = []
+    for start in range(0, len(lines), step):
+        window = lines[start:start + chunk_lines]
+        if any(line.strip() for line in window):
+            chunks.append((start + 1, start + len(window), "\n".join(window)))
+        if start + chunk_lines >= len(lines):
+            break
+    return chunks
+
+# ===== INDEX =====
+
+class DocumentIndex:
+    """BM25 inverted index over line-based chunks of the files in a directory.
+
+    The index is safe to use from several threads; refreshes and searches are
+    serialized with a lock.
+    """
+
+    def __init__(self, root: Path):
+        """Create an empty index over a directory; call refresh() to fill it."""
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._next_chunk_id = 0
+        # chunk id -> (relative path, start line, end line, token count)
+        self._chunks: Dict[int, Tuple[str, int, int, int]] = {}
+        # term -> {chunk id: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # relative path -> (mtime_ns, size, chunk ids, terms)
+        self._files: Dict[str, Tuple[int, int, List[int], Set[str]]] = {}
+        self._total_tokens = 0
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the directory.
+
+        Returns:
+            Number of files that were (re-)indexed or removed
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            if self.root.is_dir():
+                for path in sorted(self.root.rglob("*")):
+                    if not path.is_file() or path.suffix.lower() not in indexed_suffixes:
+                        continue
+                    relative = path.relative_to(self.root).as_posix()
+                    seen.add(relative)
+                    stat = path.stat()
+                    indexed = self._files.get(relative)
+                    if indexed and indexed[0] == stat.st_mtime_ns and indexed[1] == stat.st_size:
+                        continue
+                    self._remove_file(relative)
+                    self._add_file(relative, path, stat.st_mtime_ns, stat.st_size)
+                    changed += 1
+
+            for relative in set(self._files) - seen:
+                self._remove_file(relative)
+                changed += 1
+            return changed
+
+    def search(self, query: str, max_results: int = 5) -> List[SearchHit]:
+        """Rank chunks against a query with BM25.
+
+        Args:
+            query: Free-text search query
+            max_results: Maximum number of passages to return
+
+        Returns:
+            Best matching passages, highest score first
+        """
+        with self._lock:
+            if not self._chunks:
+                return []
+            chunk_count = len(self._chunks)
+            average_length = self._total_tokens / chunk_count or 1.0
+
+            scores: Dict[int, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (chunk_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for chunk_id, frequency in postings.items():
+                    length = self._chunks[chunk_id][3]
+                    norm = bm25_k1 * (1 - bm25_b + bm25_b * length / average_length)
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * frequency * (bm25_k1 + 1) / (frequency + norm)
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:max_results]
+            hits = [(chunk_id, score, self._chunks[chunk_id]) for chunk_id, score in ranked]
+
+        return [
+            SearchHit(
+                path=relative,
+                start_line=start_line,
+                end_line=end_line,
+                score=round(score, 3),
+                text=self._read_lines(relative, start_line, end_line),
+            )
+            for chunk_id, score, (relative, start_line, end_line, _) in hits
+        ]
+
+    def _add_file(self, relative: str, path: Path, mtime_ns: int, size: int) -> None:
+        """Chunk a file and add its chunks to the index."""
+        text = path.read_text(encoding="utf-8", errors="replace")
+        chunk_ids = []
+        terms = set()
+        for start_line, end_line, chunk in chunk_text(text):
+            tokens = tokenize(chunk)
+            chunk_id = self._next_chunk_id
+            self._next_chunk_id += 1
+            self._chunks[chunk_id] = (relative, start_line, end_line, len(tokens))
+            self._total_tokens += len(tokens)
+            for term, frequency in Counter(tokens).items():
+                self._postings.setdefault(term, {})[chunk_id] = frequency
+                terms.add(term)
+            chunk_ids.append(chunk_id)
+        self._files[relative] = (mtime_ns, size, chunk_ids, terms)
+
+    def _remove_file(self, relative: str) -> None:
+        """Remove all chunks of a file from the index."""
+        indexed = self._files.pop(relative, None)
+        if indexed is None:
+            return
+        _, _, chunk_ids, terms = indexed
+        for chunk_id in chunk_ids:
+            self._total_tokens -= self._chunks.pop(chunk_id)[3]
+        # Only the file's own terms can reference its chunks
+        for term in terms:
+            postings = self._postings[term]
+            for chunk_id in chunk_ids:
+                postings.pop(chunk_id, None)
+            if not postings:
+                del self._postings[term]
+
+    def _read_lines(self, relative: str, start_line: int, end_line: int) -> str:
+        """Read a line range of an indexed file (chunk text is not kept in memory)."""
+        try:
+            lines = (self.root / relative).read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return ""
+        return "\n".join(lines[start_line - 1:end_line])
+
+# ===== SHARED INDEX =====
+
+_index: DocumentIndex | None = None
+
+def get_document_index() -> DocumentIndex:
+    """Get or create the shared index over the research files directory."""
+    global _index
+    if _index is None or _index.root != Path(index_root):
+        _index = DocumentIndex(index_root)
+    return _index
+
+def format_search_hits(hits: List[SearchHit]) -> str:
+    """Format ranked passages with their file and line references."""
+    if not hits:
+        return "No matching passages found. Try different search terms or list the directory."
+
+    formatted_output = "Search results:\n"
+    for i, hit in enumerate(hits, 1):
+        formatted_output += f"\n--- RESULT {i}: {hit['path']} (lines {hit['start_line']}-{hit['end_line']}, score {hit['score']}) ---\n"
+        formatted_output += f"{hit['text']}\n"
+    return formatted_output
+
+# ===== TOOL =====
+
+def _search_documents(query: str, max_results: int = 5) -> str:
+    """Search the research files for passages relevant to a query.
+
+    Returns ranked passages with their file path and line range, so you can
+    answer from the passages directly or read just the relevant part of a file.
+
+    Args:
+        query: Keywords or a short description of the information you need
+        max_results: Maximum number of passages to return
+
+    Returns:
+        Ranked passages with file and line references
+    """
+    index = get_document_index()
+    index.refresh()
+    return format_search_hits(index.search(query, max_results=max_results))
+
+async def _asearch_documents(query: str, max_results: int = 5) -> str:
+    """Search the research files without blocking the event loop."""
+    return await asyncio.to_thread(_search_documents, query, max_results)
+
+search_documents = StructuredTool.from_function(
+    func=_search_documents,
+    coroutine=_asearch_documents,
+    name="search_documents",
+    parse_docstring=True,
+)
@@ -0,0 +1,297 @@
+"""In-Process Filesystem Research Tools.
+
+This module provides a native Python alternative to the MCP filesystem server
+for researching the local ``files`` directory. It offers the same tool surface
+the MCP research prompt describes (list_allowed_directories, list_directory,
+read_file, read_multiple_files, search_files), but runs in process: there is no
+Node.js subprocess to start and no JSON-RPC serialization on every file
+operation.
+
+All paths are confined to the research directory; paths that resolve outside
+of it (including via ``..`` or symlinks) are rejected. Large files are read
+through memory maps instead of buffered reads.
+
+The paging tools (read_file_range, read_output_page) work with any backend:
+they let the agent read large files and oversized tool outputs one page at a
+time instead of pulling everything into its context at once.
+"""
+
+import asyncio
+import codecs
+import fnmatch
+import mmap
+from pathlib import Path
+
+from langchain_core.tools import StructuredTool, ToolException
+from typing_extensions import List
+
+from deep_research_from_scratch.blob_store import get_blob_store, is_blob_ref
+from deep_research_from_scratch.tool_output import paginate_output
+from deep_research_from_scratch.utils import get_current_dir
+
+# ===== CONFIGURATION =====
+
+# Directory the research tools are allowed to access
+files_root = get_current_dir() / "files"
+
+# Files at least this large (in bytes) are read through a memory map
+mmap_threshold_bytes = 1024 * 1024
+# Size of the slices large files are decoded and searched in
+read_chunk_bytes = 1024 * 1024
+
+# Maximum number of paths returned by one search
+max_search_results = 100
+
+# Default number of lines returned by read_file_range
+default_page_lines = 200
+
+# ===== PATH HANDLING =====
+
+def resolve_path(path: str) -> Path:
+    """Resolve a tool path argument and check that it stays inside the research directory.
+
+    Args:
+        path: Absolute path, or path relative to the research directory
+
+    Returns:
+        The resolved path
+
+    Raises:
+        ToolException: If the path is outside the research directory
+    """
+    root = files_root.resolve()
+    candidate = Path(path)
+    if not candidate.is_absolute():
+        candidate = root / candidate
+
+    resolved = candidate.resolve()
+    if resolved != root and not resolved.is_relative_to(root):
+        raise ToolException(f"Access denied - path outside allowed directory: {path}")
+    return resolved
+
+def read_text(path: Path) -> str:
+    """Read a text file, memory-mapping it when it is large.
+
+    Large files are decoded slice by slice from the map, so no copy of the
+    whole file's bytes is made next to the decoded text.
+    """
+    size = path.stat().st_size
+    # Empty files cannot be memory-mapped
+    if size < mmap_threshold_bytes or size == 0:
+        return path.read_text(encoding="utf-8", errors="replace")
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, len(mapped), read_chunk_bytes):
+            parts.append(decoder.decode(mapped[start:start + read_chunk_bytes]))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+def file_contains(path: Path, needle: str) -> bool:
+    """Check whether a text file contains a lowercase string, case-insensitively.
+
+    The file is scanned in chunks that overlap by the length of the needle,
+    so matches across chunk boundaries are found without loading the file.
+    """
+    overlap = len(needle) - 1
+    tail = ""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        while chunk := f.read(read_chunk_bytes):
+            window = tail + chunk.lower()
+            if needle in window:
+                return True
+            tail = window[-overlap:] if overlap > 0 else ""
+    return False
+
+# ===== TOOL IMPLEMENTATIONS =====
+
+def _list_allowed_directories() -> str:
+    """List the directories the research tools are allowed to access.
+
+    Returns:
+        The allowed directories, one per line
+    """
+    return f"Allowed directories:\n{files_root.resolve()}"
+
+def _list_directory(path: str) -> str:
+    """List the files and subdirectories of a directory.
+
+    Args:
+        path: Directory to list, absolute or relative to the allowed directory
+
+    Returns:
+        One entry per line, prefixed with [FILE] or [DIR]
+    """
+    directory = resolve_path(path)
+    if not directory.is_dir():
+        raise ToolException(f"Not a directory: {path}")
+
+    entries = sorted(directory.iterdir(), key=lambda entry: entry.name)
+    return "\n".join(
+        f"{'[DIR]' if entry.is_dir() else '[FILE]'} {entry.name}" for entry in entries
+    )
+
+def _read_file(path: str) -> str:
+    """Read the complete contents of a text file.
+
+    Args:
+        path: File to read, absolute or relative to the allowed directory
+
+    Returns:
+        The file contents
+    """
+    file_path = resolve_path(path)
+    if not file_path.is_file():
+        raise ToolException(f"File not found: {path}")
+    return read_text(file_path)
+
+def _read_multiple_files(paths: List[str]) -> str:
+    """Read the contents of several files at once.
+
+    Files that cannot be read are reported inline without failing the others.
+
+    Args:
+        paths: Files to read, absolute or relative to the allowed directory
+
+    Returns:
+        The contents of each file, separated by "---"
+    """
+    sections = []
+    for path in paths:
+        try:
+            sections.append(f"{path}:\n{_read_file(path)}")
+        except (ToolException, OSError) as e:
+            sections.append(f"{path}: Error - {str(e)}")
+    return "\n---\n".join(sections)
+
+def _read_file_range(path: str, start_line: int = 1, max_lines: int = default_page_lines) -> str:
+    """Read a range of lines from a text file.
+
+    Prefer this over read_file for large files: read one page at a time and
+    continue from the line given at the end of the output only if needed.
+
+    Args:
+        path: File to read, absolute or relative to the allowed directory
+        start_line: First line to read (1-based)
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        The requested lines, followed by where to continue if the file has more
+    """
+    file_path = resolve_path(path)
+    if not file_path.is_file():
+        raise ToolException(f"File not found: {path}")
+
+    start_line = max(1, start_line)
+    max_lines = max(1, max_lines)
+    lines = []
+    has_more = False
+    # Stream the file so only the requested range is held in memory
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        for line_number, line in enumerate(f, 1):
+            if line_number < start_line:
+                continue
+            if len(lines) == max_lines:
+                has_more = True
+                break
+            lines.append(line.rstrip("\n"))
+
+    if not lines:
+        return f"No lines at or after line {start_line} in {path}."
+
+    end_line = start_line + len(lines) - 1
+    output = f"{path} (lines {start_line}-{end_line}):\n" + "\n".join(lines)
+    if has_more:
+        output += f"\n\n[More lines follow. To continue, call read_file_range(path=\"{path}\", start_line={end_line + 1}).]"
+    return output
+
+def _read_output_page(token: str, offset: int = 0) -> str:
+    """Read the next page of a tool output that was truncated.
+
+    Args:
+        token: Continuation token given in the truncated output
+        offset: Character offset to continue from, as given in the truncated output
+
+    Returns:
+        The next page of the output, no longer than any other capped tool output
+    """
+    if not is_blob_ref(token):
+        raise ToolException(f"Invalid continuation token: {token}")
+    try:
+        text = get_blob_store().get(token)
+    except KeyError:
+        raise ToolException(f"Unknown continuation token: {token}")
+    return paginate_output(text, offset=max(0, offset))
+
+def _search_files(path: str, pattern: str) -> str:
+    """Recursively find files whose name or content matches a pattern.
+
+    Args:
+        path: Directory to search, absolute or relative to the allowed directory
+        pattern: Glob pattern or case-insensitive text to look for
+
+    Returns:
+        Matching file paths, one per line (unreadable files are skipped)
+    """
+    directory = resolve_path(path)
+    if not directory.is_dir():
+        raise ToolException(f"Not a directory: {path}")
+
+    needle = pattern.lower()
+    is_glob = any(char in pattern for char in "*?[")
+    matches = []
+    for file_path in sorted(directory.rglob("*")):
+        if len(matches) >= max_search_results:
+            break
+        try:
+            if not file_path.is_file() or not file_path.resolve().is_relative_to(files_root.resolve()):
+                continue
+            name = file_path.name.lower()
+            if (fnmatch.fnmatch(name, needle) if is_glob else needle in name):
+                matches.append(str(file_path))
+            elif not is_glob and file_contains(file_path, needle):
+                matches.append(str(file_path))
+        except OSError:
+            continue
+
+    return "\n".join(matches) if matches else "No matches found"
+
+# ===== TOOLS =====
+
+def make_tool(func) -> StructuredTool:
+    """Wrap a filesystem function as a tool whose async path runs in a worker thread."""
+    async def coroutine(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return StructuredTool.from_function(
+        func=func,
+        coroutine=coroutine,
+        name=func.__name__.lstrip("_"),
+        parse_docstring=True,
+        # Report bad paths to the model instead of failing the research loop
+        handle_tool_error=True,
+    )
+
+list_allowed_directories = make_tool(_list_allowed_directories)
+list_directory = make_tool(_list_directory)
+read_file = make_tool(_read_file)
+read_multiple_files = make_tool(_read_multiple_files)
+search_files = make_tool(_search_files)
+
+read_file_range = make_tool(_read_file_range)
+read_output_page = make_tool(_read_output_page)
+
+filesystem_tools = [
+    list_allowed_directories,
+    list_directory,
+    read_file,
+    read_multiple_files,
+    search_files,
+]
+
+# Backend-independent tools for reading large files and outputs page by page
+paging_tools = [
+    read_file_range,
+    read_output_page,
+]
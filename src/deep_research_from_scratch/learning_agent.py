@@ -6,25 +6,41 @@ This module implements:
 3. Checkpoint-based learning with quizzes and remediation
 """
 
+import logging
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List, Annotated, Literal, Optional, Sequence
+from typing import List, Annotated, Literal, Sequence
 from typing_extensions import TypedDict
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.types import interrupt, Command
 from pydantic import BaseModel, Field
 from langchain.chat_models import init_chat_model
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, get_buffer_string
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 
-from deep_research_from_scratch.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt
-from deep_research_from_scratch.state_scope import ClarifyWithUser, ResearchQuestion
+from deep_research_from_scratch.clarification_classifier import build_verification_message, clarifying_question_message, get_clarification_classifier, log_decision
+from deep_research_from_scratch.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt, scope_with_user_instructions
+from deep_research_from_scratch.scope_history import compact_scoping_history
+from deep_research_from_scratch.report_store import get_report_store
+from deep_research_from_scratch.state_scope import ClarifyWithUser, ResearchQuestion, ScopeDecision
+
+logger = logging.getLogger(__name__)
 
 # --- 1. SETUP MODEL ---
 # Ensure you have your API key set in env: GOOGLE_API_KEY
 model = init_chat_model("google_genai:models/gemini-2.5-flash-lite")
 
+# Scoping mode: "two_call" (clarify, then write the brief) or "single_call"
+# (one structured call returns the clarifying question or the finished brief)
+scoping_mode: Literal["two_call", "single_call"] = "two_call"
+
+# Skip the clarification call when the local pre-classifier is confident,
+# and log model decisions as its training data (opt-in; the log is written to
+# the classifier data directory, see clarification_classifier.get_data_dir)
+use_clarification_classifier = False
+log_clarification_decisions = False
+
 
 # --- 2. UTILITY FUNCTIONS ---
 
@@ -61,7 +77,9 @@ class State(TypedDict):
     # Messages for user clarification
     messages: Annotated[Sequence[BaseMessage], add_messages]
     # Research brief generated from clarification (becomes user_request)
-    research_brief: Optional[str]
+    research_brief: str | None
+    # Brief written together with the clarification decision in single-call scoping
+    pending_research_brief: str | None
     user_request: str
     # Learning checkpoints
     checkpoints: list[Checkpoint]
@@ -107,22 +125,20 @@ simplified_gen = model.with_structured_output(SimplifiedContent)
 # --- 5. DEFINE NODES ---
 
 def load_report(state: State):
-    """Node 0: Loads the latest markdown file from the files directory."""
-    print("--- Loading Report from Files Directory ---")
-    
-    # Get the files directory path (relative to this module)
-    files_dir = Path(__file__).parent / "files"
-    
-    if not files_dir.exists():
-        raise FileNotFoundError(f"Files directory not found: {files_dir}")
+    """Node 0: Loads the latest report from the report store, or a sample from the files directory."""
+    print("--- Loading Report ---")
     
-    # Find all markdown files
-    md_files = list(files_dir.glob("*.md"))
+    # The report store indexes reports by creation time, so no scan is needed
+    latest_report = get_report_store().latest()
+    if latest_report:
+        logger.info("Loading report %s from the report store", latest_report["id"])
+        return {"report": latest_report["body"]}
     
+    # No report has been stored yet - fall back to the markdown files shipped in the files directory
+    files_dir = Path(__file__).parent / "files"
+    md_files = list(files_dir.glob("*.md")) if files_dir.exists() else []
     if not md_files:
-        raise FileNotFoundError(f"No markdown files found in: {files_dir}")
-    
-    # Get the latest file by modification time
+        raise FileNotFoundError(f"No stored reports and no markdown files found in: {files_dir}")
     latest_file = max(md_files, key=lambda f: f.stat().st_mtime)
     
     print(f"Loading file: {latest_file.name}")
@@ -139,32 +155,54 @@ def clarify_with_user(state: State) -> Command[Literal["write_research_brief", "
     
     Uses structured output to make deterministic decisions and avoid hallucination.
     Routes to either research brief generation or ends with a clarification question.
+    In single-call mode the research brief is written in the same call.
     """
     print("--- Clarifying with User ---")
     
+    # Well-specified requests and answered questions skip the model call entirely
+    if use_clarification_classifier and get_clarification_classifier().confident_no_clarification(state["messages"]):
+        logger.info("Pre-classifier: sufficient info, proceeding to write research brief")
+        return Command(
+            goto="write_research_brief", 
+            update={
+                "messages": [AIMessage(content=build_verification_message(state["messages"]))],
+                "pending_research_brief": None,
+            }
+        )
+    
+    single_call = scoping_mode == "single_call"
+    
     # Set up structured output model
-    structured_output_model = model.with_structured_output(ClarifyWithUser)
+    structured_output_model = model.with_structured_output(ScopeDecision if single_call else ClarifyWithUser)
+    instructions = scope_with_user_instructions if single_call else clarify_with_user_instructions
     
     # Invoke the model with clarification instructions
     response = structured_output_model.invoke([
-        HumanMessage(content=clarify_with_user_instructions.format(
-            messages=get_buffer_string(messages=state["messages"]), 
+        HumanMessage(content=instructions.format(
+            # Earlier reports are dropped and older turns summarized to keep the prompt bounded
+            messages=compact_scoping_history(state["messages"]), 
             date=get_today_str()
         ))
     ])
     
+    if log_clarification_decisions:
+        log_decision(state["messages"], response.need_clarification)
+    
     # Route based on clarification need
     if response.need_clarification:
         print(f"Need clarification: {response.question}")
         return Command(
             goto=END, 
-            update={"messages": [AIMessage(content=response.question)]}
+            update={"messages": [clarifying_question_message(response.question)]}
         )
     else:
         print("Sufficient info, proceeding to write research brief")
         return Command(
             goto="write_research_brief", 
-            update={"messages": [AIMessage(content=response.verification)]}
+            update={
+                "messages": [AIMessage(content=response.verification)],
+                "pending_research_brief": response.research_brief if single_call else None,
+            }
         )
 
 
@@ -173,26 +211,31 @@ def write_research_brief(state: State):
     Transform the conversation history into a comprehensive research brief.
     
     The research_brief becomes the user_request for the learning pipeline.
+    A brief already written by single-call scoping is used without another model call.
     """
     print("--- Writing Research Brief ---")
+    research_brief = state.get("pending_research_brief")
     
-    # Set up structured output model
-    structured_output_model = model.with_structured_output(ResearchQuestion)
-    
-    # Generate research brief from conversation history
-    response = structured_output_model.invoke([
-        HumanMessage(content=transform_messages_into_research_topic_prompt.format(
-            messages=get_buffer_string(state.get("messages", [])),
-            date=get_today_str()
-        ))
-    ])
+    if not research_brief:
+        # Set up structured output model
+        structured_output_model = model.with_structured_output(ResearchQuestion)
+        
+        # Generate research brief from conversation history
+        response = structured_output_model.invoke([
+            HumanMessage(content=transform_messages_into_research_topic_prompt.format(
+                messages=compact_scoping_history(state.get("messages", [])),
+                date=get_today_str()
+            ))
+        ])
+        research_brief = response.research_brief
     
-    print(f"Research brief: {response.research_brief[:100]}...")
+    print(f"Research brief: {research_brief[:100]}...")
     
     # Map research_brief to user_request for the learning pipeline
     return {
-        "research_brief": response.research_brief,
-        "user_request": response.research_brief
+        "research_brief": research_brief,
+        "pending_research_brief": None,
+        "user_request": research_brief
     }
 
 
@@ -0,0 +1,199 @@
+"""Persistent MCP Server Session Pool.
+
+This module keeps one long-lived session open per MCP server instead of paying
+the server startup (for stdio servers: process spawn, package resolution and
+handshake) on demand. Each session is owned by a background keeper task that:
+
+- Opens the session and loads its tools once
+- Reads the concurrency limit the server declares, if any
+- Health-checks the session with periodic pings
+- Restarts the session automatically, with backoff, if it dies
+
+Tools loaded from a pooled session are bound to it, so every research run in
+the process reuses the same warm server. The pool belongs to the event loop it
+was started on.
+"""
+
+import asyncio
+import logging
+
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+from typing_extensions import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+
+# Seconds between health-check pings of an idle session
+health_check_interval = 30.0
+# Seconds a ping may take before the session is considered dead
+health_check_timeout = 10.0
+# Seconds to wait for all sessions to come up on first use
+startup_timeout = 120.0
+# Delay before restarting a failed session (doubles up to the maximum)
+restart_delay = 1.0
+max_restart_delay = 30.0
+
+# Experimental server capability through which a server declares how many
+# requests it can handle at once: {"concurrency": {"maxConcurrentRequests": N}}.
+# MCP has no standard capability for this.
+concurrency_capability = "concurrency"
+
+# ===== SERVER METADATA =====
+
+def declared_concurrency_limit(session) -> int | None:
+    """Return the number of concurrent requests a server declares it can handle.
+
+    Args:
+        session: Initialized MCP client session
+
+    Returns:
+        The declared limit, or None if the server does not declare one
+    """
+    capabilities = session.get_server_capabilities()
+    experimental = (capabilities.experimental if capabilities else None) or {}
+    limit = (experimental.get(concurrency_capability) or {}).get("maxConcurrentRequests")
+    return limit if isinstance(limit, int) and limit > 0 else None
+
+# ===== SESSION POOL =====
+
+class MCPSessionPool:
+    """Long-lived, health-checked sessions to every server of an MCP client.
+
+    Sessions are entered and exited inside their own keeper task, as required
+    by the anyio-based MCP transports.
+    """
+
+    def __init__(self, client: MultiServerMCPClient, server_names: List[str]):
+        """Create the pool; sessions are opened by start() or on first use.
+
+        Args:
+            client: MCP client holding the server connection configurations
+            server_names: Servers to keep sessions open to
+        """
+        self.client = client
+        self.server_names = list(server_names)
+        # Incremented whenever a session (re)starts, so tool caches can tell when to refresh
+        self.generation = 0
+
+        self._tools: Dict[str, List[BaseTool]] = {}
+        self._declared_limits: Dict[str, int] = {}
+        self._ready: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in self.server_names}
+        self._check_requested: Dict[str, asyncio.Event] = {name: asyncio.Event() for name in self.server_names}
+        self._keepers: Dict[str, asyncio.Task] = {}
+        self._closing = False
+
+    def start(self) -> None:
+        """Start a keeper task for every server that does not have one running."""
+        self._closing = False
+        for name in self.server_names:
+            keeper = self._keepers.get(name)
+            if keeper is None or keeper.done():
+                self._keepers[name] = asyncio.get_running_loop().create_task(self._keep_session(name))
+
+    async def wait_ready(self, timeout: float = startup_timeout) -> None:
+        """Start the pool if needed and wait until every session is up.
+
+        Raises:
+            TimeoutError: If a session does not come up within the timeout
+        """
+        self.start()
+        await asyncio.wait_for(
+            asyncio.gather(*(self._ready[name].wait() for name in self.server_names)),
+            timeout=timeout,
+        )
+
+    async def get_tools(self) -> List[BaseTool]:
+        """Return the tools of all pooled sessions, in server order."""
+        tools_by_server = await self.get_tools_by_server()
+        return [tool for name in self.server_names for tool in tools_by_server[name]]
+
+    async def get_tools_by_server(self) -> Dict[str, List[BaseTool]]:
+        """Return the tools of each pooled session, keyed by server name."""
+        await self.wait_ready()
+        return {name: list(self._tools.get(name, [])) for name in self.server_names}
+
+    def get_declared_limits(self) -> Dict[str, int]:
+        """Return the concurrency limits the pooled servers declare, keyed by server name."""
+        return dict(self._declared_limits)
+
+    def request_health_check(self) -> None:
+        """Ping every session now instead of waiting for the next interval.
+
+        Call this after a tool call fails, so a dead session is restarted promptly.
+        """
+        for event in self._check_requested.values():
+            event.set()
+
+    def healthy(self) -> bool:
+        """Return whether every session is currently up."""
+        return all(self._ready[name].is_set() for name in self.server_names)
+
+    async def close(self) -> None:
+        """Close all sessions and stop their keeper tasks."""
+        self._closing = True
+        keepers = list(self._keepers.values())
+        for keeper in keepers:
+            keeper.cancel()
+        await asyncio.gather(*keepers, return_exceptions=True)
+        self._keepers.clear()
+
+    async def _keep_session(self, name: str) -> None:
+        """Hold one server session open, health-check it and restart it when it dies."""
+        delay = restart_delay
+        while not self._closing:
+            try:
+                async with self.client.session(name) as session:
+                    self._tools[name] = await load_mcp_tools(session)
+                    declared_limit = declared_concurrency_limit(session)
+                    if declared_limit is not None:
+                        self._declared_limits[name] = declared_limit
+                    self.generation += 1
+                    self._ready[name].set()
+                    delay = restart_delay
+
+                    while True:
+                        try:
+                            await asyncio.wait_for(self._check_requested[name].wait(), timeout=health_check_interval)
+                        except TimeoutError:
+                            pass
+                        self._check_requested[name].clear()
+                        await asyncio.wait_for(session.send_ping(), timeout=health_check_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("MCP session '%s' failed, restarting: %s", name, e)
+            finally:
+                self._ready[name].clear()
+                self._tools.pop(name, None)
+                self._declared_limits.pop(name, None)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_restart_delay)
+
+# ===== SHARED INSTANCE =====
+
+_pool: MCPSessionPool | None = None
+_pool_loop: asyncio.AbstractEventLoop | None = None
+
+def get_session_pool(client: MultiServerMCPClient, server_names: List[str]) -> MCPSessionPool:
+    """Get or create the session pool for the running event loop and client."""
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop or _pool.client is not client:
+        if _pool is not None and _pool_loop is loop:
+            # The client was replaced - shut down the sessions of the old one
+            loop.create_task(_pool.close())
+        _pool = MCPSessionPool(client, server_names)
+        _pool_loop = loop
+    return _pool
+
+async def close_session_pool() -> None:
+    """Close the shared session pool if it runs on the current event loop."""
+    global _pool, _pool_loop
+    if _pool is not None and _pool_loop is asyncio.get_running_loop():
+        await _pool.close()
+        _pool = None
+        _pool_loop = None
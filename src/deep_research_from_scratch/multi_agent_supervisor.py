@@ -16,6 +16,7 @@ from typing_extensions import Literal
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
+    AIMessage,
     HumanMessage, 
     BaseMessage, 
     SystemMessage, 
@@ -25,14 +26,18 @@ from langchain_core.messages import (
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
-from deep_research_from_scratch.prompts import lead_researcher_prompt
+from deep_research_from_scratch.novelty import measure_novelty
+from deep_research_from_scratch.prompts import lead_researcher_prompt, lead_researcher_plan_and_act_prompt
 from deep_research_from_scratch.research_agent import researcher_agent
+from deep_research_from_scratch.single_flight import SingleFlight, brief_key
 from deep_research_from_scratch.state_multi_agent_supervisor import (
     SupervisorState, 
     ConductResearch, 
-    ResearchComplete
+    ResearchComplete,
+    SupervisorStep
 )
-from deep_research_from_scratch.utils import get_today_str, think_tool
+from deep_research_from_scratch.state_scope import AgentState
+from deep_research_from_scratch.utils import get_today_str, think_tool, build_tool_call
 
 def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     """Extract research notes from ToolMessage objects in supervisor message history.
@@ -71,6 +76,18 @@ supervisor_tools = [ConductResearch, ResearchComplete, think_tool]
 supervisor_model = init_chat_model("google_genai:models/gemini-flash-latest")
 supervisor_model_with_tools = supervisor_model.bind_tools(supervisor_tools)
 
+# Turn mode for the supervisor loop:
+# - "tool_calling": the supervisor calls think_tool and ConductResearch as separate tools
+# - "plan_and_act": the supervisor emits one SupervisorStep per turn carrying both its
+#   reflection and its next delegation, removing the think_tool round trip
+turn_mode: Literal["tool_calling", "plan_and_act"] = "tool_calling"
+
+# Delegation tools stay bound so earlier tool calls in the history remain valid,
+# but the model is forced to answer with a SupervisorStep
+supervisor_plan_and_act_model = supervisor_model.bind_tools(
+    supervisor_tools + [SupervisorStep], tool_choice="SupervisorStep"
+)
+
 # System constants
 # Maximum number of tool call iterations for individual researcher agents
 # This prevents infinite loops and controls research depth per topic
@@ -82,6 +99,37 @@ max_concurrent_researchers = 3
 
 # ===== SUPERVISOR NODES =====
 
+async def plan_and_act_decision(messages: list[BaseMessage]) -> AIMessage:
+    """Reflect and choose the next delegation in a single model call.
+
+    The model answers with a SupervisorStep, which is turned into an AIMessage
+    whose content is the reflection and whose tool calls are either the
+    ConductResearch delegations or a single ResearchComplete call, so
+    supervisor_tools handles both turn modes the same way.
+
+    Args:
+        messages: System prompt followed by the supervisor message history
+
+    Returns:
+        AIMessage carrying the reflection and the next action as tool calls
+    """
+    response = await supervisor_plan_and_act_model.ainvoke(messages)
+
+    # Fall back to the raw response if the model did not produce a SupervisorStep
+    if not response.tool_calls:
+        return response
+
+    step = SupervisorStep(**response.tool_calls[0]["args"])
+    if step.research_complete or not step.research_topics:
+        tool_calls = [build_tool_call("ResearchComplete", {})]
+    else:
+        tool_calls = [
+            build_tool_call("ConductResearch", {"research_topic": topic})
+            for topic in step.research_topics[:max_concurrent_researchers]
+        ]
+
+    return AIMessage(content=step.reflection, tool_calls=tool_calls)
+
 async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tools"]]:
     """Coordinate research activities.
 
@@ -99,7 +147,8 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
     supervisor_messages = state.get("supervisor_messages", [])
 
     # Prepare system message with current date and constraints
-    system_message = lead_researcher_prompt.format(
+    prompt = lead_researcher_plan_and_act_prompt if turn_mode == "plan_and_act" else lead_researcher_prompt
+    system_message = prompt.format(
         date=get_today_str(), 
         max_concurrent_research_units=max_concurrent_researchers,
         max_researcher_iterations=max_researcher_iterations
@@ -107,7 +156,10 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
     messages = [SystemMessage(content=system_message)] + supervisor_messages
 
     # Make decision about next research steps
-    response = await supervisor_model_with_tools.ainvoke(messages)
+    if turn_mode == "plan_and_act":
+        response = await plan_and_act_decision(messages)
+    else:
+        response = await supervisor_model_with_tools.ainvoke(messages)
 
     return Command(
         goto="supervisor_tools",
@@ -124,7 +176,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     - Executing think_tool calls for strategic reflection
     - Launching parallel research agents for different topics
     - Aggregating research results
-    - Determining when research is complete
+    - Determining when research is complete, including stopping early once
+      a research round adds too little new information
 
     Args:
         state: Current supervisor state with messages and iteration count
@@ -139,8 +192,10 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
     # Initialize variables for single return pattern
     tool_messages = []
     all_raw_notes = []
+    all_novelty_metrics = []
     next_step = "supervisor"  # Default next step
     should_end = False
+    novelty_exhausted = False
 
     # Check exit criteria first
     exceeded_iterations = research_iterations >= max_researcher_iterations
@@ -210,10 +265,36 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                 tool_messages.extend(research_tool_messages)
 
                 # Aggregate raw notes from all research
+                # Each entry is a blob reference (see blob_store.offload_text), so we
+                # pass the references through rather than joining their text
                 all_raw_notes = [
-                    "\n".join(result.get("raw_notes", [])) 
+                    note
                     for result in tool_results
+                    for note in result.get("raw_notes", [])
+                ]
+
+                # Measure how much new information this round added over earlier findings
+                previous_findings = [
+                    str(m.content) for m in filter_messages(supervisor_messages, include_types="tool")
+                    if m.name == "ConductResearch"
                 ]
+                supervisor_novelty = measure_novelty(
+                    [str(m.content) for m in research_tool_messages],
+                    previous_findings,
+                    scope="supervisor",
+                    iteration=research_iterations,
+                )
+                all_novelty_metrics = [
+                    metric
+                    for result in tool_results
+                    for metric in result.get("novelty_metrics", [])
+                ] + [supervisor_novelty]
+
+                # Force ResearchComplete when the round added too little new information
+                if supervisor_novelty["stop"]:
+                    novelty_exhausted = True
+                    should_end = True
+                    next_step = END
 
         except Exception as e:
             print(f"Error in supervisor tools: {e}")
@@ -222,19 +303,26 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
     # Single return point with appropriate state updates
     if should_end:
-        return Command(
-            goto=next_step,
-            update={
-                "notes": get_notes_from_tool_calls(supervisor_messages),
-                "research_brief": state.get("research_brief", "")
-            }
-        )
+        # A novelty stop ends right after a research round, so keep that round's findings
+        final_messages = list(supervisor_messages) + (tool_messages if novelty_exhausted else [])
+        update = {
+            "notes": get_notes_from_tool_calls(final_messages),
+            "research_brief": state.get("research_brief", "")
+        }
+        if novelty_exhausted:
+            update.update({
+                "supervisor_messages": tool_messages,
+                "raw_notes": all_raw_notes,
+                "novelty_metrics": all_novelty_metrics
+            })
+        return Command(goto=next_step, update=update)
     else:
         return Command(
             goto=next_step,
             update={
                 "supervisor_messages": tool_messages,
-                "raw_notes": all_raw_notes
+                "raw_notes": all_raw_notes,
+                "novelty_metrics": all_novelty_metrics
             }
         )
 
@@ -246,3 +334,41 @@ supervisor_builder.add_node("supervisor", supervisor)
 supervisor_builder.add_node("supervisor_tools", supervisor_tools)
 supervisor_builder.add_edge(START, "supervisor")
 supervisor_agent = supervisor_builder.compile()
+
+# ===== COALESCED EXECUTION =====
+
+# Concurrent runs with the same normalized research brief share one supervisor execution
+supervisor_flights = SingleFlight()
+
+async def coalesced_supervisor(state: AgentState) -> dict:
+    """Run the supervisor subgraph, coalescing identical concurrent research runs.
+
+    Runs whose research briefs match after normalization (see
+    single_flight.normalize_brief) attach to the supervisor execution already
+    in flight and receive the same findings instead of starting their own.
+
+    Args:
+        state: Full agent state with the research brief and supervisor messages
+
+    Returns:
+        State update with the research findings
+    """
+    research_brief = state.get("research_brief", "")
+
+    async def run_supervisor():
+        return await supervisor_agent.ainvoke({
+            "supervisor_messages": state.get("supervisor_messages", []),
+            "research_brief": research_brief
+        })
+
+    result, shared = await supervisor_flights.do(brief_key(research_brief), run_supervisor)
+
+    update = {
+        "notes": result.get("notes", []),
+        "raw_notes": result.get("raw_notes", []),
+        "novelty_metrics": result.get("novelty_metrics", [])
+    }
+    # The coordination transcript belongs to the run that executed it
+    if not shared:
+        update["supervisor_messages"] = result.get("supervisor_messages", [])
+    return update
@@ -0,0 +1,133 @@
+"""Novelty Tracking for Adaptive Research Stopping.
+
+This module measures how much new information each research iteration
+contributes - new unique URLs, new source domains and new distinct facts -
+compared with everything gathered before it. When the marginal novelty of an
+iteration drops below the configured thresholds, the supervisor and the
+researchers stop early instead of spending further LLM calls on research that
+only repeats what is already known.
+
+Each measurement is returned as a plain dictionary so it can be stored in the
+graph state and inspected alongside the run.
+"""
+
+import hashlib
+import re
+from urllib.parse import urlparse
+
+from typing_extensions import Iterable, List, Set, TypedDict
+
+from deep_research_from_scratch.text_utils import STOPWORDS
+
+# ===== CONFIGURATION =====
+
+# An iteration is considered stale when it finds fewer new URLs than this...
+min_new_urls = 1
+# ...and fewer than this fraction of its facts are new
+min_fact_novelty = 0.2
+
+# Sentences with fewer content words than this are not counted as facts
+min_fact_tokens = 5
+
+URL_PATTERN = re.compile(r"https?://[^\s<>\"'\])]+")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# ===== METRICS SCHEMA =====
+
+class NoveltyMetrics(TypedDict):
+    """Novelty measurement for a single research iteration."""
+    scope: str
+    iteration: int
+    new_urls: int
+    total_urls: int
+    new_sources: int
+    new_facts: int
+    total_facts: int
+    fact_novelty: float
+    stop: bool
+
+# ===== EXTRACTION =====
+
+def extract_urls(text: str) -> Set[str]:
+    """Extract normalized URLs from a block of text."""
+    urls = set()
+    for match in URL_PATTERN.findall(text):
+        url = match.rstrip(".,;:")
+        urls.add(url.rstrip("/").lower())
+    return urls
+
+def extract_sources(urls: Iterable[str]) -> Set[str]:
+    """Reduce URLs to their source domains."""
+    sources = set()
+    for url in urls:
+        netloc = urlparse(url).netloc
+        if netloc.startswith("www."):
+            netloc = netloc[4:]
+        if netloc:
+            sources.add(netloc)
+    return sources
+
+def extract_facts(text: str) -> Set[str]:
+    """Fingerprint the distinct factual sentences in a block of text.
+
+    Sentences are reduced to their set of content words so that reordered or
+    lightly reworded repetitions of the same statement map to one fingerprint.
+    """
+    facts = set()
+    for sentence in SENTENCE_SPLIT_PATTERN.split(text):
+        tokens = {
+            token for token in TOKEN_PATTERN.findall(sentence.lower())
+            if token not in STOPWORDS
+        }
+        if len(tokens) < min_fact_tokens:
+            continue
+        fingerprint = hashlib.sha1(" ".join(sorted(tokens)).encode("utf-8")).hexdigest()[:16]
+        facts.add(fingerprint)
+    return facts
+
+# ===== NOVELTY MEASUREMENT =====
+
+def measure_novelty(
+    new_texts: List[str],
+    previous_texts: List[str],
+    scope: str,
+    iteration: int,
+) -> NoveltyMetrics:
+    """Measure how much new information an iteration adds over previous ones.
+
+    Args:
+        new_texts: Observations produced by the current iteration
+        previous_texts: Observations from all earlier iterations
+        scope: Label for where the measurement was taken ("researcher" or "supervisor")
+        iteration: Index of the current iteration
+
+    Returns:
+        Novelty metrics, including whether the iteration crossed the stop threshold
+    """
+    previous = "\n".join(previous_texts)
+    current = "\n".join(new_texts)
+
+    previous_urls = extract_urls(previous)
+    current_urls = extract_urls(current)
+    new_urls = current_urls - previous_urls
+    new_sources = extract_sources(new_urls) - extract_sources(previous_urls)
+
+    previous_facts = extract_facts(previous)
+    current_facts = extract_facts(current)
+    new_facts = current_facts - previous_facts
+    fact_novelty = len(new_facts) / len(current_facts) if current_facts else 0.0
+
+    stop = len(new_urls) < min_new_urls and fact_novelty < min_fact_novelty
+
+    return NoveltyMetrics(
+        scope=scope,
+        iteration=iteration,
+        new_urls=len(new_urls),
+        total_urls=len(previous_urls | current_urls),
+        new_sources=len(new_sources),
+        new_facts=len(new_facts),
+        total_facts=len(previous_facts | current_facts),
+        fact_novelty=round(fact_novelty, 3),
+        stop=stop,
+    )
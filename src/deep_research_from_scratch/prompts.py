@@ -87,6 +87,59 @@ Guidelines:
 - If the query is in a specific language, prioritize sources published in that language.
 """
 
+scope_with_user_instructions = """
+These are the messages that have been exchanged so far from the user asking for the report:
+<Messages>
+{messages}
+</Messages>
+
+Today's date is {date}.
+
+Assess whether you need to ask a clarifying question, or if the user has already provided enough information for you to start research.
+If no clarification is needed, also write the research brief that will guide the research, in the same response.
+
+IMPORTANT: If you can see in the messages history that you have already asked a clarifying question, you almost always do not need to ask another one. Only ask another question if ABSOLUTELY NECESSARY.
+
+If there are acronyms, abbreviations, or unknown terms, ask the user to clarify.
+If you need to ask a question, follow these guidelines:
+- Be concise while gathering all necessary information
+- Make sure to gather all the information needed to carry out the research task in a concise, well-structured manner.
+- Use bullet points or numbered lists if appropriate for clarity. Make sure that this uses markdown formatting and will be rendered correctly if the string output is passed to a markdown renderer.
+- Don't ask for unnecessary information, or information that the user has already provided. If you can see that the user has already provided the information, do not ask for it again.
+
+If you do not need to ask a question, write the research brief following these guidelines:
+1. Maximize Specificity and Detail - Include all known user preferences and explicitly list key attributes or dimensions to consider. All details from the user must be included.
+2. Handle Unstated Dimensions Carefully - When research quality requires dimensions the user hasn't specified, acknowledge them as open considerations rather than assumed preferences (e.g. "consider all price ranges unless cost constraints are specified").
+3. Avoid Unwarranted Assumptions - Never invent user preferences, constraints, or requirements that weren't stated. Explicitly note missing details and treat them as flexible.
+4. Distinguish Between Research Scope and User Preferences - The scope can be broader than the user's explicit mentions; preferences must only include what the user stated.
+5. Use the First Person - Phrase the request from the perspective of the user.
+6. Sources - If specific sources should be prioritized, specify them. Prefer official or primary websites for product and travel research, original papers for academic queries, LinkedIn or personal websites for people, and sources in the query's language.
+
+Respond in valid JSON format with these exact keys:
+"need_clarification": boolean,
+"question": "<question to ask the user to clarify the report scope>",
+"verification": "<verification message that we will start research>",
+"research_brief": "<detailed research question that will guide the research>"
+
+If you need to ask a clarifying question, return:
+"need_clarification": true,
+"question": "<your clarifying question>",
+"verification": "",
+"research_brief": ""
+
+If you do not need to ask a clarifying question, return:
+"need_clarification": false,
+"question": "",
+"verification": "<acknowledgement message that you will now start research based on the provided information>",
+"research_brief": "<the research brief>"
+
+For the verification message when no clarification is needed:
+- Acknowledge that you have sufficient information to proceed
+- Briefly summarize the key aspects of what you understand from their request
+- Confirm that you will now begin the research process
+- Keep the message concise and professional
+"""
+
 research_agent_prompt =  """You are a research assistant conducting research on the user's input topic. For context, today's date is {date}.
 
 <Task>
@@ -95,9 +148,10 @@ You can use any of the tools provided to you to find resources that can help ans
 </Task>
 
 <Available Tools>
-You have access to two main tools:
-1. **tavily_search**: For conducting web searches to gather information
-2. **think_tool**: For reflection and strategic planning during research
+You have access to three main tools:
+1. **tavily_search**: For conducting a single web search to gather information
+2. **tavily_search_batch**: For running several web searches at once - use it instead of multiple tavily_search calls when you want to check different angles of the topic. Shared pages are returned once in a single list of sources
+3. **think_tool**: For reflection and strategic planning during research
 
 **CRITICAL: Use think_tool after each search to reflect on results and plan next steps**
 </Available Tools>
@@ -117,6 +171,7 @@ Think like a human researcher with limited time. Follow these steps:
 - **Simple queries**: Use 2-3 search tool calls maximum
 - **Complex queries**: Use up to 5 search tool calls maximum
 - **Always stop**: After 5 search tool calls if you cannot find the right sources
+- Each query in a tavily_search_batch call counts towards these budgets
 
 **Stop Immediately When**:
 - You can answer the user's question comprehensively
@@ -133,6 +188,53 @@ After each search tool call, use think_tool to analyze the results:
 </Show Your Thinking>
 """
 
+# Research agent prompt for plan-and-act turns (reflection and next action in one response)
+research_agent_plan_and_act_prompt = """You are a research assistant conducting research on the user's input topic. For context, today's date is {date}.
+
+<Task>
+Your job is to gather information about the user's input topic with web searches.
+Your research is conducted in a loop: each of your turns is a single ResearchStep that contains both your reflection and your next action.
+</Task>
+
+<Turn Format>
+Every response is one ResearchStep with two fields:
+1. **reflection**: Your reflection on the research so far
+2. **search_queries**: The searches to run next. They are executed in parallel, and you see all of their results on your next turn. Leave this list empty when you are done researching.
+
+There is no separate thinking step - always reflect and act in the same response.
+</Turn Format>
+
+<Instructions>
+Think like a human researcher with limited time. Follow these steps:
+
+1. **Read the question carefully** - What specific information does the user need?
+2. **Start with broader searches** - Use broad, comprehensive queries first
+3. **After each round of searches, assess in your reflection** - Do I have enough to answer? What's still missing?
+4. **Execute narrower searches as you gather information** - Fill in the gaps
+5. **Stop when you can answer confidently** - Don't keep searching for perfection
+</Instructions>
+
+<Hard Limits>
+**Search Budgets** (Prevent excessive searching):
+- **Simple queries**: Use 2-3 search queries in total
+- **Complex queries**: Use up to 5 search queries in total
+- **Always stop**: After 5 search queries if you cannot find the right sources
+
+**Stop Immediately When** (return an empty search_queries list):
+- You can answer the user's question comprehensively
+- You have 3+ relevant examples/sources for the question
+- Your last 2 searches returned similar information
+</Hard Limits>
+
+<Reflection>
+Your reflection should answer:
+- What key information did I find?
+- What's missing?
+- Do I have enough to answer the question comprehensively?
+- Should I search more or finish?
+</Reflection>
+"""
+
 summarize_webpage_prompt = """You are tasked with summarizing the raw content of a webpage retrieved from a web search. Your goal is to create a summary that preserves the most important information from the original web page. This summary will be used by a downstream research agent, so it's crucial to maintain the key details without losing essential information.
 
 Here is the raw content of the webpage:
@@ -192,6 +294,34 @@ Remember, your goal is to create a summary that can be easily understood and uti
 Today's date is {date}.
 """
 
+summarize_webpages_batch_prompt = """You are tasked with summarizing the raw content of several webpages retrieved from a web search. Your goal is to create, for each webpage, a summary that preserves the most important information from that page. These summaries will be used by a downstream research agent, so it's crucial to maintain the key details without losing essential information.
+
+Here are the webpages, each identified by its URL:
+
+<webpages>
+{webpages}
+</webpages>
+
+Summarize every webpage separately - never mix information from different webpages in one summary. For each webpage:
+
+1. Identify and preserve the main topic or purpose of the webpage.
+2. Retain key facts, statistics, and data points that are central to the content's message.
+3. Keep important quotes from credible sources or experts.
+4. Maintain the chronological order of events if the content is time-sensitive or historical.
+5. Preserve any lists or step-by-step instructions if present.
+6. Include relevant dates, names, and locations that are crucial to understanding the content.
+7. Summarize lengthy explanations while keeping the core message intact.
+
+Each summary should be significantly shorter than the original content but comprehensive enough to stand alone as a source of information. Aim for about 25-30 percent of the original length, unless the content is already concise.
+
+Return exactly one entry per webpage with:
+- "url": the webpage URL, copied exactly as given
+- "summary": your summary, structured with appropriate paragraphs or bullet points as needed
+- "key_excerpts": the most important quotes or excerpts from that webpage, up to a maximum of 5
+
+Today's date is {date}.
+"""
+
 # Research agent prompt for MCP (Model Context Protocol) file access
 research_agent_prompt_with_mcp = """You are a research assistant conducting research on the user's input topic using local files. For context, today's date is {date}.
 
@@ -206,6 +336,8 @@ You have access to file system tools and thinking tools:
 - **list_directory**: List files in directories
 - **read_file**: Read individual files
 - **read_multiple_files**: Read multiple files at once
+- **read_file_range**: Read a page of lines from a large file, continuing where the previous page ended
+- **read_output_page**: Read the next page of a tool output that was truncated
 - **search_files**: Find files containing specific content
 - **think_tool**: For reflection and strategic planning during research
 
@@ -218,7 +350,7 @@ Think like a human researcher with access to a document library. Follow these st
 1. **Read the question carefully** - What specific information does the user need?
 2. **Explore available files** - Use list_allowed_directories and list_directory to understand what's available
 3. **Identify relevant files** - Use search_files if needed to find documents matching the topic
-4. **Read strategically** - Start with most relevant files, use read_multiple_files for efficiency
+4. **Read strategically** - Start with most relevant files, use read_multiple_files for efficiency and read_file_range for large files
 5. **After reading, pause and assess** - Do I have enough to answer? What's still missing?
 6. **Stop when you can answer confidently** - Don't keep reading for perfection
 </Instructions>
@@ -244,6 +376,12 @@ After reading files, use think_tool to analyze what you found:
 - Always cite which files you used for your information
 </Show Your Thinking>"""
 
+# Appended to research_agent_prompt_with_mcp when the search_documents tool is bound
+document_search_instructions = """<Document Search>
+You also have **search_documents**: ranked full-text search over the local files that returns the most relevant passages with file and line references.
+Use it to identify relevant passages before reading whole files, then read only the line ranges you need with read_file_range.
+</Document Search>"""
+
 lead_researcher_prompt = """You are a research supervisor. Your job is to conduct research by calling the "ConductResearch" tool. For context, today's date is {date}.
 
 <Task>
@@ -302,6 +440,53 @@ After each ConductResearch tool call, use think_tool to analyze the results:
 - Do NOT use acronyms or abbreviations in your research questions, be very clear and specific
 </Scaling Rules>"""
 
+# Supervisor prompt for plan-and-act turns (reflection and next action in one response)
+lead_researcher_plan_and_act_prompt = """You are a research supervisor. Your job is to conduct research by delegating research topics to specialized sub-agents. For context, today's date is {date}.
+
+<Task>
+Each of your turns is a single SupervisorStep that contains both your reflection and your next action.
+Delegate research topics against the overall research question passed in by the user.
+When you are completely satisfied with the research findings returned from the sub-agents, set research_complete to true.
+</Task>
+
+<Turn Format>
+Every response is one SupervisorStep with three fields:
+1. **reflection**: Your reflection on the research so far and your plan for the next step
+2. **research_topics**: The research topics to delegate next. Each topic spawns a dedicated sub-agent, and all of them run in parallel. Use at most {max_concurrent_research_units} topics per turn.
+3. **research_complete**: Set to true (with an empty research_topics list) when research is complete
+
+There is no separate thinking step - always reflect and act in the same response.
+</Turn Format>
+
+<Instructions>
+Think like a research manager with limited time and resources. Follow these steps:
+
+1. **Read the question carefully** - What specific information does the user need?
+2. **Decide how to delegate the research** - Are there multiple independent directions that can be explored simultaneously?
+3. **After each round of research, assess in your reflection** - Do I have enough to answer? What's still missing?
+</Instructions>
+
+<Hard Limits>
+**Task Delegation Budgets** (Prevent excessive delegation):
+- **Bias towards single agent** - Use a single topic for simplicity unless the user request has clear opportunity for parallelization
+- **Stop when you can answer confidently** - Don't keep delegating research for perfection
+- **Limit turns** - Always stop after {max_researcher_iterations} turns if you cannot find the right sources
+</Hard Limits>
+
+<Scaling Rules>
+**Simple fact-finding, lists, and rankings** can use a single sub-agent:
+- *Example*: List the top 10 coffee shops in San Francisco → Use 1 topic
+
+**Comparisons presented in the user request** can use a sub-agent for each element of the comparison:
+- *Example*: Compare OpenAI vs. Anthropic vs. DeepMind approaches to AI safety → Use 3 topics
+- Delegate clear, distinct, non-overlapping subtopics
+
+**Important Reminders:**
+- A separate agent will write the final report - you just need to gather information
+- Each research topic must be complete standalone instructions (at least a paragraph) - sub-agents can't see other agents' work
+- Do NOT use acronyms or abbreviations in your research topics, be very clear and specific
+</Scaling Rules>"""
+
 compress_research_system_prompt = """You are a research assistant that has conducted research on a topic by calling several tools and web searches. Your job is now to clean up the findings, but preserve all of the relevant statements and information that the researcher has gathered. For context, today's date is {date}.
 
 <Task>
@@ -365,6 +550,50 @@ CRITICAL REQUIREMENTS:
 
 The cleaned findings will be used for final report generation, so comprehensiveness is critical."""
 
+compress_research_chunk_message = """The messages below are part {chunk_index} of {chunk_count} of the research conducted by an AI Researcher for the following research topic:
+
+RESEARCH TOPIC: {research_topic}
+
+<Research Messages>
+{messages}
+</Research Messages>
+
+Clean up the findings in this part only, following your instructions. Other parts are cleaned up separately and merged afterwards.
+
+CRITICAL REQUIREMENTS:
+- DO NOT summarize or paraphrase the information - preserve it verbatim
+- DO NOT lose any details, facts, names, numbers, or specific findings
+- Keep the URL next to every source you cite, because citation numbers are reassigned when the parts are merged"""
+
+merge_compressed_research_prompt = """You are a research assistant merging cleaned-up research findings. The research on a single topic was too long to clean up in one pass, so it was split into parts and each part was cleaned up separately. For context, today's date is {date}.
+
+RESEARCH TOPIC: {research_topic}
+
+<Partial Findings>
+{partial_findings}
+</Partial Findings>
+
+<Task>
+Merge the partial findings into one fully comprehensive set of findings.
+- Preserve ALL information from every part verbatim - do not summarize, paraphrase, or drop details
+- Remove only exact duplicates, e.g. the same statement from the same source appearing in two parts
+- Combine the queries and tool calls listed in each part into a single list
+</Task>
+
+<Citation Rules>
+- Each part numbered its sources independently - reassign citation numbers so each unique URL has a single number across the merged findings
+- Update the inline citations to the new numbers
+- End with ### Sources that lists each source with corresponding numbers, numbered sequentially without gaps (1,2,3,4...)
+- It's really important not to lose any sources
+</Citation Rules>
+
+<Output Format>
+**List of Queries and Tool Calls Made**
+**Fully Comprehensive Findings**
+**List of All Relevant Sources (with citations in the report)**
+</Output Format>
+"""
+
 final_report_generation_prompt = """Based on all the research conducted, create a comprehensive, well-structured answer to the overall research brief:
 <Research Brief>
 {research_brief}
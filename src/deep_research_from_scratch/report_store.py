@@ -0,0 +1,282 @@
+"""Indexed Store for Final Research Reports.
+
+This module replaces loose ``report_<uuid>.md`` files with a report store:
+
+- A SQLite index holds the metadata of every report (research brief, brief
+  hash, creation time, size and cited sources), with indexes on creation time
+  and brief hash, so lookups stay logarithmic as the number of reports grows
+- Report bodies are kept zlib-compressed in a content-addressed blob store and
+  written atomically (temporary file and rename)
+- Async wrappers run all disk I/O in a worker thread, so graph nodes never
+  block the event loop
+- A retention policy bounds the number and age of stored reports
+
+Reports can be looked up by id, by research brief, or as the latest report.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+from typing_extensions import List, TypedDict
+
+from deep_research_from_scratch.blob_store import BlobStore
+from deep_research_from_scratch.data_dir import get_data_dir
+from deep_research_from_scratch.novelty import extract_urls
+from deep_research_from_scratch.single_flight import brief_key
+
+# ===== CONFIGURATION =====
+
+# Retention policy (None disables a limit)
+max_stored_reports: int | None = 50000
+max_report_age_days: float | None = None
+# Apply the retention policy once every this many saves, so enforcing the
+# count limit does not add a scan to every save
+retention_interval_saves = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id TEXT PRIMARY KEY,
+    brief TEXT NOT NULL,
+    brief_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sources TEXT NOT NULL,
+    body_ref TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports (created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_brief_hash ON reports (brief_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_body_ref ON reports (body_ref);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Directory earlier versions wrote loose report_<uuid>.md files to; they are
+# imported into the store once, when the store is first opened
+legacy_reports_dir = Path(__file__).resolve().parent / "files"
+legacy_report_pattern = "report_*.md"
+
+# ===== SCHEMAS =====
+
+class ReportRecord(TypedDict):
+    """Metadata of a stored report, with its body when loaded."""
+    id: str
+    brief: str
+    brief_hash: str
+    created_at: float
+    size: int
+    sources: List[str]
+    body: str | None
+
+# ===== REPORT STORE =====
+
+class ReportStore:
+    """SQLite-indexed report store with compressed, content-addressed bodies.
+
+    Each operation opens its own SQLite connection, so the store can be used
+    from worker threads.
+    """
+
+    def __init__(self, root: Path):
+        """Open (or create) the store in a directory."""
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "reports.sqlite"
+        self.bodies = BlobStore(self.root / "bodies", compress=True)
+        self._saves_since_retention = 0
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the index."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def save(self, report: str, brief: str = "") -> str:
+        """Store a report and index its metadata.
+
+        The body is written before the index row is committed, so the index
+        never points at a missing body. Both happen while holding the index's
+        write lock, so a concurrent deletion cannot remove a shared body
+        between the write and the commit.
+
+        Args:
+            report: Report body (markdown)
+            brief: Research brief the report answers
+
+        Returns:
+            Id of the stored report
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            report_id = self._insert(conn, report, brief, time.time())
+
+        self._saves_since_retention += 1
+        if self._saves_since_retention >= retention_interval_saves:
+            self._saves_since_retention = 0
+            self.apply_retention()
+        return report_id
+
+    def _insert(self, conn: sqlite3.Connection, report: str, brief: str, created_at: float) -> str:
+        """Store a report body and insert its index row inside a write transaction."""
+        report_id = str(uuid.uuid4())
+        sources = sorted(extract_urls(report))
+        body_ref = self.bodies.put(report)
+        conn.execute(
+            "INSERT INTO reports (id, brief, brief_hash, created_at, size, sources, body_ref) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (report_id, brief, brief_key(brief), created_at, len(report), json.dumps(sources), body_ref),
+        )
+        return report_id
+
+    def import_legacy_reports(self, directory: Path, pattern: str = legacy_report_pattern) -> int:
+        """Import loose report files into the store, once per store.
+
+        Each file keeps its modification time as creation time. A marker in the
+        index records the import, so later calls return without scanning.
+
+        Args:
+            directory: Directory holding the report files
+            pattern: Glob pattern of the report files
+
+        Returns:
+            Number of imported reports
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_reports_imported'").fetchone():
+                return 0
+            paths = sorted(Path(directory).glob(pattern)) if Path(directory).is_dir() else []
+            for path in paths:
+                self._insert(conn, path.read_text(encoding="utf-8"), "", path.stat().st_mtime)
+            conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_reports_imported', ?)", (str(time.time()),))
+        return len(paths)
+
+    def get(self, report_id: str, include_body: bool = True) -> ReportRecord | None:
+        """Look up a report by id."""
+        return self._fetch_one("SELECT * FROM reports WHERE id = ?", (report_id,), include_body)
+
+    def find_by_brief(self, brief: str, include_body: bool = True) -> ReportRecord | None:
+        """Look up the latest report for a research brief (compared after normalization)."""
+        return self._fetch_one(
+            "SELECT * FROM reports WHERE brief_hash = ? ORDER BY created_at DESC LIMIT 1",
+            (brief_key(brief),),
+            include_body,
+        )
+
+    def latest(self, include_body: bool = True) -> ReportRecord | None:
+        """Return the most recently stored report."""
+        return self._fetch_one("SELECT * FROM reports ORDER BY created_at DESC LIMIT 1", (), include_body)
+
+    def list_reports(self, limit: int = 20) -> List[ReportRecord]:
+        """Return the metadata of the most recent reports, newest first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM reports ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_record(row, include_body=False) for row in rows]
+
+    def delete(self, report_id: str) -> None:
+        """Delete a report and, if no other report shares it, its body."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT id, body_ref FROM reports WHERE id = ?", (report_id,)).fetchall()
+            self._delete_rows(conn, rows)
+
+    def apply_retention(self) -> int:
+        """Delete reports beyond the configured count and age limits.
+
+        Returns:
+            Number of deleted reports
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            expired = []
+            if max_report_age_days is not None:
+                cutoff = time.time() - max_report_age_days * 86400
+                expired += conn.execute("SELECT id, body_ref FROM reports WHERE created_at < ?", (cutoff,)).fetchall()
+            if max_stored_reports is not None:
+                expired += conn.execute(
+                    "SELECT id, body_ref FROM reports ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+                    (max_stored_reports,),
+                ).fetchall()
+            self._delete_rows(conn, expired)
+
+        return len({row["id"] for row in expired})
+
+    def _delete_rows(self, conn: sqlite3.Connection, rows: list) -> None:
+        """Delete index rows, and the bodies no remaining report uses.
+
+        Must run inside a write transaction (BEGIN IMMEDIATE): saves take the
+        same lock before storing a body, so no save can start referencing a
+        body between the reference check and its deletion.
+        """
+        deleted = {row["id"]: row["body_ref"] for row in rows}
+        for report_id in deleted:
+            conn.execute("DELETE FROM reports WHERE id = ?", (report_id,))
+        for body_ref in set(deleted.values()):
+            if not conn.execute("SELECT 1 FROM reports WHERE body_ref = ? LIMIT 1", (body_ref,)).fetchone():
+                self.bodies.delete(body_ref)
+
+    def _fetch_one(self, query: str, params: tuple, include_body: bool) -> ReportRecord | None:
+        """Run a single-row query and convert the result."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(query, params).fetchone()
+        return self._to_record(row, include_body) if row else None
+
+    def _to_record(self, row: sqlite3.Row, include_body: bool) -> ReportRecord:
+        """Convert an index row into a report record, loading the body if requested."""
+        return ReportRecord(
+            id=row["id"],
+            brief=row["brief"],
+            brief_hash=row["brief_hash"],
+            created_at=row["created_at"],
+            size=row["size"],
+            sources=json.loads(row["sources"]),
+            body=self.bodies.get(row["body_ref"]) if include_body else None,
+        )
+
+    # ===== ASYNC WRAPPERS =====
+
+    async def asave(self, report: str, brief: str = "") -> str:
+        """Store a report without blocking the event loop."""
+        return await asyncio.to_thread(self.save, report, brief)
+
+    async def aget(self, report_id: str, include_body: bool = True) -> ReportRecord | None:
+        """Look up a report by id without blocking the event loop."""
+        return await asyncio.to_thread(self.get, report_id, include_body)
+
+    async def afind_by_brief(self, brief: str, include_body: bool = True) -> ReportRecord | None:
+        """Look up the latest report for a brief without blocking the event loop."""
+        return await asyncio.to_thread(self.find_by_brief, brief, include_body)
+
+    async def alatest(self, include_body: bool = True) -> ReportRecord | None:
+        """Return the most recent report without blocking the event loop."""
+        return await asyncio.to_thread(self.latest, include_body)
+
+# ===== SHARED INSTANCE =====
+
+_store: ReportStore | None = None
+
+def get_report_store() -> ReportStore:
+    """Get or initialize the shared report store lazily.
+
+    The store directory defaults to ``reports`` in the data directory (see
+    data_dir.py) and can be overridden with the ``DEEP_RESEARCH_REPORT_DIR``
+    environment variable.
+    Loose report files from earlier versions are imported on first open.
+    """
+    global _store
+    if _store is None:
+        root = os.environ.get("DEEP_RESEARCH_REPORT_DIR") or str(get_data_dir() / "reports")
+        _store = ReportStore(Path(root))
+        _store.import_legacy_reports(legacy_reports_dir)
+    return _store
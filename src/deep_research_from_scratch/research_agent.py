@@ -3,85 +3,466 @@
 
 This module implements a research agent that can perform iterative web searches
 and synthesis to answer complex research questions.
+
+All nodes are async end to end (model calls, Tavily search and webpage
+summarization), so many researchers running in parallel under the supervisor
+share one event loop instead of each occupying a worker thread.
 """
 
+import asyncio
+import time
+
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage, filter_messages, get_buffer_string
+from langchain_core.runnables import RunnableConfig
 from langchain.chat_models import init_chat_model
 
-from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from deep_research_from_scratch.utils import tavily_search, get_today_str, think_tool
-from deep_research_from_scratch.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
+from deep_research_from_scratch.blob_store import offload_text
+from deep_research_from_scratch.novelty import measure_novelty
+from deep_research_from_scratch.summarization_service import summarization_deadline
+from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState, ResearchStep
+from deep_research_from_scratch.utils import (
+    tavily_search,
+    tavily_search_batch,
+    get_today_str,
+    think_tool,
+    build_tool_call,
+    compact_search_observations,
+    normalize_query,
+    find_similar_query,
+    max_batch_queries
+)
+from deep_research_from_scratch.prompts import (
+    research_agent_prompt,
+    research_agent_plan_and_act_prompt,
+    compress_research_system_prompt,
+    compress_research_human_message,
+    compress_research_chunk_message,
+    merge_compressed_research_prompt
+)
 
 # ===== CONFIGURATION =====
 
 # Set up tools and model binding
-tools = [tavily_search, think_tool]
+tools = [tavily_search, tavily_search_batch, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
 
+# Maximum number of tool calls from a single model turn that run at the same time
+max_concurrent_tool_calls = 4
+
+# Hard per-researcher caps (override per run via config["configurable"] with the same keys).
+# When a cap is hit the researcher goes straight to compress_research.
+max_react_iterations = 8 # Rounds of tool execution
+max_react_tool_calls = 20 # Total tool calls across all rounds
+max_research_seconds = 300.0 # Wall-clock time since the researcher started
+
+# Research longer than this (estimated tokens) is compressed hierarchically in chunks
+compress_chunk_threshold_tokens = 60000
+compress_chunk_tokens = 25000
+
+# Search observations from this many most recent rounds are sent to the model in full;
+# older ones are replaced by short digests in the prompt (the state keeps the full text)
+full_observation_rounds = 1
+
+TIME_BUDGET_EXHAUSTED_MESSAGE = "Tool call cancelled: the research time budget is exhausted."
+
+# Normalized queries at least this similar (Jaccard over content tokens) reuse an earlier
+# search result. Override per run via config["configurable"]["query_similarity_threshold"];
+# 1.0 only collapses queries with identical token sets.
+query_similarity_threshold = 0.8
+
+REPEATED_QUERY_NOTE = "Note: this query repeats an earlier search, so its earlier results are returned again.\n\n"
+
 # Initialize models
 model = init_chat_model("google_genai:models/gemini-flash-latest")
 model_with_tools = model.bind_tools(tools)
 summarization_model = init_chat_model("google_genai:models/gemini-flash-latest")
 compress_model = init_chat_model("google_genai:models/gemini-flash-latest") # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
 
+# Turn mode for the research loop:
+# - "tool_calling": the model calls tavily_search and think_tool as separate tools
+# - "plan_and_act": the model emits one ResearchStep per turn carrying both its
+#   reflection and its next searches, removing the think_tool round trip
+turn_mode: Literal["tool_calling", "plan_and_act"] = "tool_calling"
+
+# Search tools stay bound so earlier tavily_search calls in the history remain valid,
+# but the model is forced to answer with a ResearchStep
+plan_and_act_model = model.bind_tools([tavily_search, ResearchStep], tool_choice="ResearchStep")
+
+# ===== RESEARCH LIMITS =====
+
+def count_tool_calls(tool_calls: list) -> int:
+    """Count tool calls against the tool call cap, counting each query of a batch search."""
+    return sum(
+        len(tool_call["args"].get("queries") or []) if tool_call["name"] == "tavily_search_batch" else 1
+        for tool_call in tool_calls
+    )
+
+def get_researcher_limits(config: RunnableConfig | None = None) -> dict:
+    """Resolve the researcher caps for this run.
+
+    Args:
+        config: Runnable config whose "configurable" section may override the caps
+
+    Returns:
+        Dictionary with max_react_iterations, max_react_tool_calls and max_research_seconds
+    """
+    configurable = (config or {}).get("configurable", {})
+    return {
+        "max_react_iterations": configurable.get("max_react_iterations", max_react_iterations),
+        "max_react_tool_calls": configurable.get("max_react_tool_calls", max_react_tool_calls),
+        "max_research_seconds": configurable.get("max_research_seconds", max_research_seconds),
+    }
+
+def remaining_research_seconds(state: ResearcherState, config: RunnableConfig | None = None) -> float:
+    """Return how much of the wall-clock budget is left for this researcher."""
+    started_at = state.get("research_started_at") or time.time()
+    return get_researcher_limits(config)["max_research_seconds"] - (time.time() - started_at)
+
+def research_limit_reached(state: ResearcherState, config: RunnableConfig | None = None) -> bool:
+    """Check whether the researcher has hit any of its hard caps.
+
+    The tool call cap also counts the calls requested by the latest model turn,
+    so a turn that would overshoot the budget is not executed. Every query of a
+    tavily_search_batch call counts as one call.
+    """
+    limits = get_researcher_limits(config)
+    last_message = state["researcher_messages"][-1]
+    pending_tool_calls = count_tool_calls(getattr(last_message, "tool_calls", None) or [])
+
+    return (
+        state.get("tool_call_iterations", 0) >= limits["max_react_iterations"]
+        or state.get("tool_calls_made", 0) + pending_tool_calls > limits["max_react_tool_calls"]
+        or remaining_research_seconds(state, config) <= 0
+    )
+
 # ===== AGENT NODES =====
 
-def llm_call(state: ResearcherState):
+async def llm_call(state: ResearcherState):
     """Analyze current state and decide on next actions.
 
     The model analyzes the current conversation state and decides whether to:
     1. Call search tools to gather more information
     2. Provide a final answer based on gathered information
 
+    Older search observations are compacted into digests in the prompt so its
+    size stays bounded as the research loop grows.
+
     Returns updated state with the model's response.
     """
+    # The wall-clock budget starts with the researcher's first turn
+    started_at = state.get("research_started_at") or time.time()
+
+    if turn_mode == "plan_and_act":
+        update = await plan_and_act_call(state)
+    else:
+        update = {
+            "researcher_messages": [
+                await model_with_tools.ainvoke(
+                    [SystemMessage(content=research_agent_prompt)] + compact_search_observations(state["researcher_messages"], full_observation_rounds)
+                )
+            ]
+        }
+
+    update["research_started_at"] = started_at
+    return update
+
+async def plan_and_act_call(state: ResearcherState):
+    """Reflect and choose the next searches in a single model call.
+
+    The model answers with a ResearchStep, which is turned into an AIMessage
+    whose content is the reflection and whose tool calls are the next searches.
+    An empty list of searches produces a message without tool calls, which
+    routes the researcher to compression.
+    """
+    response = await plan_and_act_model.ainvoke(
+        [SystemMessage(content=research_agent_plan_and_act_prompt.format(date=get_today_str()))]
+        + compact_search_observations(state["researcher_messages"], full_observation_rounds)
+    )
+
+    # Fall back to the raw response if the model did not produce a ResearchStep
+    if not response.tool_calls:
+        return {"researcher_messages": [response]}
+
+    step = ResearchStep(**response.tool_calls[0]["args"])
     return {
         "researcher_messages": [
-            model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt)] + state["researcher_messages"]
+            AIMessage(
+                content=step.reflection,
+                tool_calls=[build_tool_call("tavily_search", {"query": query}) for query in step.search_queries]
             )
         ]
     }
 
-def tool_node(state: ResearcherState):
+def search_queries(tool_call: dict) -> list:
+    """Return the queries of a tavily_search or tavily_search_batch call."""
+    if tool_call["name"] == "tavily_search_batch":
+        return list(tool_call["args"].get("queries") or [])
+    return [tool_call["args"].get("query", "")]
+
+def build_query_memo(messages: list) -> list:
+    """Collect the (normalized query, result) pairs of this researcher's earlier searches.
+
+    Search tool messages carry the result of each of their queries as artifact
+    (see tool_node), so every query of a batch search is memoized with its own
+    sources, and reused results never carry repeat notes.
+    """
+    memo = []
+    for message in messages:
+        if (
+            isinstance(message, ToolMessage)
+            and message.name in ("tavily_search", "tavily_search_batch")
+            and isinstance(message.artifact, dict)
+        ):
+            memo.extend((normalize_query(query), result) for query, result in message.artifact.items())
+    return memo
+
+async def tool_node(state: ResearcherState, config: RunnableConfig):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
-    Returns updated state with tool execution results.
+    Executes all tool calls from the previous LLM responses concurrently on the
+    event loop, up to max_concurrent_tool_calls at a time, so parallel searches
+    do not wait on each other. Returns updated state with tool execution results
+    in the same order as the tool calls. Tool calls still running when the
+    researcher's wall-clock budget runs out are cancelled.
+
+    Searches that repeat an earlier query of this researcher (after
+    normalization, see utils.normalize_query) reuse the earlier result instead
+    of searching and summarizing again. Each query of a batch search is checked
+    on its own; only the new queries of a batch are searched.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
-
-    # Execute all tool calls
-    observations = []
+    semaphore = asyncio.Semaphore(max_concurrent_tool_calls)
+    time_budget = max(0.0, remaining_research_seconds(state, config))
+    similarity_threshold = (config or {}).get("configurable", {}).get(
+        "query_similarity_threshold", query_similarity_threshold
+    )
+    query_memo = build_query_memo(state["researcher_messages"])
+
+    # Searches spawned below inherit this deadline, which prioritizes their pages
+    # in the shared summarization service
+    summarization_deadline.set(time.time() + time_budget)
+
+    async def execute_tool(tool_call: dict):
+        """Run a tool call and return its output and artifact."""
+        async with semaphore:
+            tool = tools_by_name[tool_call["name"]]
+            message = await tool.ainvoke({**tool_call, "type": "tool_call"})
+            return message.content, message.artifact
+
+    async def execute_tool_within_budget(tool_call: dict):
+        try:
+            return await asyncio.wait_for(execute_tool(tool_call), timeout=time_budget)
+        except TimeoutError:
+            return TIME_BUDGET_EXHAUSTED_MESSAGE, None
+
+    async def execute_search(tool_call: dict):
+        """Run a search call and return its output and the result of each of its queries."""
+        content, artifact = await execute_tool_within_budget(tool_call)
+        if tool_call["name"] == "tavily_search_batch":
+            return content, dict(artifact or {})
+        if content == TIME_BUDGET_EXHAUSTED_MESSAGE:
+            return content, {}
+        return content, {tool_call["args"].get("query", ""): content}
+
+    async def answer_search_call(fresh, reused: list, aliases: list):
+        """Join a call's new search result with the earlier results reused for its queries.
+
+        Returns the observation and the result of each of the call's queries,
+        which becomes the tool message's artifact for later memo lookups.
+        """
+        observations, results = [], {}
+        if fresh is not None:
+            content, fresh_results = await fresh
+            observations.append(content)
+            results.update(fresh_results)
+            # Near-duplicates searched as one query share that query's result
+            results.update((query, fresh_results[searched]) for query, searched in aliases if searched in fresh_results)
+
+        repeated = []
+        for query, earlier in reused:
+            # A query searched earlier in this turn resolves to that query's own result
+            if isinstance(earlier, tuple):
+                search, earlier_query = earlier
+                search_content, search_results = await search
+                earlier = search_results.get(earlier_query, search_content)
+            results[query] = earlier
+            if earlier not in repeated:
+                repeated.append(earlier)
+        observations.extend(REPEATED_QUERY_NOTE + earlier for earlier in repeated)
+        return "\n\n".join(observations), results
+
+    # Answer repeated searches from the memo and collapse near-duplicates within this turn
+    pending = []
+    turn_queries = []
     for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+        queries = search_queries(tool_call) if tool_call["name"] in ("tavily_search", "tavily_search_batch") else []
+        # Other tools, and batches the tool itself will reject, run as requested
+        if not queries or len(queries) > max_batch_queries:
+            pending.append(execute_tool_within_budget(tool_call))
+            continue
+
+        new_queries, reused, aliases = [], [], []
+        for query in queries:
+            query_tokens = normalize_query(query)
+            earlier = (
+                find_similar_query(query_tokens, query_memo, similarity_threshold)
+                or find_similar_query(query_tokens, turn_queries, similarity_threshold)
+            )
+            if earlier is not None:
+                reused.append((query, earlier))
+                continue
+            duplicate = find_similar_query(query_tokens, new_queries, similarity_threshold)
+            if duplicate is None:
+                new_queries.append((query_tokens, query))
+            else:
+                # Near-duplicates within the same batch are searched once
+                aliases.append((query, duplicate))
+
+        fresh = None
+        if new_queries:
+            search_call = tool_call
+            if tool_call["name"] == "tavily_search_batch":
+                search_call = {**tool_call, "args": {**tool_call["args"], "queries": [query for _, query in new_queries]}}
+            fresh = asyncio.ensure_future(execute_search(search_call))
+            turn_queries.extend((query_tokens, (fresh, query)) for query_tokens, query in new_queries)
+        pending.append(answer_search_call(fresh, reused, aliases))
+
+    # Execute all tool calls concurrently (bounded); gather preserves tool call order
+    observations = await asyncio.gather(*pending)
 
     # Create tool message outputs
     tool_outputs = [
         ToolMessage(
             content=observation,
+            artifact=artifact,
             name=tool_call["name"],
             tool_call_id=tool_call["id"]
-        ) for observation, tool_call in zip(observations, tool_calls)
+        ) for (observation, artifact), tool_call in zip(observations, tool_calls)
     ]
 
-    return {"researcher_messages": tool_outputs}
+    update = {
+        "researcher_messages": tool_outputs,
+        "tool_call_iterations": state.get("tool_call_iterations", 0) + 1,
+        "tool_calls_made": state.get("tool_calls_made", 0) + count_tool_calls(tool_calls)
+    }
+
+    # Measure the marginal novelty of this round of searches (think_tool adds no information)
+    new_observations = [str(m.content) for m in tool_outputs if m.name != "think_tool"]
+    if new_observations:
+        previous_observations = [
+            str(m.content) for m in filter_messages(state["researcher_messages"], include_types="tool")
+            if m.name != "think_tool"
+        ]
+        update["novelty_metrics"] = [
+            measure_novelty(
+                new_observations,
+                previous_observations,
+                scope="researcher",
+                iteration=len(state.get("novelty_metrics", [])) + 1,
+            )
+        ]
+
+    return update
+
+def estimate_tokens(messages: list) -> int:
+    """Roughly estimate the token count of a message list (about 4 characters per token)."""
+    return sum(len(str(m.content)) for m in messages) // 4
+
+def chunk_research_messages(messages: list, max_chunk_tokens: int) -> list[list]:
+    """Split research messages into chunks that each fit the token budget.
 
-def compress_research(state: ResearcherState) -> dict:
+    Chunks only break in front of an AI message, so a tool call and its
+    results stay together unless a single round exceeds the budget by itself.
+    """
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for message in messages:
+        message_tokens = estimate_tokens([message])
+        if current and isinstance(message, AIMessage) and current_tokens + message_tokens > max_chunk_tokens:
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(message)
+        current_tokens += message_tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def compress_research_in_chunks(messages: list, research_topic: str) -> str:
+    """Compress long research hierarchically: chunks in parallel, then one merge.
+
+    Args:
+        messages: Researcher message history
+        research_topic: Topic the researcher was investigating
+
+    Returns:
+        Merged compressed findings with a single consistent source list
+    """
+    system_message = compress_research_system_prompt.format(date=get_today_str())
+    chunks = chunk_research_messages(messages, compress_chunk_tokens)
+
+    # Compress every chunk in parallel, rendered as text so each call is self-contained
+    partial_responses = await asyncio.gather(*(
+        compress_model.ainvoke([
+            SystemMessage(content=system_message),
+            HumanMessage(content=compress_research_chunk_message.format(
+                chunk_index=i,
+                chunk_count=len(chunks),
+                research_topic=research_topic,
+                messages=get_buffer_string(chunk)
+            ))
+        ])
+        for i, chunk in enumerate(chunks, 1)
+    ))
+
+    partial_findings = "\n\n".join(
+        f"<Part {i}>\n{response.content}\n</Part {i}>"
+        for i, response in enumerate(partial_responses, 1)
+    )
+
+    # Merge the partial findings, renumbering citations across parts
+    response = await compress_model.ainvoke([
+        HumanMessage(content=merge_compressed_research_prompt.format(
+            date=get_today_str(),
+            research_topic=research_topic,
+            partial_findings=partial_findings
+        ))
+    ])
+    return str(response.content)
+
+async def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
     a compressed summary suitable for the supervisor's decision-making.
+
+    Research that fits under compress_chunk_threshold_tokens is compressed in a
+    single call. Longer research is split into chunks that are compressed in
+    parallel and then merged, so compression latency grows gently with
+    research length and never overflows the model's context.
     """
 
-    system_message = compress_research_system_prompt.format(date=get_today_str())
-    messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
-    response = compress_model.invoke(messages)
+    researcher_messages = list(state.get("researcher_messages", []))
+
+    # A hard cap can stop the loop right after the model requested more tools;
+    # drop those unanswered tool calls so the message sequence stays valid
+    if researcher_messages and getattr(researcher_messages[-1], "tool_calls", None):
+        researcher_messages[-1] = AIMessage(content=researcher_messages[-1].content)
+
+    if estimate_tokens(researcher_messages) <= compress_chunk_threshold_tokens:
+        system_message = compress_research_system_prompt.format(date=get_today_str())
+        messages = [SystemMessage(content=system_message)] + researcher_messages + [HumanMessage(content=compress_research_human_message)]
+        response = await compress_model.ainvoke(messages)
+        compressed_research = str(response.content)
+    else:
+        compressed_research = await compress_research_in_chunks(researcher_messages, state.get("research_topic", ""))
 
     # Extract raw notes from tool and AI messages
     raw_notes = [
@@ -92,17 +473,19 @@ def compress_research(state: ResearcherState) -> dict:
     ]
 
     return {
-        "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        "compressed_research": compressed_research,
+        # Keep the full notes out of the graph state - only a blob reference is checkpointed
+        "raw_notes": [await asyncio.to_thread(offload_text, "\n".join(raw_notes))]
     }
 
 # ===== ROUTING LOGIC =====
 
-def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_research"]:
+def should_continue(state: ResearcherState, config: RunnableConfig) -> Literal["tool_node", "compress_research"]:
     """Determine whether to continue research or provide final answer.
 
     Determines whether the agent should continue the research loop or provide
-    a final answer based on whether the LLM made tool calls.
+    a final answer based on whether the LLM made tool calls and whether the
+    researcher is still within its hard caps.
 
     Returns:
         "tool_node": Continue to tool execution
@@ -111,12 +494,36 @@ def should_continue(state: ResearcherState) -> Literal["tool_node", "compress_re
     messages = state["researcher_messages"]
     last_message = messages[-1]
 
+    # A runaway researcher is cut off regardless of what the model asked for
+    if research_limit_reached(state, config):
+        return "compress_research"
     # If the LLM makes a tool call, continue to tool execution
     if last_message.tool_calls:
         return "tool_node"
     # Otherwise, we have a final answer
     return "compress_research"
 
+def should_continue_after_tools(state: ResearcherState, config: RunnableConfig) -> Literal["llm_call", "compress_research"]:
+    """Determine whether another research iteration is worthwhile.
+
+    Stops the research loop early when a hard cap has been reached, or when the
+    latest round of searches added too little new information (see
+    novelty.measure_novelty).
+
+    Returns:
+        "llm_call": Continue the research loop
+        "compress_research": Stop and compress research
+    """
+    novelty_metrics = state.get("novelty_metrics", [])
+
+    # No point in another model call if the researcher cannot act on it
+    if research_limit_reached(state, config):
+        return "compress_research"
+    # Marginal novelty dropped below the threshold - further searching is unlikely to help
+    if novelty_metrics and novelty_metrics[-1]["stop"]:
+        return "compress_research"
+    return "llm_call"
+
 # ===== GRAPH CONSTRUCTION =====
 
 # Build the agent workflow
@@ -137,7 +544,14 @@ agent_builder.add_conditional_edges(
         "compress_research": "compress_research", # Provide final answer
     },
 )
-agent_builder.add_edge("tool_node", "llm_call") # Loop back for more research
+agent_builder.add_conditional_edges(
+    "tool_node",
+    should_continue_after_tools,
+    {
+        "llm_call": "llm_call", # Loop back for more research
+        "compress_research": "compress_research", # Novelty exhausted
+    },
+)
 agent_builder.add_edge("compress_research", END)
 
 # Compile the agent
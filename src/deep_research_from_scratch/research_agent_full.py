@@ -19,13 +19,18 @@ from deep_research_from_scratch.utils import get_today_str
 from deep_research_from_scratch.prompts import final_report_generation_prompt
 from deep_research_from_scratch.state_scope import AgentState, AgentInputState
 from deep_research_from_scratch.research_agent_scope import clarify_with_user, write_research_brief
-from deep_research_from_scratch.multi_agent_supervisor import supervisor_agent
+from deep_research_from_scratch.multi_agent_supervisor import coalesced_supervisor
+from deep_research_from_scratch.single_flight import SingleFlight, brief_key
+from deep_research_from_scratch.report_store import get_report_store
 
 # ===== Config =====
 
 from langchain.chat_models import init_chat_model
 writer_model = init_chat_model("google_genai:models/gemini-flash-latest") # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
 
+# Concurrent report generations with identical prompts share one model call
+report_flights = SingleFlight()
+
 # ===== FINAL REPORT GENERATION =====
 
 from deep_research_from_scratch.state_scope import AgentState
@@ -47,7 +52,15 @@ async def final_report_generation(state: AgentState):
         date=get_today_str()
     )
 
-    final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+    # Runs that shared a supervisor execution have identical prompts, so they share one report too
+    async def write_report():
+        return await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
+
+    final_report, _ = await report_flights.do(brief_key(final_report_prompt), write_report)
+
+    # Every run records its report; runs that shared one get their own index row
+    # pointing at the same stored body, since bodies are content-addressed
+    await get_report_store().asave(final_report.content, brief=state.get("research_brief") or "")
 
     return {
         "final_report": final_report.content, 
@@ -61,7 +74,7 @@ deep_researcher_builder = StateGraph(AgentState, input_schema=AgentInputState)
 # Add workflow nodes
 deep_researcher_builder.add_node("clarify_with_user", clarify_with_user)
 deep_researcher_builder.add_node("write_research_brief", write_research_brief)
-deep_researcher_builder.add_node("supervisor_subgraph", supervisor_agent)
+deep_researcher_builder.add_node("supervisor_subgraph", coalesced_supervisor)
 deep_researcher_builder.add_node("final_report_generation", final_report_generation)
 
 # Add workflow edges
@@ -12,36 +12,84 @@ Key features:
 - Secure directory access with permission checking
 - Research compression for efficient processing
 - Lazy MCP client initialization for LangGraph Platform compatibility
+- Persistent, health-checked MCP server sessions shared across runs
+- Optional in-process filesystem backend with the same tool surface
+- Ranked passage search over an incrementally updated full-text index
 """
 
+import asyncio
 import os
+import shutil
 
-from typing_extensions import Literal
+from typing_extensions import Dict, Literal
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.graph import StateGraph, START, END
 
-from deep_research_from_scratch.prompts import research_agent_prompt_with_mcp, compress_research_system_prompt, compress_research_human_message
+from deep_research_from_scratch.blob_store import offload_text
+from deep_research_from_scratch.document_index import search_documents
+from deep_research_from_scratch.filesystem_tools import filesystem_tools, paging_tools
+from deep_research_from_scratch.mcp_session_pool import close_session_pool, get_session_pool
+from deep_research_from_scratch.prompts import research_agent_prompt_with_mcp, document_search_instructions, compress_research_system_prompt, compress_research_human_message
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
+from deep_research_from_scratch.tool_output import cap_tool_output
 from deep_research_from_scratch.utils import get_today_str, think_tool, get_current_dir
 
 # ===== CONFIGURATION =====
 
+# Installed filesystem server binary (the Docker image installs it globally).
+# Launching it directly skips npx's package resolution on every server start;
+# without it, npx downloads the package on first use.
+filesystem_server_binary = shutil.which("mcp-server-filesystem")
+
 # MCP server configuration for filesystem access
 mcp_config = {
     "filesystem": {
-        "command": "npx",
+        "command": filesystem_server_binary or "npx",
         "args": [
-            "-y",  # Auto-install if needed
-            "@modelcontextprotocol/server-filesystem",
+            *([] if filesystem_server_binary else [
+                "-y",  # Auto-install if needed
+                "@modelcontextprotocol/server-filesystem",
+            ]),
             str(get_current_dir() / "files")  # Path to research documents
         ],
         "transport": "stdio"  # Communication via stdin/stdout
     }
 }
 
+# Research tool backend:
+# - "mcp": tools come from the MCP servers in mcp_config
+# - "native": in-process filesystem tools over the same files directory
+#   (see filesystem_tools.py), with no server process or IPC
+research_backend: Literal["mcp", "native"] = "mcp"
+
+# Offer the search_documents tool (ranked passages from the local full-text
+# index over the files directory) alongside the backend's file tools
+use_document_index = True
+
+# Tool outputs longer than tool_output.max_tool_output_chars are truncated to one
+# page with a continuation token, so one large file does not inflate every later
+# prompt of the research loop. read_output_page serves later pages under the same limit.
+
+# Keep MCP server sessions open in a background pool and reuse them across turns
+# and concurrent runs, instead of letting the client open sessions on demand
+use_session_pool = True
+
+# Maximum number of concurrent tool calls per MCP server. A lower limit that a
+# pooled server declares itself (see mcp_session_pool.declared_concurrency_limit)
+# takes precedence, so servers that declare they cannot handle concurrent
+# requests get their calls one at a time. Servers that cannot handle concurrent
+# requests but do not declare it should be listed here with a limit of 1.
+mcp_server_limits: Dict[str, int] = {
+    "filesystem": 4,
+}
+default_mcp_server_limit = 4
+
+# Execute all tool calls of a turn one after another instead of concurrently
+sequential_tool_execution = False
+
 # Global client variable - will be initialized lazily
 _client = None
 
@@ -52,37 +100,163 @@ def get_mcp_client():
         _client = MultiServerMCPClient(mcp_config)
     return _client
 
+def reset_mcp_client():
+    """Drop the MCP client (e.g. after the server restarted) and its cached tools."""
+    global _client
+    _client = None
+    invalidate_mcp_tools()
+
+def get_mcp_session_pool():
+    """Get the persistent session pool for the MCP client."""
+    return get_session_pool(get_mcp_client(), list(mcp_config))
+
 # Initialize models
 compress_model = init_chat_model("google_genai:models/gemini-flash-latest")
 model = init_chat_model("google_genai:models/gemini-flash-latest")
 
+# ===== TOOL CACHE =====
+
+# Discovered tools and the tool-bound model, cached for the client (or pooled
+# session generation) they came from. Tool discovery is a round trip to the MCP
+# server, so it happens once per client instead of on every research iteration.
+_tools_source = None
+_tools = None
+_tool_servers: Dict[str, str] = {}
+_server_limits: Dict[str, int] = {}
+_model_with_tools = None
+
+def invalidate_mcp_tools():
+    """Forget the cached tool list and tool-bound model.
+
+    Call this when the MCP server restarts or its tool list changes; the next
+    turn rediscovers the tools and rebinds the model.
+    """
+    global _tools_source, _tools, _tool_servers, _server_limits, _model_with_tools
+    _tools_source = None
+    _tools = None
+    # Rebind instead of clearing, so tool calls in flight keep the maps they started with
+    _tool_servers = {}
+    _server_limits = {}
+    _model_with_tools = None
+
+async def get_research_tools():
+    """Get the backend's tools plus think_tool, discovering them once per client."""
+    global _tools_source, _tools, _tool_servers, _server_limits, _model_with_tools
+    if research_backend == "native":
+        source = "native"
+    elif use_session_pool:
+        pool = get_mcp_session_pool()
+        # Wait for the pooled sessions first, so a restart is reflected in the generation
+        await pool.wait_ready()
+        source = (pool, pool.generation)
+    else:
+        source = get_mcp_client()
+
+    if _tools is None or _tools_source != source:
+        # Servers only declare concurrency limits through pooled sessions
+        declared_limits = {}
+        if research_backend == "native":
+            tools_by_server = {"native": filesystem_tools}
+        elif use_session_pool:
+            tools_by_server = await pool.get_tools_by_server()
+            declared_limits = pool.get_declared_limits()
+        else:
+            tools_by_server = {name: await source.get_tools(server_name=name) for name in mcp_config}
+
+        # Paged reads work with every backend
+        tools_by_server = {**tools_by_server, "paging": paging_tools}
+        if use_document_index:
+            tools_by_server = {**tools_by_server, "document_index": [search_documents]}
+
+        _tools_source = source
+        _tools = [tool for server_tools in tools_by_server.values() for tool in server_tools] + [think_tool]
+        # Remember which server serves each tool, for per-server concurrency limits
+        _tool_servers = {
+            tool.name: server_name
+            for server_name, server_tools in tools_by_server.items()
+            for tool in server_tools
+        }
+        _server_limits = {
+            server_name: resolve_server_limit(server_name, declared_limits) for server_name in tools_by_server
+        }
+        _model_with_tools = None
+    return _tools
+
+async def get_model_with_tools():
+    """Get the model bound to the research tools, binding it once per tool list."""
+    global _model_with_tools
+    tools = await get_research_tools()
+    if _model_with_tools is None:
+        _model_with_tools = model.bind_tools(tools)
+    return _model_with_tools
+
+async def warm_up_mcp_sessions():
+    """Start the MCP servers and bind the research tools ahead of the first request.
+
+    Run this on the serving event loop at startup (see webapp.py): the session
+    pool belongs to the loop it was started on, and graph runs on that loop
+    then reuse the warm sessions instead of paying the servers' cold start.
+    """
+    await get_model_with_tools()
+
+async def close_mcp_sessions():
+    """Close the pooled MCP sessions of the current event loop, e.g. at shutdown."""
+    await close_session_pool()
+
+# ===== CONCURRENCY LIMITS =====
+
+# Per-server (limit, semaphore) pairs, shared by every run on the event loop they were created on
+_server_semaphores: Dict[str, tuple] = {}
+_semaphores_loop = None
+
+def resolve_server_limit(server_name: str, declared_limits: Dict[str, int]) -> int:
+    """Return the concurrency limit for a server: the configured one, lowered to the declared one."""
+    limit = mcp_server_limits.get(server_name, default_mcp_server_limit)
+    if server_name in declared_limits:
+        limit = min(limit, declared_limits[server_name])
+    return max(1, limit)
+
+def get_server_semaphore(server_name: str, limit: int) -> asyncio.Semaphore:
+    """Get the semaphore that bounds concurrent tool calls to one MCP server.
+
+    A new semaphore is created when the server's limit changes (e.g. after it
+    restarted with a different declared limit); calls already holding the old
+    one finish under it.
+    """
+    global _server_semaphores, _semaphores_loop
+    loop = asyncio.get_running_loop()
+    if _semaphores_loop is not loop:
+        _server_semaphores = {}
+        _semaphores_loop = loop
+    if server_name not in _server_semaphores or _server_semaphores[server_name][0] != limit:
+        _server_semaphores[server_name] = (limit, asyncio.Semaphore(limit))
+    return _server_semaphores[server_name][1]
+
 # ===== AGENT NODES =====
 
 async def llm_call(state: ResearcherState):
     """Analyze current state and decide on tool usage with MCP integration.
 
     This node:
-    1. Retrieves available tools from MCP server
-    2. Binds tools to the language model
+    1. Retrieves available tools from MCP server (cached after the first turn)
+    2. Binds tools to the language model (cached with the tools)
     3. Processes user input and decides on tool usage
 
     Returns updated state with model response.
     """
-    # Get available tools from MCP server
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
+    # Use MCP tools for local document access, bound to the model once per tool list
+    model_with_tools = await get_model_with_tools()
 
-    # Use MCP tools for local document access
-    tools = mcp_tools + [think_tool]
-
-    # Initialize model with tool binding
-    model_with_tools = model.bind_tools(tools)
+    # Describe search_documents only when it is among the bound tools
+    system_prompt = research_agent_prompt_with_mcp.format(date=get_today_str())
+    if any(tool.name == "search_documents" for tool in await get_research_tools()):
+        system_prompt += "\n\n" + document_search_instructions
 
     # Process user input with system prompt
     return {
         "researcher_messages": [
             model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt_with_mcp.format(date=get_today_str()))] + state["researcher_messages"]
+                [SystemMessage(content=system_prompt)] + state["researcher_messages"]
             )
         ]
     }
@@ -92,8 +266,8 @@ async def tool_node(state: ResearcherState):
 
     This node:
     1. Retrieves current tool calls from the last message
-    2. Executes all tool calls using async operations (required for MCP)
-    3. Returns formatted tool results
+    2. Executes all tool calls concurrently, bounded per MCP server
+    3. Returns formatted tool results in the order of the tool calls
 
     Note: MCP requires async operations due to inter-process communication
     with the MCP server subprocess. This is unavoidable.
@@ -102,23 +276,50 @@ async def tool_node(state: ResearcherState):
 
     async def execute_tools():
         """Execute all tool calls. MCP tools require async execution."""
-        # Get fresh tool references from MCP server
-        client = get_mcp_client()
-        mcp_tools = await client.get_tools()
-        tools = mcp_tools + [think_tool]
-        tools_by_name = {tool.name: tool for tool in tools}
-
-        # Execute tool calls (sequentially for reliability)
-        observations = []
-        for tool_call in tool_calls:
-            tool = tools_by_name[tool_call["name"]]
+        # Get cached tool references
+        tools_by_name = {tool.name: tool for tool in await get_research_tools()}
+
+        # An unknown tool name means the server's tool list changed - rediscover once
+        if any(tool_call["name"] not in tools_by_name for tool_call in tool_calls):
+            invalidate_mcp_tools()
+            tools_by_name = {tool.name: tool for tool in await get_research_tools()}
+
+        # Keep the maps of this tool list for the whole turn; a failing call
+        # invalidates the cache, but the other calls in flight keep their limits
+        tool_servers, server_limits = _tool_servers, _server_limits
+
+        async def execute_tool(tool_call):
+            tool = tools_by_name.get(tool_call["name"])
+            if tool is None:
+                return f"Error: tool '{tool_call['name']}' is not available."
             if tool_call["name"] == "think_tool":
                 # think_tool is sync, use regular invoke
-                observation = tool.invoke(tool_call["args"])
-            else:
-                # MCP tools are async, use ainvoke
-                observation = await tool.ainvoke(tool_call["args"])
-            observations.append(observation)
+                return tool.invoke(tool_call["args"])
+
+            # MCP tools are async, use ainvoke within the server's concurrency limit
+            server_name = tool_servers[tool_call["name"]]
+            async with get_server_semaphore(server_name, server_limits[server_name]):
+                try:
+                    return await tool.ainvoke(tool_call["args"])
+                except Exception:
+                    # The server may have died or restarted - rediscover tools next turn
+                    invalidate_mcp_tools()
+                    if research_backend == "mcp" and use_session_pool:
+                        get_mcp_session_pool().request_health_check()
+                    raise
+
+        if sequential_tool_execution:
+            observations = [await execute_tool(tool_call) for tool_call in tool_calls]
+        else:
+            # gather keeps results in tool call order
+            observations = await asyncio.gather(*(execute_tool(tool_call) for tool_call in tool_calls))
+
+        # Cap oversized outputs (MCP text blocks are joined first); the rest stays
+        # readable through read_output_page
+        observations = [
+            await asyncio.to_thread(cap_tool_output, observation)
+            for observation in observations
+        ]
 
         # Format results as tool messages
         tool_outputs = [
@@ -161,7 +362,8 @@ def compress_research(state: ResearcherState) -> dict:
 
     return {
         "compressed_research": str(response.content),
-        "raw_notes": ["\n".join(raw_notes)]
+        # Keep the full notes out of the graph state - only a blob reference is checkpointed
+        "raw_notes": [offload_text("\n".join(raw_notes))]
     }
 
 # ===== ROUTING LOGIC =====
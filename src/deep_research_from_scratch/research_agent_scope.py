@@ -5,6 +5,8 @@ This module implements the scoping phase of the research workflow, where we:
 1. Assess if the user's request needs clarification
 2. Generate a detailed research brief from the conversation
 
+In single-call scoping mode both steps are answered by one structured call.
+
 The workflow uses structured output to make deterministic decisions about
 whether sufficient context exists to proceed with research.
 """
@@ -13,12 +15,14 @@ from datetime import datetime
 from typing_extensions import Literal
 
 from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage, AIMessage, get_buffer_string
+from langchain_core.messages import HumanMessage, AIMessage
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
-from deep_research_from_scratch.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt
-from deep_research_from_scratch.state_scope import AgentState, ClarifyWithUser, ResearchQuestion, AgentInputState
+from deep_research_from_scratch.clarification_classifier import build_verification_message, clarifying_question_message, get_clarification_classifier, log_decision
+from deep_research_from_scratch.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt, scope_with_user_instructions
+from deep_research_from_scratch.scope_history import compact_scoping_history
+from deep_research_from_scratch.state_scope import AgentState, ClarifyWithUser, ResearchQuestion, ScopeDecision, AgentInputState
 
 # ===== UTILITY FUNCTIONS =====
 
@@ -34,6 +38,20 @@ def get_today_str() -> str:
 # Initialize model
 model = init_chat_model("google_genai:models/gemini-2.5-flash")
 
+# Scoping mode:
+# - "two_call": decide on clarification, then write the brief in a second call
+# - "single_call": one structured call returns either the clarifying question or
+#   the finished research brief, saving a model round trip when no clarification is needed
+scoping_mode: Literal["two_call", "single_call"] = "two_call"
+
+# Skip the clarification call when the local pre-classifier is confident that the
+# request is already well specified (see clarification_classifier.py). Opt-in:
+# the classifier's prior weights are a heuristic until trained on logged decisions
+use_clarification_classifier = False
+# Log model clarification decisions as training data for the pre-classifier
+# (opt-in; appends to the log in the classifier data directory on every scoping call)
+log_clarification_decisions = False
+
 # ===== WORKFLOW NODES =====
 
 def clarify_with_user(state: AgentState) -> Command[Literal["write_research_brief", "__end__"]]:
@@ -42,28 +60,50 @@ def clarify_with_user(state: AgentState) -> Command[Literal["write_research_brie
 
     Uses structured output to make deterministic decisions and avoid hallucination.
     Routes to either research brief generation or ends with a clarification question.
+    In single-call mode the research brief is written in the same call and handed
+    to write_research_brief through the state.
     """
+    # Well-specified requests and answered questions skip the model call entirely
+    if use_clarification_classifier and get_clarification_classifier().confident_no_clarification(state["messages"]):
+        return Command(
+            goto="write_research_brief",
+            update={
+                "messages": [AIMessage(content=build_verification_message(state["messages"]))],
+                "pending_research_brief": None,
+            }
+        )
+
+    single_call = scoping_mode == "single_call"
+
     # Set up structured output model
-    structured_output_model = model.with_structured_output(ClarifyWithUser)
+    structured_output_model = model.with_structured_output(ScopeDecision if single_call else ClarifyWithUser)
+    instructions = scope_with_user_instructions if single_call else clarify_with_user_instructions
 
     # Invoke the model with clarification instructions
     response = structured_output_model.invoke([
-        HumanMessage(content=clarify_with_user_instructions.format(
-            messages=get_buffer_string(messages=state["messages"]), 
+        HumanMessage(content=instructions.format(
+            # Earlier reports are dropped and older turns summarized to keep the prompt bounded
+            messages=compact_scoping_history(state["messages"]), 
             date=get_today_str()
         ))
     ])
 
+    if log_clarification_decisions:
+        log_decision(state["messages"], response.need_clarification)
+
     # Route based on clarification need
     if response.need_clarification:
         return Command(
             goto=END, 
-            update={"messages": [AIMessage(content=response.question)]}
+            update={"messages": [clarifying_question_message(response.question)]}
         )
     else:
         return Command(
             goto="write_research_brief", 
-            update={"messages": [AIMessage(content=response.verification)]}
+            update={
+                "messages": [AIMessage(content=response.verification)],
+                "pending_research_brief": response.research_brief if single_call else None,
+            }
         )
 
 def write_research_brief(state: AgentState):
@@ -71,23 +111,29 @@ def write_research_brief(state: AgentState):
     Transform the conversation history into a comprehensive research brief.
 
     Uses structured output to ensure the brief follows the required format
-    and contains all necessary details for effective research.
+    and contains all necessary details for effective research. A brief already
+    written by single-call scoping is used as is, without another model call.
     """
-    # Set up structured output model
-    structured_output_model = model.with_structured_output(ResearchQuestion)
+    research_brief = state.get("pending_research_brief")
 
-    # Generate research brief from conversation history
-    response = structured_output_model.invoke([
-        HumanMessage(content=transform_messages_into_research_topic_prompt.format(
-            messages=get_buffer_string(state.get("messages", [])),
-            date=get_today_str()
-        ))
-    ])
+    if not research_brief:
+        # Set up structured output model
+        structured_output_model = model.with_structured_output(ResearchQuestion)
+
+        # Generate research brief from conversation history
+        response = structured_output_model.invoke([
+            HumanMessage(content=transform_messages_into_research_topic_prompt.format(
+                messages=compact_scoping_history(state.get("messages", [])),
+                date=get_today_str()
+            ))
+        ])
+        research_brief = response.research_brief
 
     # Update state with generated research brief and pass it to the supervisor
     return {
-        "research_brief": response.research_brief,
-        "supervisor_messages": [HumanMessage(content=f"{response.research_brief}.")]
+        "research_brief": research_brief,
+        "pending_research_brief": None,
+        "supervisor_messages": [HumanMessage(content=f"{research_brief}.")]
     }
 
 # ===== GRAPH CONSTRUCTION =====
@@ -0,0 +1,120 @@
+"""Conversation History Compaction for Scoping Prompts.
+
+The scoping prompts (clarification and research brief) include the whole
+conversation. In multi-turn sessions that history also carries every earlier
+final report, so without compaction the scoping prompt grows with each turn.
+
+This module renders a bounded view of the conversation instead:
+
+- Earlier report bodies ("Here is the final report: ...") are replaced by a
+  one-line marker with the report title, and "Report saved to: ..." notices
+  are dropped
+- The most recent messages are kept verbatim
+- Older messages are condensed into a local extractive summary (leading
+  sentences of each message), without any model call
+"""
+
+import re
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    get_buffer_string,
+)
+from typing_extensions import List, Sequence
+
+# ===== CONFIGURATION =====
+
+# Number of most recent messages kept verbatim
+recent_window = 6
+
+# Recent assistant messages longer than this (in characters) are truncated
+max_recent_message_chars = 4000
+
+# Character budget for the summary of older messages
+max_summary_chars = 2000
+
+# Leading sentences kept per older message in the summary
+summary_sentences = 2
+
+REPORT_PREFIX = "Here is the final report:"
+REPORT_SAVED_PREFIX = "Report saved to:"
+
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+# ===== COMPACTION =====
+
+def report_title(report: str) -> str:
+    """Return the title of a report: its first markdown heading, or its first line."""
+    lines = [line.strip() for line in report.splitlines() if line.strip()]
+    for line in lines:
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return lines[0][:120] if lines else "untitled"
+
+def strip_report_bodies(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    """Replace delivered report bodies with short markers and drop save notices."""
+    stripped = []
+    for message in messages:
+        content = str(message.content)
+        if content.startswith(REPORT_SAVED_PREFIX):
+            continue
+        if content.startswith(REPORT_PREFIX):
+            title = report_title(content[len(REPORT_PREFIX):])
+            stripped.append(AIMessage(content=f"[A research report was delivered: {title}]"))
+            continue
+        stripped.append(message)
+    return stripped
+
+def summarize_messages(messages: Sequence[BaseMessage]) -> str:
+    """Condense older messages into their leading sentences, newest kept within budget."""
+    lines = []
+    for message in messages:
+        text = " ".join(str(message.content).split())
+        if not text:
+            continue
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
+        excerpt = " ".join(sentences[:summary_sentences])
+        if len(excerpt) > 300:
+            excerpt = excerpt[:300].rsplit(" ", 1)[0] + "..."
+        role = "Human" if isinstance(message, HumanMessage) else "AI"
+        lines.append(f"- {role}: {excerpt}")
+
+    # Keep the most recent lines when the summary is over budget
+    kept, total = [], 0
+    for line in reversed(lines):
+        if total + len(line) > max_summary_chars:
+            kept.append(f"- ({len(lines) - len(kept)} earlier messages omitted)")
+            break
+        kept.append(line)
+        total += len(line) + 1
+    return "\n".join(reversed(kept))
+
+def compact_scoping_history(messages: Sequence[BaseMessage]) -> str:
+    """Render a conversation for the scoping prompts with bounded size.
+
+    Args:
+        messages: Full conversation history
+
+    Returns:
+        Buffer string with a summary of older turns followed by the recent messages
+    """
+    messages = strip_report_bodies(messages)
+    older, recent = messages[:-recent_window], messages[-recent_window:]
+
+    recent = [
+        AIMessage(content=str(message.content)[:max_recent_message_chars] + "...")
+        if isinstance(message, AIMessage) and len(str(message.content)) > max_recent_message_chars
+        else message
+        for message in recent
+    ]
+
+    if not older:
+        return get_buffer_string(recent)
+    return (
+        "Summary of earlier conversation:\n"
+        f"{summarize_messages(older)}\n\n"
+        "Recent messages:\n"
+        f"{get_buffer_string(recent)}"
+    )
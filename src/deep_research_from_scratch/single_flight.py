@@ -0,0 +1,79 @@
+"""Single-Flight Coalescing for Identical Concurrent Work.
+
+This module lets concurrent callers that ask for the same piece of work share
+one execution. The first caller for a key starts the work; every caller that
+arrives while it is still in flight attaches to the same task and receives the
+same result (or the same exception). Once the task finishes the key is
+released, so later calls start fresh.
+
+It is used to coalesce concurrent research runs whose research briefs are
+identical after normalization, so a burst of duplicate requests costs one
+supervisor execution instead of one per request.
+"""
+
+import asyncio
+import hashlib
+import re
+import unicodedata
+
+from typing_extensions import Awaitable, Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# ===== KEY NORMALIZATION =====
+
+def normalize_brief(brief: str) -> str:
+    """Normalize a research brief so trivially different briefs compare equal.
+
+    Folds unicode forms and case, drops punctuation, and collapses whitespace.
+    """
+    text = unicodedata.normalize("NFKC", brief).casefold()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+def brief_key(brief: str) -> str:
+    """Return a compact coalescing key for a research brief."""
+    return hashlib.sha256(normalize_brief(brief).encode("utf-8")).hexdigest()
+
+# ===== SINGLE FLIGHT =====
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into one in-flight task.
+
+    The shared work runs in its own task, so a caller that is cancelled (for
+    example because its client disconnected) does not cancel the work for the
+    other callers attached to it.
+    """
+
+    def __init__(self):
+        """Create a coalescer with no work in flight."""
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run ``fn`` for ``key``, or attach to the run already in flight.
+
+        Args:
+            key: Coalescing key identifying the piece of work
+            fn: Zero-argument coroutine function that performs the work
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller's run
+        """
+        task = self._inflight.get(key)
+        shared = task is not None and task.get_loop() is asyncio.get_running_loop()
+
+        if not shared:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+
+        return await asyncio.shield(task), shared
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished task so the next call for its key starts fresh."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def inflight(self) -> int:
+        """Return the number of keys currently in flight."""
+        return len(self._inflight)
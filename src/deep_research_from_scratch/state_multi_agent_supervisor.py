@@ -31,7 +31,10 @@ class SupervisorState(TypedDict):
     # Counter tracking the number of research iterations performed
     research_iterations: int = 0
     # Raw unprocessed research notes collected from sub-agent research
+    # (large notes are stored as blob references, see blob_store.load_texts)
     raw_notes: Annotated[list[str], operator.add] = []
+    # Per-iteration novelty measurements from the supervisor and its researchers
+    novelty_metrics: Annotated[list[dict], operator.add] = []
 
 @tool
 class ConductResearch(BaseModel):
@@ -44,3 +47,17 @@ class ConductResearch(BaseModel):
 class ResearchComplete(BaseModel):
     """Tool for indicating that the research process is complete."""
     pass
+
+class SupervisorStep(BaseModel):
+    """Schema for a combined reflect-and-act supervisor turn."""
+    reflection: str = Field(
+        description="Reflection on research progress and the plan for the next step.",
+    )
+    research_topics: list[str] = Field(
+        default_factory=list,
+        description="Research topics to delegate to sub-agents in parallel. Each should be described in high detail (at least a paragraph). Leave empty when research is complete.",
+    )
+    research_complete: bool = Field(
+        default=False,
+        description="Whether the research is complete and no further delegation is needed.",
+    )
@@ -18,15 +18,21 @@ class ResearcherState(TypedDict):
     """
     State for the research agent containing message history and research metadata.
 
-    This state tracks the researcher's conversation, iteration count for limiting
-    tool calls, the research topic being investigated, compressed findings,
-    and raw research notes for detailed analysis.
+    This state tracks the researcher's conversation, iteration and tool call
+    counts plus the start time for enforcing hard caps, the research topic
+    being investigated, compressed findings, raw research notes for detailed
+    analysis, and per-iteration novelty metrics used for adaptive stopping.
+    Large raw notes are kept in the blob store and only their references are
+    held in the state.
     """
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
     tool_call_iterations: int
+    tool_calls_made: int
+    research_started_at: float
     research_topic: str
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    novelty_metrics: Annotated[List[dict], operator.add]
 
 class ResearcherOutputState(TypedDict):
     """
@@ -37,6 +43,7 @@ class ResearcherOutputState(TypedDict):
     """
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    novelty_metrics: Annotated[List[dict], operator.add]
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
 
 # ===== STRUCTURED OUTPUT SCHEMAS =====
@@ -59,7 +66,27 @@ class ResearchQuestion(BaseModel):
         description="A research question that will be used to guide the research.",
     )
 
+class ResearchStep(BaseModel):
+    """Schema for a combined reflect-and-act researcher turn."""
+    reflection: str = Field(
+        description="Reflection on research progress: what was found, what is missing, and whether to keep searching.",
+    )
+    search_queries: List[str] = Field(
+        default_factory=list,
+        description="Search queries to run next, in parallel. Leave empty when research is complete.",
+    )
+
 class Summary(BaseModel):
     """Schema for webpage content summarization."""
     summary: str = Field(description="Concise summary of the webpage content")
     key_excerpts: str = Field(description="Important quotes and excerpts from the content")
+
+class PageSummary(BaseModel):
+    """Schema for the summary of one webpage in a multi-page summarization request."""
+    url: str = Field(description="URL of the summarized webpage, exactly as given")
+    summary: str = Field(description="Concise summary of the webpage content")
+    key_excerpts: str = Field(description="Important quotes and excerpts from the content")
+
+class PageSummaries(BaseModel):
+    """Schema for summarizing several webpages in one request."""
+    summaries: List[PageSummary] = Field(description="One summary per webpage")
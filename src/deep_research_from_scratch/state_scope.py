@@ -6,7 +6,7 @@ the research agent scoping workflow, including researcher state management and o
 """
 
 import operator
-from typing_extensions import Optional, Annotated, List, Sequence
+from typing_extensions import Annotated, List, Sequence
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph import MessagesState
@@ -29,13 +29,19 @@ class AgentState(MessagesState):
     """
 
     # Research brief generated from user conversation history
-    research_brief: Optional[str]
+    research_brief: str | None
+    # Brief produced together with the clarification decision in single-call scoping,
+    # waiting to be picked up by write_research_brief
+    pending_research_brief: str | None
     # Messages exchanged with the supervisor agent for coordination
     supervisor_messages: Annotated[Sequence[BaseMessage], add_messages]
     # Raw unprocessed research notes collected during the research phase
+    # (large notes are stored as blob references, see blob_store.load_texts)
     raw_notes: Annotated[list[str], operator.add] = []
     # Processed and structured notes ready for report generation
     notes: Annotated[list[str], operator.add] = []
+    # Per-iteration novelty measurements recorded during research
+    novelty_metrics: Annotated[list[dict], operator.add] = []
     # Final formatted research report
     final_report: str
 
@@ -54,6 +60,22 @@ class ClarifyWithUser(BaseModel):
         description="Verify message that we will start research after the user has provided the necessary information.",
     )
 
+class ScopeDecision(BaseModel):
+    """Schema for a clarification decision and research brief produced in one call."""
+
+    need_clarification: bool = Field(
+        description="Whether the user needs to be asked a clarifying question.",
+    )
+    question: str = Field(
+        description="A question to ask the user to clarify the report scope",
+    )
+    verification: str = Field(
+        description="Verify message that we will start research after the user has provided the necessary information.",
+    )
+    research_brief: str = Field(
+        description="A research question that will be used to guide the research. Empty if clarification is needed.",
+    )
+
 class ResearchQuestion(BaseModel):
     """Schema for structured research brief generation."""
 
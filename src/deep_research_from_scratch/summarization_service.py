@@ -0,0 +1,180 @@
+"""Run-Wide Micro-Batching Summarization Service.
+
+This module coordinates webpage summarization across all researchers running
+in a process. Instead of every researcher sending its own small, uncoordinated
+summarization requests, pages are submitted to a shared queue and a scheduler:
+
+- Micro-batches queued pages into packed multi-page requests
+  (see utils.asummarize_webpages_packed)
+- Deduplicates in flight: the same URL submitted twice waits on one future
+- Prioritizes pages by the submitting researcher's deadline (earliest first)
+- Feeds the model at a controlled rate, with a cap on concurrent batches
+
+The service belongs to the event loop it was created on; get_summarization_service
+returns the instance for the running loop.
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+from contextvars import ContextVar
+
+from typing_extensions import Awaitable, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ===== CONFIGURATION =====
+
+# Maximum number of pages combined into one micro-batch
+max_batch_pages = 8
+# How long the scheduler waits for more pages before dispatching a partial batch
+max_batch_wait_seconds = 0.05
+# Maximum number of batches being summarized at the same time
+max_concurrent_batches = 4
+# Maximum rate of batch dispatches (None for no limit)
+max_batches_per_second: float | None = None
+
+# Deadline (wall-clock time) of the researcher currently submitting pages.
+# Set by the researcher's tool node; tasks it spawns inherit the value.
+summarization_deadline: ContextVar[float] = ContextVar("summarization_deadline", default=math.inf)
+
+# ===== SERVICE =====
+
+class SummarizationService:
+    """Shared queue that micro-batches, deduplicates and paces page summarization."""
+
+    def __init__(
+        self,
+        summarize_batch: Callable[[Dict[str, str]], Awaitable[Dict[str, str]]],
+        batch_pages: int = 8,
+        batch_wait_seconds: float = 0.05,
+        concurrent_batches: int = 4,
+        batches_per_second: float | None = None,
+    ):
+        """Create the service; its scheduler starts with the first submitted page.
+
+        Args:
+            summarize_batch: Coroutine that summarizes a {url: content} batch into {url: summary}
+            batch_pages: Maximum number of pages per micro-batch
+            batch_wait_seconds: How long to wait for more pages before dispatching a partial batch
+            concurrent_batches: Maximum number of batches being summarized at the same time
+            batches_per_second: Maximum rate of batch dispatches (None for no limit)
+        """
+        self.summarize_batch = summarize_batch
+        self.batch_pages = batch_pages
+        self.batch_wait_seconds = batch_wait_seconds
+        self.min_dispatch_interval = 1.0 / batches_per_second if batches_per_second else 0.0
+
+        self._queue: asyncio.PriorityQueue[Tuple[float, int, str]] = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._contents: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._batch_slots = asyncio.Semaphore(concurrent_batches)
+        self._last_dispatch = 0.0
+        self._scheduler: asyncio.Task | None = None
+        self._batch_tasks: set = set()
+
+    async def summarize(self, url: str, content: str, deadline: float = math.inf) -> str:
+        """Submit a page for summarization and wait for its summary.
+
+        Args:
+            url: URL of the page, used as the deduplication key
+            content: Raw page content
+            deadline: Wall-clock time by which the submitter needs the result
+
+        Returns:
+            Formatted summary of the page
+        """
+        future = self._inflight.get(url)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[url] = future
+            self._contents[url] = content
+            self._queue.put_nowait((deadline, next(self._sequence), url))
+            self._ensure_scheduler()
+
+        # Shield the shared future so one cancelled submitter does not cancel it for the others
+        return await asyncio.shield(future)
+
+    def _ensure_scheduler(self) -> None:
+        """Start the scheduler task if it is not running (it stops whenever the queue runs empty)."""
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.get_running_loop().create_task(self._schedule())
+
+    async def _schedule(self) -> None:
+        """Collect queued pages into micro-batches and dispatch them at a controlled rate.
+
+        The scheduler exits as soon as the queue is empty, so no task is left
+        pending when the event loop closes; the next submitted page starts it again.
+        """
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+
+            # Keep collecting until the batch is full or the wait window closes
+            window_end = loop.time() + self.batch_wait_seconds
+            while len(batch) < self.batch_pages:
+                remaining = window_end - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except TimeoutError:
+                    break
+
+            # Pace dispatches and bound the number of batches in flight
+            await self._batch_slots.acquire()
+            wait = self._last_dispatch + self.min_dispatch_interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_dispatch = loop.time()
+
+            task = loop.create_task(self._run_batch([url for _, _, url in batch]))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, urls: List[str]) -> None:
+        """Summarize one micro-batch and resolve the futures waiting on it."""
+        try:
+            pages = {url: self._contents[url] for url in urls}
+            try:
+                summaries = await self.summarize_batch(pages)
+            except Exception as e:
+                logger.warning("Failed to summarize batch: %s", e)
+                summaries = {}
+
+            for url in urls:
+                future = self._inflight.pop(url)
+                content = self._contents.pop(url)
+                if not future.done():
+                    fallback = content[:1000] + "..." if len(content) > 1000 else content
+                    future.set_result(summaries.get(url, fallback))
+        finally:
+            self._batch_slots.release()
+
+    def pending(self) -> int:
+        """Return the number of pages submitted but not yet summarized."""
+        return len(self._inflight)
+
+# ===== SHARED INSTANCE =====
+
+_service: SummarizationService | None = None
+_service_loop: asyncio.AbstractEventLoop | None = None
+
+def get_summarization_service() -> SummarizationService:
+    """Get or create the summarization service for the running event loop."""
+    global _service, _service_loop
+    loop = asyncio.get_running_loop()
+    if _service is None or _service_loop is not loop:
+        from deep_research_from_scratch.utils import asummarize_webpages_packed
+
+        _service = SummarizationService(
+            asummarize_webpages_packed,
+            batch_pages=max_batch_pages,
+            batch_wait_seconds=max_batch_wait_seconds,
+            concurrent_batches=max_concurrent_batches,
+            batches_per_second=max_batches_per_second,
+        )
+        _service_loop = loop
+    return _service
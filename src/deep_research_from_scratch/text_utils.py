@@ -0,0 +1,14 @@
+"""Shared Text Processing Helpers.
+
+Word lists used by more than one module that tokenizes research text, such as
+novelty tracking and the document index.
+"""
+
+# ===== WORD LISTS =====
+
+# Common English function words that carry no topical information
+STOPWORDS = frozenset("""
+a an and are as at be been but by for from has have in into is it its of on or
+that the their there these this to was were which with will would can could
+also than then they them he she we you i our your not no
+""".split())
@@ -0,0 +1,97 @@
+"""Size Cap for Tool Outputs.
+
+Tool outputs are kept in the research conversation and re-sent with every
+later model call, so one large file read can inflate every following prompt.
+This module caps a single tool output at a fixed number of characters: longer
+outputs are returned one page at a time, and the full output is kept in the
+blob store so later pages can be read back with the read_output_page tool.
+
+Outputs come in two shapes: plain strings (native tools) and lists of content
+blocks such as ``{"type": "text", "text": ...}`` (MCP tools). Text blocks are
+joined into one string before the cap is applied.
+"""
+
+from typing_extensions import Any
+
+from deep_research_from_scratch.blob_store import get_blob_store
+
+# ===== CONFIGURATION =====
+
+# Maximum number of characters of a single tool output kept in the conversation,
+# continuation note included. The same limit sizes the pages of read_output_page.
+max_tool_output_chars = 12000
+
+# Characters of every page reserved for the continuation note
+page_note_chars = 256
+
+# ===== CONTENT HANDLING =====
+
+def content_to_text(content: Any) -> str | None:
+    """Turn tool output content into a single string.
+
+    Args:
+        content: A string, or a list of strings and content blocks
+
+    Returns:
+        The joined text, or None if the content holds non-text blocks (such as images)
+    """
+    if isinstance(content, str):
+        return content
+    if not isinstance(content, list):
+        return None
+
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(str(block.get("text", "")))
+        else:
+            return None
+    return "\n".join(parts)
+
+def paginate_output(text: str, offset: int = 0, limit: int | None = None) -> str:
+    """Return one page of a tool output, with a continuation token if more follows.
+
+    The full output is kept in the blob store, so the continuation token is the
+    output's blob reference and later pages are read back from disk.
+
+    Args:
+        text: Complete tool output
+        offset: Character offset of the page to return
+        limit: Maximum size of the returned page including its note
+            (defaults to max_tool_output_chars)
+
+    Returns:
+        The page, followed by a note on how to read the next page when truncated
+    """
+    limit = max_tool_output_chars if limit is None else limit
+    if offset == 0 and len(text) <= limit:
+        return text
+
+    end = min(offset + max(1, limit - page_note_chars), len(text))
+    page = text[offset:end]
+    if end >= len(text):
+        return page + f"\n\n[End of output: characters {offset}-{end} of {len(text)}.]"
+
+    token = get_blob_store().put(text)
+    return page + (
+        f"\n\n[Output truncated: characters {offset}-{end} of {len(text)}. "
+        f"To continue, call read_output_page(token=\"{token}\", offset={end}).]"
+    )
+
+def cap_tool_output(content: Any, limit: int | None = None) -> Any:
+    """Cap a tool output to its first page if it is too long.
+
+    Args:
+        content: Tool output, as a string or a list of content blocks
+        limit: Maximum output size in characters (defaults to max_tool_output_chars)
+
+    Returns:
+        The content unchanged if it fits (or is not text), otherwise its first page as a string
+    """
+    limit = max_tool_output_chars if limit is None else limit
+    text = content_to_text(content)
+    if text is None or len(text) <= limit:
+        return content
+    return paginate_output(text, 0, limit)
@@ -5,18 +5,26 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import asyncio
+import logging
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing_extensions import Annotated, List, Literal
+from typing_extensions import Annotated, Dict, List, Literal, Tuple
 
 from langchain.chat_models import init_chat_model 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import tool, InjectedToolArg
-from tavily import TavilyClient
+from langchain_core.tools import InjectedToolArg, StructuredTool, ToolException
+from tavily import TavilyClient, AsyncTavilyClient
 
-from deep_research_from_scratch.state_research import Summary
-from deep_research_from_scratch.prompts import summarize_webpage_prompt
+from deep_research_from_scratch.state_research import Summary, PageSummaries
+from deep_research_from_scratch.prompts import summarize_webpage_prompt, summarize_webpages_batch_prompt
+from deep_research_from_scratch.summarization_service import get_summarization_service, summarization_deadline
+
+logger = logging.getLogger(__name__)
 
 # ===== UTILITY FUNCTIONS =====
 
@@ -41,10 +49,58 @@ def get_current_dir() -> Path:
     except NameError:  # __file__ is not defined
         return Path.cwd()
 
+def build_tool_call(name: str, args: dict) -> dict:
+    """Build a tool call dictionary for an AIMessage emitted on the model's behalf.
+
+    Args:
+        name: Name of the tool to call
+        args: Arguments for the tool call
+
+    Returns:
+        Tool call dictionary with a unique call id
+    """
+    return {
+        "name": name,
+        "args": args,
+        "id": f"call_{uuid.uuid4().hex[:24]}",
+        "type": "tool_call",
+    }
+
 # ===== CONFIGURATION =====
 
 summarization_model = init_chat_model("google_genai:models/gemini-flash-latest")
 tavily_client = TavilyClient()
+async_tavily_client = AsyncTavilyClient()
+
+# Webpage summarization mode:
+# - "per_page": one summarization request per webpage
+# - "packed": short-to-medium webpages are packed into shared requests
+#   (see summarize_webpages_packed), cutting request count and repeated instructions
+# - "service": async searches submit webpages to the run-wide summarization service,
+#   which micro-batches pages across all researchers (sync searches use "packed")
+summarization_mode: Literal["per_page", "packed", "service"] = "per_page"
+
+# Webpages estimated above this many tokens are always summarized on their own
+max_packed_page_tokens = 6000
+# Token budget for the webpage content packed into one summarization request
+summary_pack_token_budget = 24000
+
+# Search mode:
+# - "full": every search result is returned with its raw page content
+# - "two_phase": search returns snippets only, results are scored locally, and raw
+#   content is fetched (via Tavily extract) just for the results worth reading
+search_mode: Literal["full", "two_phase"] = "full"
+
+# Maximum number of pages read in full per search tool call in two-phase mode
+two_phase_max_reads = 4
+# Minimum local relevance score (0-1) for a result to be read in full
+two_phase_min_score = 0.3
+
+# Maximum number of queries in one tavily_search_batch call
+max_batch_queries = 5
+
+# Maximum number of Tavily searches of one call running at the same time
+max_concurrent_searches = 5
 
 # ===== SEARCH FUNCTIONS =====
 
@@ -66,18 +122,50 @@ def tavily_search_multiple(
         List of search result dictionaries
     """
 
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
-    search_docs = []
-    for query in search_queries:
-        result = tavily_client.search(
+    if not search_queries:
+        return []
+
+    def search(query: str) -> dict:
+        return tavily_client.search(
             query,
             max_results=max_results,
             include_raw_content=include_raw_content,
             topic=topic
         )
-        search_docs.append(result)
 
-    return search_docs
+    # Execute searches in parallel worker threads (map keeps the query order)
+    with ThreadPoolExecutor(max_workers=min(max_concurrent_searches, len(search_queries))) as executor:
+        return list(executor.map(search, search_queries))
+
+async def atavily_search_multiple(
+    search_queries: List[str], 
+    max_results: int = 3, 
+    topic: Literal["general", "news", "finance"] = "general", 
+    include_raw_content: bool = True, 
+) -> List[dict]:
+    """Perform search using the async Tavily API for multiple queries in parallel.
+
+    Args:
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+
+    Returns:
+        List of search result dictionaries, in the same order as the queries
+    """
+    semaphore = asyncio.Semaphore(max_concurrent_searches)
+
+    async def search(query: str) -> dict:
+        async with semaphore:
+            return await async_tavily_client.search(
+                query,
+                max_results=max_results,
+                include_raw_content=include_raw_content,
+                topic=topic
+            )
+
+    return await asyncio.gather(*(search(query) for query in search_queries))
 
 def summarize_webpage_content(webpage_content: str) -> str:
     """Summarize webpage content using the configured summarization model.
@@ -101,33 +189,178 @@ def summarize_webpage_content(webpage_content: str) -> str:
         ])
 
         # Format summary with clear structure
-        formatted_summary = (
-            f"<summary>\n{summary.summary}\n</summary>\n\n"
-            f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
-        )
+        return format_webpage_summary(summary)
 
-        return formatted_summary
+    except Exception as e:
+        logger.warning("Failed to summarize webpage: %s", e)
+        return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+
+async def asummarize_webpage_content(webpage_content: str) -> str:
+    """Summarize webpage content asynchronously using the configured summarization model.
+
+    Args:
+        webpage_content: Raw webpage content to summarize
+
+    Returns:
+        Formatted summary with key excerpts
+    """
+    try:
+        structured_model = summarization_model.with_structured_output(Summary)
+
+        summary = await structured_model.ainvoke([
+            HumanMessage(content=summarize_webpage_prompt.format(
+                webpage_content=webpage_content, 
+                date=get_today_str()
+            ))
+        ])
+
+        return format_webpage_summary(summary)
 
     except Exception as e:
-        print(f"Failed to summarize webpage: {str(e)}")
+        logger.warning("Failed to summarize webpage: %s", e)
         return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
 
-def deduplicate_search_results(search_results: List[dict]) -> dict:
+def format_webpage_summary(summary) -> str:
+    """Format a structured webpage summary with clear structure."""
+    return (
+        f"<summary>\n{summary.summary}\n</summary>\n\n"
+        f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
+    )
+
+def pack_webpages(webpages: dict) -> List[List[str]]:
+    """Group webpages into summarization requests that fit the token budget.
+
+    Webpages are packed first-fit in order of decreasing size. Webpages too large
+    to pack end up in a group of their own.
+
+    Args:
+        webpages: Dictionary mapping URLs to raw webpage content
+
+    Returns:
+        List of URL groups, one per summarization request
+    """
+    groups = []
+    group_tokens = []
+
+    for url in sorted(webpages, key=lambda u: len(webpages[u]), reverse=True):
+        tokens = len(webpages[url]) // 4
+        if tokens > max_packed_page_tokens:
+            groups.append([url])
+            group_tokens.append(summary_pack_token_budget)
+            continue
+        for i, used in enumerate(group_tokens):
+            if used + tokens <= summary_pack_token_budget:
+                groups[i].append(url)
+                group_tokens[i] += tokens
+                break
+        else:
+            groups.append([url])
+            group_tokens.append(tokens)
+
+    return groups
+
+def format_packed_webpages(webpages: dict, urls: List[str]) -> str:
+    """Render a group of webpages for the multi-page summarization prompt."""
+    return "\n\n".join(
+        f'<webpage url="{url}">\n{webpages[url]}\n</webpage>' for url in urls
+    )
+
+def summarize_webpages_packed(webpages: dict) -> dict:
+    """Summarize several webpages with as few summarization requests as possible.
+
+    Args:
+        webpages: Dictionary mapping URLs to raw webpage content
+
+    Returns:
+        Dictionary mapping URLs to formatted summaries
+    """
+    structured_model = summarization_model.with_structured_output(PageSummaries)
+    summaries = {}
+
+    for urls in pack_webpages(webpages):
+        if len(urls) == 1:
+            summaries[urls[0]] = summarize_webpage_content(webpages[urls[0]])
+            continue
+        try:
+            response = structured_model.invoke([
+                HumanMessage(content=summarize_webpages_batch_prompt.format(
+                    webpages=format_packed_webpages(webpages, urls),
+                    date=get_today_str()
+                ))
+            ])
+            for page in response.summaries:
+                if page.url in webpages:
+                    summaries[page.url] = format_webpage_summary(page)
+        except Exception as e:
+            logger.warning("Failed to summarize packed webpages: %s", e)
+
+    # Any webpage the packed response missed is summarized on its own
+    for url in webpages:
+        if url not in summaries:
+            summaries[url] = summarize_webpage_content(webpages[url])
+
+    return summaries
+
+async def asummarize_webpages_packed(webpages: dict) -> dict:
+    """Summarize several webpages asynchronously with as few requests as possible.
+
+    Args:
+        webpages: Dictionary mapping URLs to raw webpage content
+
+    Returns:
+        Dictionary mapping URLs to formatted summaries
+    """
+    structured_model = summarization_model.with_structured_output(PageSummaries)
+
+    async def summarize_group(urls: List[str]) -> dict:
+        if len(urls) == 1:
+            return {urls[0]: await asummarize_webpage_content(webpages[urls[0]])}
+        try:
+            response = await structured_model.ainvoke([
+                HumanMessage(content=summarize_webpages_batch_prompt.format(
+                    webpages=format_packed_webpages(webpages, urls),
+                    date=get_today_str()
+                ))
+            ])
+            group_summaries = {
+                page.url: format_webpage_summary(page)
+                for page in response.summaries if page.url in urls
+            }
+        except Exception as e:
+            logger.warning("Failed to summarize packed webpages: %s", e)
+            group_summaries = {}
+
+        # Any webpage the packed response missed is summarized on its own
+        missing = [url for url in urls if url not in group_summaries]
+        fallbacks = await asyncio.gather(*(asummarize_webpage_content(webpages[url]) for url in missing))
+        group_summaries.update(zip(missing, fallbacks))
+        return group_summaries
+
+    summaries = {}
+    for group_summaries in await asyncio.gather(*(summarize_group(urls) for urls in pack_webpages(webpages))):
+        summaries.update(group_summaries)
+    return summaries
+
+def deduplicate_search_results(search_results: List[dict], queries: List[str] | None = None) -> dict:
     """Deduplicate search results by URL to avoid processing duplicate content.
 
     Args:
         search_results: List of search result dictionaries
+        queries: Queries the responses belong to, in the same order; when given,
+            each unique result lists the queries that found it under "queries"
 
     Returns:
         Dictionary mapping URLs to unique results
     """
     unique_results = {}
 
-    for response in search_results:
+    for i, response in enumerate(search_results):
         for result in response['results']:
             url = result['url']
             if url not in unique_results:
-                unique_results[url] = result
+                unique_results[url] = {**result, "queries": []} if queries is not None else result
+            if queries is not None:
+                unique_results[url]["queries"].append(queries[i])
 
     return unique_results
 
@@ -142,10 +375,19 @@ def process_search_results(unique_results: dict) -> dict:
     """
     summarized_results = {}
 
+    # In packed mode, summarize all raw pages up front in as few requests as possible
+    packed_summaries = None
+    if summarization_mode in ("packed", "service"):
+        packed_summaries = summarize_webpages_packed({
+            url: result["raw_content"] for url, result in unique_results.items() if result.get("raw_content")
+        })
+
     for url, result in unique_results.items():
         # Use existing content if no raw content for summarization
         if not result.get("raw_content"):
             content = result['content']
+        elif packed_summaries is not None:
+            content = packed_summaries[url]
         else:
             # Summarize raw content for better processing
             content = summarize_webpage_content(result['raw_content'])
@@ -157,6 +399,48 @@ def process_search_results(unique_results: dict) -> dict:
 
     return summarized_results
 
+async def aprocess_search_results(unique_results: dict) -> dict:
+    """Process search results asynchronously, summarizing all pages in parallel.
+
+    Args:
+        unique_results: Dictionary of unique search results
+
+    Returns:
+        Dictionary of processed results with summaries, in the original order
+    """
+    if summarization_mode == "service":
+        # Pages are micro-batched with other researchers' pages, most urgent deadline first
+        service = get_summarization_service()
+        deadline = summarization_deadline.get()
+
+        async def submit_result(url: str, result: dict) -> str:
+            if not result.get("raw_content"):
+                return result['content']
+            return await service.summarize(url, result['raw_content'], deadline)
+
+        contents = await asyncio.gather(*(submit_result(url, result) for url, result in unique_results.items()))
+    elif summarization_mode == "packed":
+        packed_summaries = await asummarize_webpages_packed({
+            url: result["raw_content"] for url, result in unique_results.items() if result.get("raw_content")
+        })
+        contents = [
+            packed_summaries[url] if result.get("raw_content") else result['content']
+            for url, result in unique_results.items()
+        ]
+    else:
+        async def process_result(result: dict) -> str:
+            # Use existing content if no raw content for summarization
+            if not result.get("raw_content"):
+                return result['content']
+            return await asummarize_webpage_content(result['raw_content'])
+
+        contents = await asyncio.gather(*(process_result(result) for result in unique_results.values()))
+
+    return {
+        url: {'title': result['title'], 'content': content}
+        for (url, result), content in zip(unique_results.items(), contents)
+    }
+
 def format_search_output(summarized_results: dict) -> str:
     """Format search results into a well-structured string output.
 
@@ -179,10 +463,282 @@ def format_search_output(summarized_results: dict) -> str:
 
     return formatted_output
 
+def format_search_output_by_query(queries: List[str], unique_results: dict, summarized_results: dict) -> dict:
+    """Format the results of a multi-query search separately for each query.
+
+    Args:
+        queries: Queries of the search
+        unique_results: Unique results, listing the queries that found them (see deduplicate_search_results)
+        summarized_results: Processed results of the whole search
+
+    Returns:
+        Dictionary mapping each query to the formatted output of its own results
+    """
+    return {
+        query: format_search_output({
+            url: result for url, result in summarized_results.items()
+            if query in unique_results.get(url, {}).get("queries", [])
+        })
+        for query in queries
+    }
+
+# ===== QUERY MEMOIZATION =====
+
+QUERY_STOPWORDS = frozenset("""
+a an and are as at be by about for from how in is it of on or the to what when where which who why with
+""".split())
+
+def normalize_query(query: str) -> frozenset:
+    """Normalize a search query to its set of content tokens.
+
+    Case, punctuation, word order and common stop words are ignored, and simple
+    plurals are folded, so trivially rephrased queries normalize to the same set.
+    """
+    tokens = set()
+    for token in re.findall(r"[a-z0-9]+", query.lower()):
+        if token in QUERY_STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+def query_similarity(first: frozenset, second: frozenset) -> float:
+    """Return the Jaccard similarity of two normalized queries."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+def find_similar_query(tokens: frozenset, memo: list, threshold: float):
+    """Find the memoized result of the most similar earlier query.
+
+    Args:
+        tokens: Normalized query to look up
+        memo: List of (normalized query, result) pairs
+        threshold: Minimum similarity for a query to count as a near-duplicate
+
+    Returns:
+        The result stored for the most similar query (the earliest one on ties),
+        or None if none is close enough
+    """
+    best_result = None
+    best_similarity = threshold
+    for memo_tokens, result in memo:
+        similarity = query_similarity(tokens, memo_tokens)
+        if similarity > best_similarity or (best_result is None and similarity == best_similarity):
+            best_result, best_similarity = result, similarity
+    return best_result
+
+# ===== OBSERVATION COMPACTION =====
+
+SOURCE_BLOCK_PATTERN = re.compile(
+    r"--- SOURCE \d+: (?P<title>.*?) ---\nURL: (?P<url>\S+)\n\nSUMMARY:\n(?P<summary>.*?)(?=\n-{80}|\Z)",
+    re.DOTALL,
+)
+
+def digest_search_output(search_output: str, max_fact_chars: int = 200) -> str:
+    """Reduce a formatted search output to a short digest of its sources.
+
+    Keeps each source's title and URL plus the opening of its summary as the key
+    fact, which is enough for the model to remember what was already found
+    without re-reading every page summary.
+
+    Args:
+        search_output: Output of format_search_output
+        max_fact_chars: Maximum length of the key fact kept per source
+
+    Returns:
+        Digest listing one line per source
+    """
+    sources = list(SOURCE_BLOCK_PATTERN.finditer(search_output))
+    if not sources:
+        return search_output[:max_fact_chars * 2]
+
+    digest = "Search results (digest of an earlier search):\n"
+    for i, source in enumerate(sources, 1):
+        summary = re.sub(r"</?(summary|key_excerpts)>", "", source.group("summary"))
+        key_fact = " ".join(summary.split())
+        if len(key_fact) > max_fact_chars:
+            key_fact = key_fact[:max_fact_chars].rsplit(" ", 1)[0] + "..."
+        digest += f"[{i}] {source.group('title').strip()} - {source.group('url')}\n    {key_fact}\n"
+
+    return digest
+
+def compact_search_observations(
+    messages: List[BaseMessage],
+    full_rounds: int = 1,
+    min_compact_chars: int = 1500,
+) -> List[BaseMessage]:
+    """Replace older search observations with digests in a prompt's message list.
+
+    Only the prompt sent to the model is compacted - the state keeps the full
+    observations for compress_research. Tool results from the most recent
+    full_rounds model turns are left untouched.
+
+    Args:
+        messages: Researcher message history
+        full_rounds: Number of most recent tool-calling rounds kept in full
+        min_compact_chars: Observations shorter than this are kept as they are
+
+    Returns:
+        New message list with older search observations digested
+    """
+    # Tool results after the n-th most recent tool-calling AI message stay in full
+    round_starts = [i for i, m in enumerate(messages) if isinstance(m, AIMessage) and m.tool_calls]
+    if len(round_starts) <= full_rounds:
+        return list(messages)
+    keep_from = round_starts[-full_rounds] if full_rounds > 0 else len(messages)
+
+    compacted = []
+    for i, message in enumerate(messages):
+        if (
+            i < keep_from
+            and isinstance(message, ToolMessage)
+            and message.name in ("tavily_search", "tavily_search_batch")
+            and len(str(message.content)) >= min_compact_chars
+        ):
+            message = message.model_copy(update={"content": digest_search_output(str(message.content))})
+        compacted.append(message)
+
+    return compacted
+
+# ===== TWO-PHASE SEARCH =====
+
+def score_search_result(result: dict, queries: List[str]) -> float:
+    """Score a snippet-only search result for how worth reading in full it is.
+
+    Combines Tavily's own relevance score with how many of the query's content
+    terms appear in the result title and snippet (best match across queries).
+
+    Args:
+        result: Search result with "title", "content" and optionally "score"
+        queries: Queries the search was run for
+
+    Returns:
+        Relevance score between 0 and 1
+    """
+    result_tokens = normalize_query(f"{result.get('title', '')} {result.get('content', '')}")
+    overlap = 0.0
+    for query in queries:
+        query_tokens = normalize_query(query)
+        if query_tokens:
+            overlap = max(overlap, len(query_tokens & result_tokens) / len(query_tokens))
+    return 0.5 * float(result.get("score") or 0.0) + 0.5 * overlap
+
+def select_results_to_read(unique_results: dict, queries: List[str]) -> List[str]:
+    """Pick the URLs whose raw content should be fetched in two-phase search.
+
+    Args:
+        unique_results: Dictionary of unique snippet-only search results
+        queries: Queries the search was run for
+
+    Returns:
+        URLs of the highest scoring results above the minimum score
+    """
+    scored = sorted(
+        ((score_search_result(result, queries), url) for url, result in unique_results.items()),
+        reverse=True,
+    )
+    return [url for score, url in scored[:two_phase_max_reads] if score >= two_phase_min_score]
+
+def attach_raw_content(unique_results: dict, extract_response: dict) -> dict:
+    """Add the raw content returned by Tavily extract to the matching results.
+
+    Results that were not selected, or whose extraction failed, keep only their
+    snippet and are passed through without summarization.
+    """
+    for extracted in extract_response.get("results", []):
+        url = extracted.get("url")
+        if url in unique_results and extracted.get("raw_content"):
+            unique_results[url] = {**unique_results[url], "raw_content": extracted["raw_content"]}
+    return unique_results
+
+def gather_search_results(
+    queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+) -> dict:
+    """Run searches and return unique results, fetching raw content per the search mode.
+
+    Args:
+        queries: Search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+
+    Returns:
+        Dictionary mapping URLs to unique results
+    """
+    two_phase = search_mode == "two_phase"
+    search_results = tavily_search_multiple(
+        queries,
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=not two_phase,
+    )
+    unique_results = deduplicate_search_results(search_results, queries)
+
+    if two_phase:
+        selected_urls = select_results_to_read(unique_results, queries)
+        if selected_urls:
+            try:
+                unique_results = attach_raw_content(unique_results, tavily_client.extract(urls=selected_urls))
+            except Exception as e:
+                logger.warning("Failed to fetch raw content: %s", e)
+
+    return unique_results
+
+async def agather_search_results(
+    queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+) -> dict:
+    """Run searches concurrently and return unique results, fetching raw content per the search mode.
+
+    Args:
+        queries: Search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+
+    Returns:
+        Dictionary mapping URLs to unique results
+    """
+    two_phase = search_mode == "two_phase"
+    search_results = await atavily_search_multiple(
+        queries,
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=not two_phase,
+    )
+    unique_results = deduplicate_search_results(search_results, queries)
+
+    if two_phase:
+        selected_urls = select_results_to_read(unique_results, queries)
+        if selected_urls:
+            try:
+                extract_response = await async_tavily_client.extract(urls=selected_urls)
+                unique_results = attach_raw_content(unique_results, extract_response)
+            except Exception as e:
+                logger.warning("Failed to fetch raw content: %s", e)
+
+    return unique_results
+
 # ===== RESEARCH TOOLS =====
 
-@tool(parse_docstring=True)
-def tavily_search(
+def check_batch_queries(queries: List[str]) -> None:
+    """Reject a tavily_search_batch call with no queries or more than max_batch_queries.
+
+    Raises:
+        ToolException: If the number of queries is out of range
+    """
+    if not queries:
+        raise ToolException("tavily_search_batch needs at least one query.")
+    if len(queries) > max_batch_queries:
+        raise ToolException(
+            f"tavily_search_batch accepts at most {max_batch_queries} queries, got {len(queries)}. "
+            "Split the queries across several calls."
+        )
+
+def _tavily_search(
     query: str,
     max_results: Annotated[int, InjectedToolArg] = 3,
     topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
@@ -197,25 +753,113 @@ def tavily_search(
     Returns:
         Formatted string of search results with summaries
     """
-    # Execute search for single query
-    search_results = tavily_search_multiple(
+    # Execute search for single query, deduplicated by URL to avoid processing duplicate content
+    unique_results = gather_search_results(
         [query],  # Convert single query to list for the internal function
         max_results=max_results,
         topic=topic,
-        include_raw_content=True,
     )
 
-    # Deduplicate results by URL to avoid processing duplicate content
-    unique_results = deduplicate_search_results(search_results)
-
     # Process results with summarization
     summarized_results = process_search_results(unique_results)
 
     # Format output for consumption
     return format_search_output(summarized_results)
 
-@tool(parse_docstring=True)
-def think_tool(reflection: str) -> str:
+async def _atavily_search(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+) -> str:
+    """Fetch results from Tavily search API with content summarization.
+
+    Args:
+        query: A single search query to execute
+        max_results: Maximum number of results to return
+        topic: Topic to filter results by ('general', 'news', 'finance')
+
+    Returns:
+        Formatted string of search results with summaries
+    """
+    unique_results = await agather_search_results([query], max_results=max_results, topic=topic)
+    summarized_results = await aprocess_search_results(unique_results)
+    return format_search_output(summarized_results)
+
+# Sync and async implementations behind one tool, so async callers (ainvoke)
+# get real async I/O instead of being offloaded to a thread
+tavily_search = StructuredTool.from_function(
+    func=_tavily_search,
+    coroutine=_atavily_search,
+    name="tavily_search",
+    parse_docstring=True,
+)
+
+def _tavily_search_batch(
+    queries: List[str],
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+) -> Tuple[str, Dict[str, str]]:
+    """Fetch results for several search queries at once, with content summarization.
+
+    Use this instead of several separate tavily_search calls when you want to check
+    multiple angles of a topic. Duplicate pages found by more than one query are
+    summarized once, and all results come back as a single numbered list of sources.
+
+    Args:
+        queries: List of distinct search queries to execute together (up to 5)
+        max_results: Maximum number of results to return per query
+        topic: Topic to filter results by ('general', 'news', 'finance')
+
+    Returns:
+        Formatted string of the merged search results with summaries, and (as the
+        tool's artifact) the formatted results of each query on its own
+    """
+    check_batch_queries(queries)
+    # Deduplicate across all queries before summarizing, so shared pages are summarized once
+    unique_results = gather_search_results(queries, max_results=max_results, topic=topic)
+    summarized_results = process_search_results(unique_results)
+    return (
+        format_search_output(summarized_results),
+        format_search_output_by_query(queries, unique_results, summarized_results),
+    )
+
+async def _atavily_search_batch(
+    queries: List[str],
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+) -> Tuple[str, Dict[str, str]]:
+    """Fetch results for several search queries at once, with content summarization.
+
+    Args:
+        queries: List of distinct search queries to execute together (up to 5)
+        max_results: Maximum number of results to return per query
+        topic: Topic to filter results by ('general', 'news', 'finance')
+
+    Returns:
+        Formatted string of the merged search results with summaries, and (as the
+        tool's artifact) the formatted results of each query on its own
+    """
+    check_batch_queries(queries)
+    # Queries run concurrently; results are deduplicated by URL before summarizing
+    unique_results = await agather_search_results(queries, max_results=max_results, topic=topic)
+    summarized_results = await aprocess_search_results(unique_results)
+    return (
+        format_search_output(summarized_results),
+        format_search_output_by_query(queries, unique_results, summarized_results),
+    )
+
+tavily_search_batch = StructuredTool.from_function(
+    func=_tavily_search_batch,
+    coroutine=_atavily_search_batch,
+    name="tavily_search_batch",
+    parse_docstring=True,
+    # The per-query results are returned as artifact, so callers can memoize each query on its own
+    response_format="content_and_artifact",
+    # Report an out-of-range number of queries to the model instead of failing the research loop
+    handle_tool_error=True,
+)
+
+def _think_tool(reflection: str) -> str:
     """Tool for strategic reflection on research progress and decision-making.
 
     Use this tool after each search to analyze results and plan next steps systematically.
@@ -240,3 +884,14 @@ def think_tool(reflection: str) -> str:
         Confirmation that reflection was recorded for decision-making
     """
     return f"Reflection recorded: {reflection}"
+
+async def _athink_tool(reflection: str) -> str:
+    """Record a reflection without leaving the event loop."""
+    return _think_tool(reflection)
+
+think_tool = StructuredTool.from_function(
+    func=_think_tool,
+    coroutine=_athink_tool,
+    name="think_tool",
+    parse_docstring=True,
+)
@@ -0,0 +1,40 @@
+"""Startup and Shutdown Hooks for the LangGraph Server.
+
+The LangGraph server loads this app through ``http.app`` in ``langgraph.json``
+and runs its lifespan on the event loop that serves graph runs. At startup the
+lifespan opens the pooled MCP server sessions and binds the research tools, so
+the first request after a deploy does not pay the MCP servers' cold start; at
+shutdown it closes the sessions.
+
+A failed warm-up does not stop the server: the pool keeps retrying in the
+background and the first research turn waits for it as before.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+
+from deep_research_from_scratch.research_agent_mcp import (
+    close_mcp_sessions,
+    warm_up_mcp_sessions,
+)
+
+logger = logging.getLogger(__name__)
+
+# ===== LIFESPAN =====
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Warm up the MCP sessions at startup and close them at shutdown."""
+    try:
+        await warm_up_mcp_sessions()
+        logger.info("MCP sessions are ready")
+    except Exception as e:
+        logger.warning("MCP warm-up failed, sessions will start on first use: %s", e)
+    try:
+        yield
+    finally:
+        await close_mcp_sessions()
+
+app = Starlette(lifespan=lifespan)
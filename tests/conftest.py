@@ -0,0 +1,6 @@
+import os
+
+# Modules that build model and search clients at import time need API keys set;
+# tests never call the real services
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ.setdefault("TAVILY_API_KEY", "test-key")
@@ -0,0 +1,119 @@
+import os
+import time
+
+import pytest
+
+from deep_research_from_scratch import blob_store
+from deep_research_from_scratch.blob_store import (
+    BLOB_REF_PREFIX,
+    BlobStore,
+    get_blob_store,
+    load_texts,
+    offload_text,
+)
+
+
+@pytest.fixture
+def shared_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEEP_RESEARCH_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("DEEP_RESEARCH_BLOB_DIR", raising=False)
+    monkeypatch.setattr(blob_store, "_store", None)
+    yield get_blob_store()
+    blob_store._store = None
+
+
+def blob_path(store, ref):
+    return store._path_for(ref[len(BLOB_REF_PREFIX):])
+
+
+def age(path, days):
+    timestamp = time.time() - days * 86400
+    os.utime(path, (timestamp, timestamp))
+
+
+def test_put_and_get_round_trip(tmp_path):
+    store = BlobStore(tmp_path)
+    ref = store.put("notes " * 1000)
+
+    assert ref.startswith(BLOB_REF_PREFIX)
+    assert store.put("notes " * 1000) == ref
+    assert store.get(ref) == "notes " * 1000
+    assert blob_path(store, ref).stat().st_size < 1000
+
+
+def test_reads_blobs_written_with_compression_toggled(tmp_path):
+    ref = BlobStore(tmp_path, compress=False).put("plain payload")
+    assert BlobStore(tmp_path, compress=True).get(ref) == "plain payload"
+
+
+def test_missing_blob_raises_key_error(tmp_path):
+    store = BlobStore(tmp_path)
+    ref = store.put("payload")
+    store.delete(ref)
+
+    with pytest.raises(KeyError):
+        store.get(ref)
+
+
+def test_offload_text_threshold(shared_store, monkeypatch):
+    monkeypatch.setattr(blob_store, "min_blob_size", 10)
+
+    assert offload_text("short") == "short"
+    ref = offload_text("long enough payload")
+    assert ref.startswith(BLOB_REF_PREFIX)
+    assert load_texts(["short", ref]) == ["short", "long enough payload"]
+
+
+def test_shared_store_lives_in_the_data_dir(shared_store, tmp_path):
+    assert shared_store.root == tmp_path / "blobs"
+    assert shared_store.max_age_days == blob_store.max_blob_age_days
+
+
+def test_gc_deletes_blobs_unused_past_the_age_limit(tmp_path):
+    store = BlobStore(tmp_path, max_age_days=7)
+    old, recent = store.put("old payload"), store.put("recent payload")
+    age(blob_path(store, old), 10)
+    age(blob_path(store, recent), 1)
+
+    assert store.collect_garbage() == 1
+    assert not blob_path(store, old).exists()
+    assert store.get(recent) == "recent payload"
+
+
+def test_gc_deletes_least_recently_used_blobs_beyond_the_size_limit(tmp_path):
+    store = BlobStore(tmp_path, compress=False)
+    refs = [store.put(f"payload {i}" * 10) for i in range(3)]
+    for days, ref in zip([3, 1, 2], refs):
+        age(blob_path(store, ref), days)
+    store.get(refs[0])
+
+    store.max_total_bytes = 2 * blob_path(store, refs[0]).stat().st_size
+    assert store.collect_garbage() == 1
+    assert [blob_path(store, ref).exists() for ref in refs] == [True, True, False]
+
+
+def test_gc_runs_periodically_on_put(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "gc_interval_puts", 3)
+    store = BlobStore(tmp_path, max_age_days=7)
+    stale = BlobStore(tmp_path).put("stale payload")
+    age(blob_path(store, stale), 10)
+
+    store.put("first")
+    assert not blob_path(store, stale).exists()
+
+    stale = store.put("stale again")
+    age(blob_path(store, stale), 10)
+    store.put("second")
+    assert blob_path(store, stale).exists()
+    store.put("third")
+    assert not blob_path(store, stale).exists()
+
+
+def test_store_without_limits_never_collects(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "gc_interval_puts", 1)
+    store = BlobStore(tmp_path)
+    ref = store.put("kept payload")
+    age(blob_path(store, ref), 365)
+
+    store.put("another payload")
+    assert blob_path(store, ref).exists()
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from deep_research_from_scratch import clarification_classifier
+from deep_research_from_scratch.clarification_classifier import (
+    ClarificationClassifier,
+    build_verification_message,
+    clarifying_question_message,
+    extract_features,
+    get_log_path,
+    get_weights_path,
+    load_examples,
+    log_decision,
+)
+
+DETAILED_REQUEST = [HumanMessage(
+    "Compare the total cost of ownership of heat pumps versus gas furnaces for a 2000 square foot "
+    "house in Minnesota over 15 years, including installation, energy prices since 2020, maintenance "
+    "and available federal tax credits. Present the result as a table with a short summary."
+)]
+VAGUE_REQUEST = [HumanMessage("Tell me about RAG")]
+ANSWERED_QUESTION = [
+    HumanMessage("Research coffee shops"),
+    clarifying_question_message("Which city are you interested in, and what matters most to you?"),
+    HumanMessage("San Francisco, and mostly the coffee quality and a good place to work"),
+]
+
+FIRST_REQUEST = [HumanMessage("What are the best coffee shops in San Francisco for working remotely?")]
+FOLLOW_UP = [
+    *FIRST_REQUEST,
+    AIMessage(build_verification_message(FIRST_REQUEST)),
+    HumanMessage("Now research something about the history of those neighborhoods and their cafes"),
+]
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEEP_RESEARCH_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("DEEP_RESEARCH_CLARIFICATION_LOG", raising=False)
+    monkeypatch.delenv("DEEP_RESEARCH_CLARIFICATION_WEIGHTS", raising=False)
+    return tmp_path
+
+
+def test_prior_weights_only_skip_when_confident():
+    classifier = ClarificationClassifier()
+
+    assert classifier.confident_no_clarification(ANSWERED_QUESTION)
+    assert not classifier.confident_no_clarification(VAGUE_REQUEST)
+    # A detailed first message is likely fine, but not below the skip threshold
+    assert classifier.predict(DETAILED_REQUEST) < classifier.predict(VAGUE_REQUEST)
+    assert not classifier.confident_no_clarification(DETAILED_REQUEST)
+
+
+def test_skip_threshold_is_respected(monkeypatch):
+    classifier = ClarificationClassifier()
+    probability = classifier.predict(DETAILED_REQUEST)
+
+    monkeypatch.setattr(clarification_classifier, "max_skip_probability", probability + 1e-6)
+    assert classifier.confident_no_clarification(DETAILED_REQUEST)
+    monkeypatch.setattr(clarification_classifier, "max_skip_probability", probability)
+    assert not classifier.confident_no_clarification(DETAILED_REQUEST)
+    monkeypatch.setattr(clarification_classifier, "max_skip_probability", 0.0)
+    assert not classifier.confident_no_clarification(ANSWERED_QUESTION)
+
+
+def test_heuristic_features():
+    assert "__unknown_acronym__" in extract_features(VAGUE_REQUEST)
+    assert "__words_lt_8__" in extract_features(VAGUE_REQUEST)
+    assert "__answers_question__" in extract_features(ANSWERED_QUESTION)
+    assert "__has_constraints__" in extract_features(DETAILED_REQUEST)
+
+
+def test_only_a_marked_clarifying_question_counts_as_answered():
+    unmarked = [ANSWERED_QUESTION[0], AIMessage(ANSWERED_QUESTION[1].content), ANSWERED_QUESTION[2]]
+    assert "__answers_question__" not in extract_features(unmarked)
+    assert "__answers_question__" not in extract_features(FOLLOW_UP)
+
+
+def test_follow_up_request_after_a_run_is_not_skipped():
+    classifier = ClarificationClassifier()
+    follow_up_alone = [FOLLOW_UP[-1]]
+
+    assert classifier.predict(FOLLOW_UP) == pytest.approx(classifier.predict(follow_up_alone))
+    assert not classifier.confident_no_clarification(FOLLOW_UP)
+
+
+def test_training_moves_predictions_towards_labels():
+    classifier = ClarificationClassifier()
+    features = extract_features([HumanMessage("Research the best espresso machines for a small cafe")])
+    before = classifier.predict_features(features)
+
+    classifier.train([(features, True)] * 20)
+
+    assert classifier.predict_features(features) > before
+
+
+def test_weights_round_trip(tmp_path):
+    classifier = ClarificationClassifier()
+    classifier.train([(extract_features(VAGUE_REQUEST), True)])
+    path = tmp_path / "weights.json"
+    classifier.save(path)
+
+    loaded = ClarificationClassifier.load(path)
+
+    assert loaded.predict(VAGUE_REQUEST) == pytest.approx(classifier.predict(VAGUE_REQUEST), abs=1e-4)
+    assert ClarificationClassifier.load(tmp_path / "missing.json").weights == ClarificationClassifier().weights
+
+
+def test_decisions_are_logged_in_the_data_dir(data_dir):
+    log_decision(VAGUE_REQUEST, need_clarification=True)
+    log_decision(DETAILED_REQUEST, need_clarification=False, source="classifier")
+
+    assert get_log_path().parent == data_dir
+    assert get_weights_path().parent == data_dir
+    records = [json.loads(line) for line in get_log_path().read_text().splitlines()]
+    assert [record["source"] for record in records] == ["model", "classifier"]
+    assert load_examples(get_log_path()) == [(extract_features(VAGUE_REQUEST), True)]
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from deep_research_from_scratch.document_index import (
+    DocumentIndex,
+    chunk_text,
+    tokenize,
+)
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "solar.md").write_text("Solar panels convert sunlight into electricity.\n" * 3)
+    (tmp_path / "wind.txt").write_text("Wind turbines generate power from moving air.\n")
+    (tmp_path / "image.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+def touch_later(path, text):
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The cost of the Solar panels") == ["cost", "solar", "panels"]
+
+
+def test_chunks_overlap_and_keep_line_ranges(monkeypatch):
+    monkeypatch.setattr("deep_research_from_scratch.document_index.chunk_lines", 4)
+    monkeypatch.setattr("deep_research_from_scratch.document_index.chunk_overlap_lines", 1)
+    text = "\n".join(f"line {i}" for i in range(1, 11))
+
+    assert [(start, end) for start, end, _ in chunk_text(text)] == [(1, 4), (4, 7), (7, 10)]
+
+
+def test_search_ranks_matching_passages(root):
+    index = DocumentIndex(root)
+    assert index.refresh() == 2
+
+    hits = index.search("wind power")
+    assert hits[0]["path"] == "wind.txt"
+    assert hits[0]["start_line"] == 1
+    assert "turbines" in hits[0]["text"]
+    assert index.search("submarine") == []
+
+
+def test_refresh_only_reindexes_changed_files(root):
+    index = DocumentIndex(root)
+    index.refresh()
+    assert index.refresh() == 0
+
+    touch_later(root / "wind.txt", "Tidal energy comes from ocean currents.\n")
+    assert index.refresh() == 1
+    assert index.search("turbines") == []
+    assert index.search("tidal")[0]["path"] == "wind.txt"
+
+    (root / "hydro.md").write_text("Hydro dams store water.\n")
+    (root / "solar.md").unlink()
+    assert index.refresh() == 2
+    assert index.search("solar") == []
+    assert index.search("dams")[0]["path"] == "hydro.md"
+
+
+def test_removed_files_leave_no_postings(root):
+    index = DocumentIndex(root)
+    index.refresh()
+    (root / "solar.md").unlink()
+    (root / "wind.txt").unlink()
+    index.refresh()
+
+    assert index._postings == {}
+    assert index._chunks == {}
+    assert index._total_tokens == 0
@@ -0,0 +1,94 @@
+import pytest
+from langchain_core.tools import ToolException
+
+from deep_research_from_scratch import filesystem_tools
+from deep_research_from_scratch.filesystem_tools import (
+    _read_file,
+    _read_multiple_files,
+    _search_files,
+    file_contains,
+    read_file,
+    read_text,
+    resolve_path,
+)
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    root = tmp_path / "files"
+    (root / "notes").mkdir(parents=True)
+    (root / "report.md").write_text("Solar panels convert sunlight into electricity.")
+    (root / "notes" / "wind.txt").write_text("Wind turbines generate power.")
+    (tmp_path / "secret.txt").write_text("Secret sunlight data.")
+    monkeypatch.setattr(filesystem_tools, "files_root", root)
+    return root.resolve()
+
+
+def test_relative_and_absolute_paths_inside_the_root(root):
+    assert resolve_path("report.md") == root / "report.md"
+    assert resolve_path("notes/../report.md") == root / "report.md"
+    assert resolve_path(str(root / "notes" / "wind.txt")) == root / "notes" / "wind.txt"
+    assert resolve_path(".") == root
+
+
+@pytest.mark.parametrize("path", ["..", "../secret.txt", "notes/../../secret.txt"])
+def test_parent_traversal_is_rejected(root, path):
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        resolve_path(path)
+
+
+def test_absolute_paths_outside_the_root_are_rejected(root):
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        resolve_path(str(root.parent / "secret.txt"))
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        resolve_path("/etc/passwd")
+
+
+def test_symlinks_leaving_the_root_are_rejected(root):
+    (root / "link.txt").symlink_to(root.parent / "secret.txt")
+    (root / "outside").symlink_to(root.parent, target_is_directory=True)
+    (root / "inside.txt").symlink_to(root / "report.md")
+
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        _read_file("link.txt")
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        _read_file("outside/secret.txt")
+    assert _read_file("inside.txt").startswith("Solar panels")
+
+
+def test_missing_files_are_reported(root):
+    with pytest.raises(ToolException, match="File not found"):
+        _read_file("missing.md")
+    assert "File not found" in read_file.invoke({"path": "missing.md"})
+    assert "missing.md: Error - File not found" in _read_multiple_files(["report.md", "missing.md"])
+
+
+def test_search_skips_files_outside_the_root(root):
+    (root / "link.txt").symlink_to(root.parent / "secret.txt")
+
+    assert _search_files(".", "sunlight").splitlines() == [str(root / "report.md")]
+    assert _search_files(".", "*.txt").splitlines() == [str(root / "notes" / "wind.txt")]
+    with pytest.raises(ToolException, match="outside allowed directory"):
+        _search_files("..", "secret")
+
+
+def test_read_text_decodes_memory_mapped_files_in_slices(root, monkeypatch):
+    monkeypatch.setattr(filesystem_tools, "mmap_threshold_bytes", 1)
+    monkeypatch.setattr(filesystem_tools, "read_chunk_bytes", 3)
+    path = root / "unicode.txt"
+    text = "héllo wörld ✓ naïve café\n" * 5
+    path.write_text(text, encoding="utf-8")
+    (root / "empty.txt").write_text("")
+
+    assert read_text(path) == text
+    assert read_text(root / "empty.txt") == ""
+
+
+def test_file_contains_finds_matches_across_chunks(root, monkeypatch):
+    monkeypatch.setattr(filesystem_tools, "read_chunk_bytes", 8)
+    path = root / "chunks.txt"
+    path.write_text("aaaaaaXYZbbbbbbb")
+
+    assert file_contains(path, "xyz")
+    assert file_contains(path, "axyzb")
+    assert not file_contains(path, "xyzz")
@@ -0,0 +1,72 @@
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("langchain_mcp_adapters")
+
+from langchain_mcp_adapters.client import MultiServerMCPClient  # noqa: E402
+
+from deep_research_from_scratch.mcp_session_pool import MCPSessionPool  # noqa: E402
+
+SERVER = textwrap.dedent("""
+    import sys
+
+    import anyio
+    import mcp.types as types
+    from mcp.server.lowlevel import NotificationOptions, Server
+    from mcp.server.stdio import stdio_server
+
+    server = Server("test")
+
+    @server.list_tools()
+    async def list_tools():
+        return [types.Tool(name="echo", description="Echo a text.", inputSchema={
+            "type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"],
+        })]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        return [types.TextContent(type="text", text=arguments["text"])]
+
+    async def main():
+        experimental = {"concurrency": {"maxConcurrentRequests": int(sys.argv[1])}} if len(sys.argv) > 1 else {}
+        async with stdio_server() as (read, write):
+            options = server.create_initialization_options(NotificationOptions(), experimental)
+            await server.run(read, write, options)
+
+    anyio.run(main)
+""")
+
+
+def run_pool(tmp_path, server_args):
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    client = MultiServerMCPClient({
+        "test": {"command": sys.executable, "args": [str(script), *server_args], "transport": "stdio"},
+    })
+
+    async def main():
+        pool = MCPSessionPool(client, ["test"])
+        try:
+            tools = await pool.get_tools()
+            output = await tools[0].ainvoke({"text": "hello"})
+            return pool.get_declared_limits(), output
+        finally:
+            await pool.close()
+
+    return asyncio.run(asyncio.wait_for(main(), timeout=60))
+
+
+def test_pool_reads_the_declared_concurrency_limit(tmp_path):
+    limits, output = run_pool(tmp_path, ["1"])
+
+    assert limits == {"test": 1}
+    assert "hello" in str(output)
+
+
+def test_servers_without_a_declared_limit(tmp_path):
+    limits, _ = run_pool(tmp_path, [])
+
+    assert limits == {}
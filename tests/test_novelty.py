@@ -0,0 +1,54 @@
+from deep_research_from_scratch.novelty import (
+    extract_facts,
+    extract_sources,
+    extract_urls,
+    measure_novelty,
+)
+
+FACT = "Solar panel efficiency reached record levels during recent laboratory trials."
+OTHER_FACT = "Offshore wind turbines produce steady electricity across northern coastal regions."
+
+
+def test_extract_urls_normalizes_trailing_characters_and_case():
+    text = "See https://Example.com/Page/, (https://example.com/page) and http://other.org."
+    assert extract_urls(text) == {"https://example.com/page", "http://other.org"}
+
+
+def test_extract_sources_strips_www():
+    assert extract_sources(["https://www.example.com/a", "https://example.com/b"]) == {"example.com"}
+
+
+def test_extract_facts_ignores_word_order_and_short_sentences():
+    reordered = "Record levels of solar panel efficiency reached during recent laboratory trials."
+    assert extract_facts(FACT) == extract_facts(reordered)
+    assert extract_facts("Too short to count.") == set()
+
+
+def test_repeated_findings_stop_research():
+    previous = [f"{FACT} https://example.com/solar"]
+    metrics = measure_novelty(previous, previous, scope="researcher", iteration=2)
+
+    assert metrics["new_urls"] == 0
+    assert metrics["fact_novelty"] == 0.0
+    assert metrics["stop"] is True
+
+
+def test_new_url_keeps_research_going():
+    previous = [f"{FACT} https://example.com/solar"]
+    new = [f"{FACT} https://another.org/solar"]
+    metrics = measure_novelty(new, previous, scope="researcher", iteration=2)
+
+    assert metrics["new_urls"] == 1
+    assert metrics["new_sources"] == 1
+    assert metrics["stop"] is False
+
+
+def test_new_facts_keep_research_going_without_new_urls():
+    previous = [f"{FACT} https://example.com/solar"]
+    new = [f"{FACT} {OTHER_FACT} https://example.com/solar"]
+    metrics = measure_novelty(new, previous, scope="supervisor", iteration=1)
+
+    assert metrics["new_urls"] == 0
+    assert metrics["fact_novelty"] == 0.5
+    assert metrics["total_facts"] == 2
+    assert metrics["stop"] is False
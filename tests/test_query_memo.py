@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from deep_research_from_scratch import research_agent, utils
+from deep_research_from_scratch.research_agent import REPEATED_QUERY_NOTE, tool_node
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    searched = []
+
+    def respond(queries):
+        searched.extend(queries)
+        return [
+            {"query": query, "results": [{
+                "url": f"https://example.com/{query.replace(' ', '-')}",
+                "title": query.title(),
+                "content": f"Findings about {query}.",
+            }]}
+            for query in queries
+        ]
+
+    async def asearch(queries, **kwargs):
+        return respond(queries)
+
+    monkeypatch.setattr(utils, "search_mode", "full")
+    monkeypatch.setattr(utils, "summarization_mode", "per_page")
+    monkeypatch.setattr(utils, "atavily_search_multiple", asearch)
+    return searched
+
+
+def search_call(call_id, query=None, queries=None):
+    if queries is not None:
+        return {"name": "tavily_search_batch", "args": {"queries": queries}, "id": call_id}
+    return {"name": "tavily_search", "args": {"query": query}, "id": call_id}
+
+
+def run_turn(messages, *tool_calls):
+    messages = [*messages, AIMessage(content="", tool_calls=list(tool_calls))]
+    state = {"researcher_messages": messages, "research_started_at": time.time()}
+    update = asyncio.run(tool_node(state, {}))
+    return messages + update["researcher_messages"], update["researcher_messages"]
+
+
+def test_batch_queries_are_memoized_with_their_own_results(searches):
+    messages, _ = run_turn([], search_call("1", queries=["coffee shops sf", "tea houses sf"]))
+    messages, (repeat,) = run_turn(messages, search_call("2", query="Coffee shop, SF"))
+
+    assert searches == ["coffee shops sf", "tea houses sf"]
+    assert "coffee-shops-sf" in repeat.content
+    assert "tea-houses-sf" not in repeat.content
+    assert repeat.artifact == {"Coffee shop, SF": repeat.content.removeprefix(REPEATED_QUERY_NOTE)}
+
+
+def test_repeated_notes_do_not_stack(searches):
+    messages, _ = run_turn([], search_call("1", query="coffee shops sf"))
+    messages, _ = run_turn(messages, search_call("2", query="Coffee shop, SF"))
+    messages, (third,) = run_turn(messages, search_call("3", query="coffee shops in SF"))
+
+    assert searches == ["coffee shops sf"]
+    assert third.content.count(REPEATED_QUERY_NOTE) == 1
+
+
+def test_batch_reuses_earlier_queries_and_searches_only_new_ones(searches):
+    messages, _ = run_turn([], search_call("1", query="coffee shops sf"))
+    messages, (batch,) = run_turn(messages, search_call("2", queries=["coffee shop SF", "tea houses sf"]))
+
+    assert searches == ["coffee shops sf", "tea houses sf"]
+    assert batch.content.count(REPEATED_QUERY_NOTE) == 1
+    assert set(batch.artifact) == {"coffee shop SF", "tea houses sf"}
+    assert "tea-houses-sf" not in batch.artifact["coffee shop SF"]
+
+
+def test_same_turn_repeat_resolves_to_the_matching_batch_query(searches):
+    _, (batch, single) = run_turn(
+        [],
+        search_call("1", queries=["coffee shops sf", "tea houses sf"]),
+        search_call("2", query="Coffee shop, SF"),
+    )
+
+    assert searches == ["coffee shops sf", "tea houses sf"]
+    assert "tea-houses-sf" not in single.content
+    assert single.artifact["Coffee shop, SF"] == batch.artifact["coffee shops sf"]
+
+
+def test_oversized_batch_is_rejected_without_a_memo_entry(searches, monkeypatch):
+    queries = [f"topic {i}" for i in range(research_agent.max_batch_queries + 1)]
+    _, (rejected,) = run_turn([], search_call("1", queries=queries))
+
+    assert searches == []
+    assert "at most" in rejected.content
+    assert rejected.artifact is None
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from deep_research_from_scratch import report_store
+from deep_research_from_scratch.report_store import ReportStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ReportStore(tmp_path / "reports")
+
+
+def body_count(store):
+    return sum(1 for path in store.bodies.root.rglob("*") if path.is_file())
+
+
+def test_save_and_lookup(store):
+    report_id = store.save("# Title\n\nSee https://example.com/a.", brief="Solar  panels")
+
+    record = store.get(report_id)
+    assert record["body"].startswith("# Title")
+    assert record["sources"] == ["https://example.com/a"]
+    assert store.find_by_brief("solar panels")["id"] == report_id
+    assert store.latest(include_body=False)["body"] is None
+
+
+def test_retention_keeps_the_newest_reports(store, monkeypatch):
+    monkeypatch.setattr(report_store, "max_stored_reports", 3)
+    ids = [store.save(f"report {i}") for i in range(5)]
+
+    assert store.apply_retention() == 2
+    assert [record["id"] for record in store.list_reports()] == ids[:1:-1]
+    assert store.get(ids[0]) is None
+    assert body_count(store) == 3
+
+
+def test_retention_by_age(store, monkeypatch):
+    old_id = store.save("old report")
+    monkeypatch.setattr(report_store.time, "time", lambda: 10 * 86400 + store.get(old_id)["created_at"])
+    new_id = store.save("new report")
+    monkeypatch.setattr(report_store, "max_report_age_days", 5)
+
+    assert store.apply_retention() == 1
+    assert store.get(old_id) is None
+    assert store.get(new_id)["body"] == "new report"
+
+
+def test_shared_body_survives_deleting_one_report(store):
+    first = store.save("same body")
+    second = store.save("same body")
+
+    store.delete(first)
+
+    assert store.get(second)["body"] == "same body"
+    store.delete(second)
+    assert body_count(store) == 0
+
+
+def test_save_racing_a_delete_keeps_the_shared_body(store, monkeypatch):
+    first = store.save("shared body")
+    delete_body = store.bodies.delete
+    saved = []
+    thread = threading.Thread(target=lambda: saved.append(store.save("shared body")))
+
+    def delete_while_saving(body_ref):
+        # A save of the same content starts just before the body is removed
+        thread.start()
+        thread.join(timeout=0.5)
+        delete_body(body_ref)
+
+    monkeypatch.setattr(store.bodies, "delete", delete_while_saving)
+    store.delete(first)
+    thread.join()
+
+    assert store.get(saved[0])["body"] == "shared body"
+
+
+def test_legacy_reports_are_imported_once(store, tmp_path):
+    legacy = tmp_path / "files"
+    legacy.mkdir()
+    (legacy / "report_old.md").write_text("# Old report")
+    (legacy / "coffee_shops_sf.md").write_text("# Bundled sample")
+
+    assert store.import_legacy_reports(legacy) == 1
+    (legacy / "report_new.md").write_text("# Added later")
+    assert store.import_legacy_reports(legacy) == 0
+
+    assert len(store.list_reports()) == 1
+    assert store.latest()["body"] == "# Old report"
+    assert store.latest()["created_at"] == (legacy / "report_old.md").stat().st_mtime
+
+
+def test_shared_store_lives_in_the_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEEP_RESEARCH_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("DEEP_RESEARCH_REPORT_DIR", raising=False)
+    monkeypatch.setattr(report_store, "_store", None)
+    monkeypatch.setattr(report_store, "legacy_reports_dir", tmp_path / "files")
+
+    assert report_store.get_report_store().root == tmp_path / "reports"
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from deep_research_from_scratch.single_flight import (
+    SingleFlight,
+    brief_key,
+    normalize_brief,
+)
+
+
+def test_normalize_brief_ignores_case_punctuation_and_spacing():
+    assert normalize_brief("  Compare SOLAR   vs. wind power!\n") == "compare solar vs wind power"
+    assert brief_key("Compare solar vs wind power") == brief_key("compare SOLAR vs. wind  power?")
+    assert brief_key("solar power") != brief_key("wind power")
+
+
+def test_concurrent_calls_share_one_run():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "report"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        assert flight.inflight() == 1
+
+        release.set()
+        results = await asyncio.gather(first, second)
+        return calls, results, flight.inflight()
+
+    calls, results, inflight = asyncio.run(scenario())
+    assert calls == 1
+    assert results == [("report", False), ("report", True)]
+    assert inflight == 0
+
+
+def test_finished_key_starts_fresh_and_keys_are_independent():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def work(label):
+            calls.append(label)
+            return label
+
+        first = await flight.do("a", lambda: work("a1"))
+        second = await flight.do("a", lambda: work("a2"))
+        other = await flight.do("b", lambda: work("b1"))
+        return calls, [first, second, other]
+
+    calls, results = asyncio.run(scenario())
+    assert calls == ["a1", "a2", "b1"]
+    assert results == [("a1", False), ("a2", False), ("b1", False)]
+
+
+def test_exception_is_shared_and_key_released():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("boom")
+
+        first = asyncio.ensure_future(flight.do("key", failing))
+        second = asyncio.ensure_future(flight.do("key", failing))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        return results, flight.inflight()
+
+    results, inflight = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert inflight == 0
+
+
+def test_cancelled_caller_does_not_cancel_shared_work():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == ("done", True)
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from deep_research_from_scratch.summarization_service import SummarizationService
+
+
+class FakeSummarizer:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, pages):
+        self.batches.append(list(pages))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return {url: f"summary of {content}" for url, content in pages.items()}
+
+
+def make_service(summarizer, **kwargs):
+    return SummarizationService(summarizer, **{"batch_wait_seconds": 0.01, **kwargs})
+
+
+def test_same_url_in_flight_is_summarized_once():
+    summarizer = FakeSummarizer()
+
+    async def scenario():
+        service = make_service(summarizer)
+        results = await asyncio.gather(
+            service.summarize("https://a", "page a"),
+            service.summarize("https://a", "page a"),
+        )
+        return results, service.pending()
+
+    results, pending = asyncio.run(scenario())
+    assert results == ["summary of page a", "summary of page a"]
+    assert summarizer.batches == [["https://a"]]
+    assert pending == 0
+
+
+def test_earliest_deadline_is_dispatched_first():
+    summarizer = FakeSummarizer()
+
+    async def scenario():
+        service = make_service(summarizer, batch_pages=1, concurrent_batches=1)
+        await asyncio.gather(
+            service.summarize("https://late", "late", deadline=30.0),
+            service.summarize("https://early", "early", deadline=10.0),
+            service.summarize("https://middle", "middle", deadline=20.0),
+        )
+
+    asyncio.run(scenario())
+    assert summarizer.batches == [["https://early"], ["https://middle"], ["https://late"]]
+
+
+def test_pages_are_split_into_batches_of_batch_pages():
+    summarizer = FakeSummarizer()
+
+    async def scenario():
+        service = make_service(summarizer, batch_pages=2)
+        return await asyncio.gather(*(service.summarize(f"https://{i}", f"page {i}") for i in range(5)))
+
+    results = asyncio.run(scenario())
+    assert results == [f"summary of page {i}" for i in range(5)]
+    assert [len(batch) for batch in summarizer.batches] == [2, 2, 1]
+
+
+def test_failed_batch_falls_back_to_each_page_content():
+    summarizer = FakeSummarizer(fail=True)
+    long_page = "x" * 1500
+
+    async def scenario():
+        service = make_service(summarizer)
+        return await asyncio.gather(
+            service.summarize("https://short", "short page"),
+            service.summarize("https://long", long_page),
+        ), service.pending()
+
+    results, pending = asyncio.run(scenario())
+    assert results == ["short page", "x" * 1000 + "..."]
+    assert pending == 0
+
+
+def test_missing_summary_falls_back_for_that_page_only():
+    async def summarize_some(pages):
+        return {"https://a": "summary of a"}
+
+    async def scenario():
+        service = make_service(summarize_some)
+        return await asyncio.gather(service.summarize("https://a", "page a"), service.summarize("https://b", "page b"))
+
+    assert asyncio.run(scenario()) == ["summary of a", "page b"]
+
+
+def test_scheduler_exits_when_idle_and_restarts_on_submit():
+    summarizer = FakeSummarizer()
+
+    async def scenario():
+        service = make_service(summarizer)
+        await service.summarize("https://a", "page a")
+        first_scheduler = service._scheduler
+        await asyncio.sleep(0.05)
+        assert first_scheduler.done()
+
+        assert await service.summarize("https://b", "page b") == "summary of page b"
+        assert service._scheduler is not first_scheduler
+        await asyncio.sleep(0.05)
+        return service._scheduler.done(), asyncio.all_tasks() - {asyncio.current_task()}
+
+    scheduler_done, leftover_tasks = asyncio.run(scenario())
+    assert scheduler_done
+    assert leftover_tasks == set()
+
+
+def test_cancelled_submitter_does_not_cancel_the_shared_page():
+    summarizer = FakeSummarizer()
+
+    async def scenario():
+        service = make_service(summarizer)
+        first = asyncio.ensure_future(service.summarize("https://a", "page a"))
+        second = asyncio.ensure_future(service.summarize("https://a", "page a"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "summary of page a"
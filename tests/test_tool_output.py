@@ -0,0 +1,61 @@
+import pytest
+
+from deep_research_from_scratch import blob_store, tool_output
+from deep_research_from_scratch.tool_output import (
+    cap_tool_output,
+    content_to_text,
+    paginate_output,
+)
+
+
+@pytest.fixture(autouse=True)
+def blob_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DEEP_RESEARCH_BLOB_DIR", str(tmp_path / "blobs"))
+    monkeypatch.setattr(blob_store, "_store", None)
+
+
+def test_short_output_is_returned_unchanged():
+    assert paginate_output("short", limit=1000) == "short"
+
+
+def test_pages_stay_within_limit_and_cover_the_output():
+    text = "".join(str(i % 10) for i in range(5000))
+    limit = 1000
+
+    pages, offset = [], 0
+    page = paginate_output(text, 0, limit)
+    while True:
+        assert len(page) <= limit
+        body, note = page.rsplit("\n\n[", 1)
+        pages.append(body)
+        if note.startswith("End of output"):
+            break
+        token = note.split('token="')[1].split('"')[0]
+        offset = int(note.split("offset=")[1].split(")")[0])
+        assert blob_store.get_blob_store().get(token) == text
+        page = paginate_output(text, offset, limit)
+
+    assert "".join(pages) == text
+
+
+def test_content_to_text_joins_text_blocks():
+    content = [{"type": "text", "text": "first"}, "second", {"type": "text", "text": "third", "id": "lc_1"}]
+    assert content_to_text(content) == "first\nsecond\nthird"
+    assert content_to_text([{"type": "image", "base64": "..."}]) is None
+
+
+def test_list_shaped_mcp_content_is_capped():
+    content = [{"type": "text", "text": "a" * 3000}, {"type": "text", "text": "b" * 3000}]
+
+    capped = cap_tool_output(content, limit=2000)
+
+    assert isinstance(capped, str)
+    assert len(capped) <= 2000
+    assert capped.startswith("a" * 100)
+    assert "read_output_page" in capped
+
+
+def test_small_list_content_is_left_as_is(monkeypatch):
+    monkeypatch.setattr(tool_output, "max_tool_output_chars", 100)
+    content = [{"type": "text", "text": "fits"}]
+    assert cap_tool_output(content) is content